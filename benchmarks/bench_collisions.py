@@ -0,0 +1,98 @@
+"""
+Benchmark des collisions projectiles / ennemis.
+
+Compare le test exhaustif (chaque ennemi contre chaque projectile) avec la
+grille de hachage spatial utilisée par WaveScene. Le temps par entité doit
+rester à peu près constant avec la grille (coût linéaire), alors qu'il
+grandit avec le test exhaustif (coût quadratique). L'écran garde sa taille,
+donc la densité augmente avec le nombre d'entités : les derniers paliers
+montent un peu parce que chaque cellule contient plus de candidats.
+
+Usage:
+    python benchmarks/bench_collisions.py
+"""
+import os
+import sys
+import math
+import random
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'template'))
+
+from systems import SpatialHash
+
+WIDTH, HEIGHT = 1280, 720
+HIT_RADIUS = 30
+
+
+class Body:
+    """Objet minimal avec une position."""
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def make_bodies(count, rng):
+    """Crée des objets répartis aléatoirement sur l'écran."""
+    return [Body(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT)) for _ in range(count)]
+
+
+def brute_force(enemies, projectiles):
+    """Test exhaustif O(ennemis x projectiles)."""
+    hits = 0
+    for enemy in enemies:
+        for proj in projectiles:
+            dx = proj.x - enemy.x
+            dy = proj.y - enemy.y
+            if math.sqrt(dx * dx + dy * dy) < HIT_RADIUS:
+                hits += 1
+    return hits
+
+
+def with_grid(enemies, projectiles, grid):
+    """Reconstruit la grille puis interroge les cellules voisines."""
+    grid.clear()
+    for proj in projectiles:
+        grid.insert(proj, proj.x, proj.y)
+
+    hits = 0
+    for enemy in enemies:
+        for proj in grid.query(enemy.x, enemy.y, HIT_RADIUS):
+            dx = proj.x - enemy.x
+            dy = proj.y - enemy.y
+            if math.sqrt(dx * dx + dy * dy) < HIT_RADIUS:
+                hits += 1
+    return hits
+
+
+def measure(func, *args, repeat=5):
+    """Retourne le meilleur temps d'exécution en millisecondes."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    rng = random.Random(42)
+    grid = SpatialHash(cell_size=64)
+
+    print(f"{'entités':>8} {'exhaustif (ms)':>15} {'grille (ms)':>12} {'grille µs/entité':>17}")
+    for total in (100, 200, 400, 800, 1600, 3200):
+        # Environ 1 ennemi pour 4 projectiles, comme en fin de partie
+        enemies = make_bodies(total // 5, rng)
+        projectiles = make_bodies(total - total // 5, rng)
+
+        assert brute_force(enemies, projectiles) == with_grid(enemies, projectiles, grid)
+
+        brute_ms = measure(brute_force, enemies, projectiles)
+        grid_ms = measure(with_grid, enemies, projectiles, grid)
+        per_entity = grid_ms * 1000 / total
+        print(f"{total:>8} {brute_ms:>15.2f} {grid_ms:>12.2f} {per_entity:>17.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+"""
+Benchmark du modèle ECS par archétypes contre le modèle objet.
+
+Les deux versions simulent le même tick que WaveScene : poursuite du
+joueur via le champ de flux, mouvement, durée de vie des projectiles,
+collisions continues projectiles / ennemis et séparation des ennemis.
+
+- Modèle objet : un Enemy et un Projectile (classes d'exemple du
+  template) par entité, mis à jour un par un, collisions via une grille.
+- ECS : deux archétypes (ennemis, projectiles) traités par lots par les
+  systèmes de template/ecs.
+
+Environ 1 ennemi pour 4 projectiles. Les projectiles ne sont pas retirés
+quand ils touchent, pour garder une population constante d'une mesure à
+l'autre. Le résultat est donné en entités traitées par milliseconde : à
+faible effectif, le coût fixe de chaque opération NumPy domine, d'où les
+chemins ligne par ligne des systèmes sous SMALL_BATCH. Mesuré sur
+plusieurs exécutions, l'ECS reste un peu plus lent à 10 entités (0.8x),
+fait jeu égal à 50 (0.9x à 1.0x) et gagne à partir de 200 (1.3x ; 1.3x à
+1.7x à 1000, 2.8x à 5000).
+
+Un second tableau mesure la passe d'IA seule (poursuite), à chaque tick
+pour tous les ennemis ou avec niveau de détail (systems.level_of_detail :
+un tick sur 4 pour les ennemis éloignés, sur 8 hors écran). Les ennemis
+sont répartis sur une zone deux fois plus grande que l'écran, comme une
+vague nombreuse qui arrive de l'extérieur.
+
+Usage:
+    python benchmarks/bench_ecs.py
+"""
+import os
+import sys
+import math
+import random
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'template'))
+
+from entities.enemy import Enemy
+from entities.projectile import Projectile
+from systems import CollisionSystem, SpatialHash, FlowField
+from utils import Vector2D
+from ecs import World, systems
+
+WIDTH, HEIGHT = 1280, 720
+HIT_RADIUS = 30
+MIN_DISTANCE = 60
+ENEMY_SPEED = 80
+SHOT_SPEED = 400
+DT = 1 / 60
+TICKS = 20
+
+
+class Target:
+    """Cible immobile au centre de l'écran (le joueur)."""
+
+    def __init__(self, x, y):
+        self.pos = Vector2D(x, y)
+
+
+def make_flow_field(rng):
+    """Champ de flux vers le centre de l'écran, avec quelques arbres."""
+    flow_field = FlowField(WIDTH, HEIGHT, cell_size=40)
+    for _ in range(8):
+        flow_field.block_circle(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT), 40)
+    flow_field.update(WIDTH / 2, HEIGHT / 2)
+    return flow_field
+
+
+def make_population(total, rng):
+    """Positions et angles des ennemis et projectiles (mêmes pour les deux modèles)."""
+    enemies = [(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT)) for _ in range(total // 5)]
+    shots = [(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT), rng.uniform(0, 2 * math.pi))
+             for _ in range(total - total // 5)]
+    return enemies, shots
+
+
+def build_objects(enemies, shots):
+    """Crée les objets du modèle objet."""
+    enemy_objects = []
+    for x, y in enemies:
+        enemy = Enemy(x, y)
+        enemy.behavior = 'chase'
+        enemy.speed = ENEMY_SPEED
+        enemy_objects.append(enemy)
+
+    shot_objects = []
+    for x, y, angle in shots:
+        shot = Projectile(x, y, math.cos(angle), math.sin(angle), speed=SHOT_SPEED)
+        shot.lifetime = 1000
+        shot_objects.append(shot)
+    return enemy_objects, shot_objects
+
+
+def object_tick(enemies, shots, target, flow_field, grid, separation_grid):
+    """Un tick du modèle objet."""
+    for enemy in enemies:
+        enemy.update(DT, target, flow_field)
+    for shot in shots:
+        shot.update(DT)
+    shots[:] = [shot for shot in shots if shot.alive]
+
+    grid.clear()
+    for index, shot in enumerate(shots):
+        grid.insert(index, shot.pos.x, shot.pos.y)
+
+    hits = 0
+    reach = HIT_RADIUS + SHOT_SPEED * DT
+    for enemy in enemies:
+        center = (enemy.pos.x, enemy.pos.y)
+        for index in grid.query(enemy.pos.x, enemy.pos.y, reach):
+            shot = shots[index]
+            if CollisionSystem.segment_circle(shot.prev_pos.to_tuple(), shot.pos.to_tuple(),
+                                              center, HIT_RADIUS):
+                hits += 1
+
+    CollisionSystem.separate(enemies, MIN_DISTANCE, strength=0.5, grid=separation_grid)
+    return hits
+
+
+def build_world(enemies, shots):
+    """Crée le monde ECS avec les mêmes entités."""
+    world = World()
+    for name in ('pos', 'prev_pos', 'vel'):
+        world.component(name, float, 2)
+    world.component('speed')
+    world.component('expires_at')
+    world.component('ai_elapsed')
+    world.tag('enemy')
+    world.tag('shot')
+
+    enemy_archetype = world.archetype('enemy', 'pos', 'prev_pos', 'vel', 'speed', 'ai_elapsed')
+    if enemies:
+        enemy_archetype.spawn(len(enemies), pos=enemies, prev_pos=enemies, speed=ENEMY_SPEED)
+
+    shot_archetype = world.archetype('shot', 'pos', 'prev_pos', 'vel', 'expires_at')
+    if shots:
+        positions = [(x, y) for x, y, _ in shots]
+        velocities = [(math.cos(angle) * SHOT_SPEED, math.sin(angle) * SHOT_SPEED)
+                      for _, _, angle in shots]
+        shot_archetype.spawn(len(shots), pos=positions, prev_pos=positions,
+                             vel=velocities, expires_at=1000)
+    return world, enemy_archetype, shot_archetype
+
+
+def ecs_tick(world, enemies, shots, target, flow_field, grid, separation_grid):
+    """Un tick du modèle ECS."""
+    systems.chase(enemies, target.pos.x, target.pos.y, flow_field)
+    systems.movement(world, DT)
+    systems.lifetime(world, 0.0)
+    shot_rows, _, _ = systems.swept_hits(
+        shots, enemies, HIT_RADIUS, HIT_RADIUS + SHOT_SPEED * DT, grid
+    )
+    systems.separation(enemies, MIN_DISTANCE, strength=0.5, grid=separation_grid)
+    world.flush()
+    return len(shot_rows)
+
+
+def measure(tick, repeat=3):
+    """Retourne le meilleur temps (ms) pour TICKS ticks ; tick reconstruit son état."""
+    best = float('inf')
+    for _ in range(repeat):
+        run = tick()
+        start = time.perf_counter()
+        for _ in range(TICKS):
+            run()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def ai_tick(enemies, target, flow_field, tick=None):
+    """Passe d'IA ECS (avec niveau de détail si tick est donné)."""
+    rows = None
+    if tick is not None:
+        rows, _ = systems.level_of_detail(
+            enemies, DT, tick, target.pos.x, target.pos.y, (0, 0, WIDTH, HEIGHT), 300
+        )
+    systems.chase(enemies, target.pos.x, target.pos.y, flow_field, rows)
+
+
+def bench_level_of_detail(rng, flow_field, target):
+    """Compare la passe d'IA complète et avec niveau de détail."""
+    print(f"\n{'ennemis':>8} {'IA complète (ms)':>17} {'IA LOD (ms)':>12} {'gain':>6}")
+    for count in (100, 1000, 10000):
+        enemies = [(rng.uniform(-WIDTH / 2, WIDTH * 1.5), rng.uniform(-HEIGHT / 2, HEIGHT * 1.5))
+                   for _ in range(count)]
+
+        def full_run():
+            _, enemy_archetype, _ = build_world(enemies, [])
+            return lambda: ai_tick(enemy_archetype, target, flow_field)
+
+        def lod_run():
+            _, enemy_archetype, _ = build_world(enemies, [])
+            ticks = iter(range(TICKS))
+            return lambda: ai_tick(enemy_archetype, target, flow_field, next(ticks))
+
+        full_ms = measure(full_run)
+        lod_ms = measure(lod_run)
+        print(f"{count:>8} {full_ms / TICKS:>17.3f} {lod_ms / TICKS:>12.3f} {full_ms / lod_ms:>5.1f}x")
+
+
+def main():
+    rng = random.Random(42)
+    flow_field = make_flow_field(rng)
+    target = Target(WIDTH / 2, HEIGHT / 2)
+    grid = SpatialHash(cell_size=64)
+    separation_grid = SpatialHash(cell_size=MIN_DISTANCE)
+
+    print(f"{'entités':>8} {'objets (ms)':>12} {'ECS (ms)':>9} "
+          f"{'objets ent./ms':>15} {'ECS ent./ms':>12} {'rapport':>8}")
+    for total in (10, 50, 200, 1000, 5000):
+        enemies, shots = make_population(total, rng)
+
+        def object_run():
+            enemy_objects, shot_objects = build_objects(enemies, shots)
+            return lambda: object_tick(enemy_objects, shot_objects, target, flow_field,
+                                       grid, separation_grid)
+
+        def ecs_run():
+            world, enemy_archetype, shot_archetype = build_world(enemies, shots)
+            return lambda: ecs_tick(world, enemy_archetype, shot_archetype, target, flow_field,
+                                    grid, separation_grid)
+
+        object_ms = measure(object_run)
+        ecs_ms = measure(ecs_run)
+        object_rate = total * TICKS / object_ms
+        ecs_rate = total * TICKS / ecs_ms
+        print(f"{total:>8} {object_ms:>12.2f} {ecs_ms:>9.2f} "
+              f"{object_rate:>15.0f} {ecs_rate:>12.0f} {ecs_rate / object_rate:>7.1f}x")
+
+    bench_level_of_detail(rng, flow_field, target)
+
+
+if __name__ == '__main__':
+    main()
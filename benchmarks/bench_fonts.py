@@ -0,0 +1,113 @@
+"""
+Benchmark du cache de polices de l'AssetManager.
+
+Compare le jeu actuel (AssetManager.font() mémorisé) à un mode « avant »
+où chaque appel construit une nouvelle pygame.font.Font, comme le
+faisaient les scènes dans leurs draw(). En mode « avant », le cache de
+texte, qui reconnaît une police à son identité, rate donc chaque rendu :
+c'est le coût d'origine (police + rastérisation à chaque frame).
+
+Deux mesures :
+- démarrage : création du jeu puis entrée dans chaque scène (on_enter) ;
+- par frame : temps moyen de draw() pour chaque scène affichée.
+
+Usage:
+    python benchmarks/bench_fonts.py
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(ROOT, 'game'))
+
+import pygame
+import main
+from systems import AssetManager
+from entities import text_cache
+
+FRAMES = 300
+
+# Scènes affichées, et préparation éventuelle après on_enter
+SCENES = [
+    ('menu', None),
+    ('wave_selection', None),
+    ('settings', None),
+    ('shop', None),
+    ('game_over', lambda scene: scene.set_stats(1200, 4, 80, 95.0)),
+    ('victory', lambda scene: scene.set_stats(4, 1200, 80, 95.0)),
+    ('wave1 (intro)', None),
+    ('wave1 (améliorations)', lambda scene: setattr(scene, 'show_shop_menu', True)),
+]
+
+memoized_font = AssetManager.font
+
+
+def uncached_font(self, filepath=None, size=24):
+    """AssetManager.font sans mémorisation : une police neuve à chaque appel."""
+    return pygame.font.Font(filepath, size)
+
+
+def scene_key(label):
+    """Nom de la scène dans le SceneManager."""
+    return label.split(' ')[0]
+
+
+def measure(cached):
+    """
+    Mesure le démarrage et le coût par frame.
+
+    Args:
+        cached: True pour le cache de polices, False pour le mode « avant »
+
+    Returns:
+        Tuple (démarrage en ms, dictionnaire scène -> ms par frame)
+    """
+    AssetManager.font = memoized_font if cached else uncached_font
+    text_cache.clear()
+
+    start = time.perf_counter()
+    game = main.Game(headless=True, seed=1)
+    scenes = game.scene_manager.scenes
+    for label, _ in SCENES:
+        scenes[scene_key(label)].on_enter()
+    startup = (time.perf_counter() - start) * 1000
+
+    frames = {}
+    for label, prepare in SCENES:
+        scene = scenes[scene_key(label)]
+        scene.on_enter()
+        if prepare:
+            prepare(scene)
+        scene.draw(game.screen)  # Premier rendu (cache de texte froid)
+
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            scene.draw(game.screen)
+        frames[label] = (time.perf_counter() - start) * 1000 / FRAMES
+        scene.on_exit()
+
+    pygame.quit()
+    AssetManager.font = memoized_font
+    return startup, frames
+
+
+def main_bench():
+    measure(cached=True)  # Chauffe : initialisation de SDL et des modules
+    before_startup, before = measure(cached=False)
+    after_startup, after = measure(cached=True)
+
+    print(f"{'démarrage':<24} {before_startup:>9.1f} ms {after_startup:>9.1f} ms")
+    print()
+    print(f"{'scène (draw)':<24} {'avant (ms)':>12} {'après (ms)':>12} {'gain':>6}")
+    for label, _ in SCENES:
+        gain = 1 - after[label] / before[label] if before[label] else 0
+        print(f"{label:<24} {before[label]:>12.3f} {after[label]:>12.3f} {gain:>6.0%}")
+
+
+if __name__ == '__main__':
+    main_bench()
@@ -0,0 +1,137 @@
+"""
+Benchmark mémoire et accès aux attributs des entités avec __slots__.
+
+Pour chaque classe, on compare les objets réels (avec __slots__) à des
+copies « avant » : mêmes valeurs d'attributs, mais stockées dans un
+__dict__ comme avant le passage à __slots__. Les vecteurs (pos, velocity,
+prev_pos) sont copiés de la même façon, puisqu'ils font partie de
+l'entité. La mémoire est mesurée avec tracemalloc : seuls l'objet, son
+stockage d'attributs et ses vecteurs sont comptés (les sprites, rects et
+autres valeurs sont partagés entre les deux versions).
+
+Usage:
+    python benchmarks/bench_slots.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+import importlib.util
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(ROOT, 'template'))
+
+from utils.vector import Vector2D
+from entities import Entity, Particle
+
+# Même chargement que game/main.py (game/scenes masquerait template/scenes)
+spec = importlib.util.spec_from_file_location(
+    'wave_system', os.path.join(ROOT, 'game', 'scenes', 'wave.py'))
+wave = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(wave)
+
+COUNT = 5000
+
+
+class PlainVector:
+    """Vector2D tel qu'il était avant __slots__."""
+
+
+class PlainObject:
+    """Entité dont les attributs vivent dans un __dict__."""
+
+
+def slot_names(cls):
+    """Retourne les noms déclarés dans __slots__ sur toute la hiérarchie."""
+    names = []
+    for klass in reversed(cls.__mro__):
+        for name in klass.__dict__.get('__slots__', ()):
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def copy_object(obj, slotted):
+    """
+    Copie un objet attribut par attribut.
+
+    Args:
+        obj: Objet réel (avec __slots__)
+        slotted: True pour garder la classe réelle, False pour un __dict__
+    """
+    if isinstance(obj, Vector2D):
+        new = object.__new__(Vector2D) if slotted else PlainVector()
+    else:
+        new = object.__new__(type(obj)) if slotted else PlainObject()
+
+    for name in slot_names(type(obj)):
+        if not hasattr(obj, name):
+            continue  # Attribut optionnel jamais affecté
+        value = getattr(obj, name)
+        if isinstance(value, Vector2D):
+            value = copy_object(value, slotted)
+        setattr(new, name, value)
+    return new
+
+
+def bytes_per_object(obj, slotted):
+    """Mémoire moyenne allouée par copie (en octets)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    copies = [copy_object(obj, slotted) for _ in range(COUNT)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # La liste elle-même n'est pas une entité
+    list_size = sys.getsizeof(copies)
+    return (after - before - list_size) / COUNT
+
+
+def access_ns(objects, repeat=5):
+    """Meilleur temps par accès d'attribut (lectures et écritures)."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for obj in objects:
+            if obj.alive:
+                obj.pos.x = obj.pos.x + 1
+        best = min(best, time.perf_counter() - start)
+    # 5 accès par objet : alive, pos, x (lecture), pos, x (écriture)
+    return best * 1e9 / (len(objects) * 5)
+
+
+def make_samples():
+    """Crée un objet réel de chaque classe mesurée."""
+    return [
+        ('Vector2D', Vector2D(1.5, 2.5)),
+        ('Entity', Entity(10, 20)),
+        ('Particle', Particle(10, 20, Vector2D(1, 1), (255, 200, 50), 3, 1.0)),
+        ('Decoration', wave.Decoration(10, 20)),
+        ('Player', wave.Player(10, 20)),
+    ]
+
+
+def main():
+    print(f"{'classe':<12} {'avant (o)':>10} {'après (o)':>10} {'gain':>6} "
+          f"{'accès avant (ns)':>17} {'accès après (ns)':>17}")
+
+    for name, sample in make_samples():
+        before = bytes_per_object(sample, slotted=False)
+        after = bytes_per_object(sample, slotted=True)
+        gain = 1 - after / before if before else 0
+
+        if hasattr(sample, 'alive') and hasattr(sample, 'pos'):
+            plain = [copy_object(sample, slotted=False) for _ in range(COUNT)]
+            slotted = [copy_object(sample, slotted=True) for _ in range(COUNT)]
+            access = f"{access_ns(plain):>17.1f} {access_ns(slotted):>17.1f}"
+        else:
+            access = f"{'-':>17} {'-':>17}"
+
+        print(f"{name:<12} {before:>10.0f} {after:>10.0f} {gain:>6.0%} {access}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+"""
+Équilibrage des vagues par simulations Monte-Carlo.
+
+Lance de nombreuses simulations headless de chaque vague (joueur piloté
+par un bot) pour plusieurs profils d'améliorations, en parallèle sur un
+pool de processus. Chaque processus garde son instance de Game et
+enchaîne les simulations ; le débit augmente donc avec le nombre de
+cœurs.
+
+Résultat par vague et par profil : taux de victoire, temps moyen pour
+finir la vague, dégâts reçus et graines gagnées (CSV ou JSON).
+
+Usage:
+    python3 game/balance.py --waves 1-20 --runs 20
+    python3 game/balance.py --waves 5,10,15 --profiles base,max --format json -o balance.json
+"""
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bots import BOTS
+
+
+# Profils d'améliorations (niveaux de PlayerUpgrades, 0 par défaut)
+PROFILES = {
+    'base': {},
+    'mid': {'health_level': 2, 'speed_level': 2, 'damage_level': 2, 'fire_rate_level': 2},
+    'max': {'health_level': 5, 'speed_level': 5, 'damage_level': 5, 'fire_rate_level': 5},
+    'offense': {'damage_level': 5, 'fire_rate_level': 5},
+    'defense': {'health_level': 5, 'speed_level': 5},
+}
+
+# Instance de Game propre à chaque processus du pool
+_game = None
+_upgrades = None
+
+
+def _init_worker():
+    """Crée le jeu headless une seule fois par processus."""
+    global _game, _upgrades
+    # Sans cela, SDL transforme SIGTERM / SIGINT en événement QUIT et le
+    # processus ne s'arrête pas quand le pool est interrompu
+    os.environ['SDL_NO_SIGNAL_HANDLERS'] = '1'
+    # Le message d'accueil de pygame polluerait la sortie CSV / JSON
+    os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    import main
+    _game = main.Game(headless=True)
+    _upgrades = main.wave_system_module.player_upgrades
+
+
+def simulate(job):
+    """
+    Simule une vague avec un profil d'améliorations.
+
+    Args:
+        job: Tuple (wave, profile, bot, seed, max_ticks)
+
+    Returns:
+        dict: Résultat de Game.run_headless complété du profil
+    """
+    wave, profile, bot, seed, max_ticks = job
+
+    _upgrades.reset()
+    for attr_name, level in PROFILES[profile].items():
+        setattr(_upgrades, attr_name, level)
+
+    result = _game.run_headless(wave, max_ticks, bot, seed)
+    result['profile'] = profile
+    return result
+
+
+def aggregate(results):
+    """
+    Regroupe les résultats par vague et par profil.
+
+    Args:
+        results: Liste des dicts retournés par simulate()
+
+    Returns:
+        list: Une ligne (dict) par couple (vague, profil), triée
+    """
+    groups = {}
+    for result in results:
+        groups.setdefault((result['wave'], result['profile']), []).append(result)
+
+    rows = []
+    for (wave, profile), runs in sorted(groups.items()):
+        cleared = [run for run in runs if run['outcome'] == 'victory']
+        count = len(runs)
+        rows.append({
+            'wave': wave,
+            'profile': profile,
+            'runs': count,
+            'clear_rate': len(cleared) / count,
+            'time_to_clear': (sum(run['sim_time'] for run in cleared) / len(cleared)
+                              if cleared else None),
+            'damage_taken': sum(run['damage_taken'] for run in runs) / count,
+            'seeds': sum(run['seeds_collected'] for run in runs) / count,
+            'timeouts': sum(1 for run in runs if run['outcome'] == 'timeout'),
+        })
+    return rows
+
+
+def write_rows(rows, output_format, stream):
+    """Écrit les lignes agrégées en CSV ou JSON."""
+    if output_format == 'json':
+        json.dump(rows, stream, indent=2)
+        stream.write('\n')
+        return
+
+    writer = csv.DictWriter(stream, fieldnames=list(rows[0].keys()) if rows else ['wave'])
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+
+
+def parse_waves(text):
+    """Convertit '1-5,8,10' en [1, 2, 3, 4, 5, 8, 10]."""
+    waves = []
+    for part in text.split(','):
+        if '-' in part:
+            first, last = part.split('-')
+            waves.extend(range(int(first), int(last) + 1))
+        else:
+            waves.append(int(part))
+    return waves
+
+
+def parse_args(argv=None):
+    """Analyse les options de ligne de commande."""
+    parser = argparse.ArgumentParser(description="Équilibrage des vagues (Monte-Carlo)")
+    parser.add_argument("--waves", default="1-20",
+                        help="Vagues à simuler, ex: 1-20 ou 1,5,10 (défaut: 1-20)")
+    parser.add_argument("--runs", type=int, default=10,
+                        help="Simulations par vague et par profil (défaut: 10)")
+    parser.add_argument("--profiles", default="base,mid,max",
+                        help=f"Profils d'améliorations parmi {', '.join(PROFILES)} (défaut: base,mid,max)")
+    parser.add_argument("--bot", choices=sorted(BOTS), default='circle',
+                        help="Bot qui pilote le joueur")
+    parser.add_argument("--ticks", type=int, default=36000,
+                        help="Nombre maximum de ticks par simulation (défaut: 36000)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Première graine aléatoire ; la n-ième simulation utilise seed + n")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Nombre de processus (défaut: nombre de cœurs)")
+    parser.add_argument("--format", choices=['csv', 'json'], default='csv',
+                        help="Format de sortie (défaut: csv)")
+    parser.add_argument("-o", "--output",
+                        help="Fichier de sortie (défaut: sortie standard)")
+    args = parser.parse_args(argv)
+
+    args.waves = parse_waves(args.waves)
+    args.profiles = args.profiles.split(',')
+    unknown = [name for name in args.profiles if name not in PROFILES]
+    if unknown:
+        parser.error(f"profil inconnu: {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Les mêmes graines pour chaque profil : les profils sont comparés sur
+    # les mêmes tirages aléatoires
+    jobs = [
+        (wave, profile, args.bot, args.seed + run, args.ticks)
+        for wave in args.waves
+        for profile in args.profiles
+        for run in range(args.runs)
+    ]
+
+    start = time.perf_counter()
+    pool = multiprocessing.Pool(args.workers, initializer=_init_worker)
+    results = []
+    try:
+        for result in pool.imap_unordered(simulate, jobs):
+            results.append(result)
+            print(f"\r{len(results)}/{len(jobs)} simulations", end='', file=sys.stderr)
+    except BaseException:
+        pool.terminate()
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+    elapsed = time.perf_counter() - start
+
+    total_ticks = sum(result['ticks'] for result in results)
+    print(f"\n{len(jobs)} simulations en {elapsed:.1f} s avec {args.workers} processus "
+          f"({len(jobs) / elapsed:.1f} simulations/s, {total_ticks / elapsed:.0f} ticks/s)",
+          file=sys.stderr)
+
+    rows = aggregate(results)
+    if args.output:
+        with open(args.output, 'w', newline='') as stream:
+            write_rows(rows, args.format, stream)
+    else:
+        write_rows(rows, args.format, sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
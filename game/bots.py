@@ -0,0 +1,40 @@
+"""Bots de pilotage du joueur pour le mode headless."""
+import math
+
+
+def idle_bot(game):
+    """Reste immobile au centre de l'écran."""
+    center = (game.config.window_width // 2, game.config.window_height // 2)
+
+    def script(tick):
+        return center
+
+    return script
+
+
+def circle_bot(game, radius=250, period=6.0):
+    """
+    Tourne en rond autour du centre de l'écran.
+
+    Args:
+        game: Instance du jeu
+        radius: Rayon du cercle en pixels
+        period: Durée d'un tour complet en secondes
+    """
+    center_x = game.config.window_width / 2
+    center_y = game.config.window_height / 2
+    angular_step = 2 * math.pi * game.tick_duration / period
+
+    def script(tick):
+        angle = tick * angular_step
+        return (center_x + math.cos(angle) * radius,
+                center_y + math.sin(angle) * radius * 0.6)
+
+    return script
+
+
+# Bots disponibles en ligne de commande
+BOTS = {
+    'idle': idle_bot,
+    'circle': circle_bot,
+}
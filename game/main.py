@@ -4,6 +4,8 @@ Shooter Arena Survival - Mini Jam 202
 """
 import sys
 import os
+import time
+import argparse
 import asyncio
 
 # Ajoute le dossier template au path pour importer les modules
@@ -11,8 +13,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'template'))
 
 import pygame
 
-from utils import Config
-from systems import InputHandler, AudioManager, AssetManager
+from utils import Config, RandomStreams
+from systems import InputHandler, ScriptedInput, AudioManager, AssetManager, DirtyRects
+from entities import GlyphAtlas, text_cache
 from scenes import SceneManager, GameScene, GameOverScene
 
 # Import des scènes custom - utilise importlib pour éviter les conflits
@@ -39,21 +42,50 @@ MenuScene = menu_module.MenuScene
 WaveSelectionScene = wave_selection_module.WaveSelectionScene
 SettingsScene = settings_module.SettingsScene
 WaveScene = wave_system_module.WaveScene
+RemoteWaveScene = wave_system_module.RemoteWaveScene
 GameOverScene = game_over_module.GameOverScene
 VictoryScene = victory_module.VictoryScene
 ShopScene = shop_module.ShopScene
 
+from bots import BOTS
+
 
 class Game:
     """Classe principale du jeu."""
 
-    def __init__(self):
-        """Initialise le jeu."""
+    def __init__(self, headless=False, seed=None, sim_worker=None, dirty_rects=None):
+        """
+        Initialise le jeu.
+
+        Args:
+            headless: Si True, utilise les pilotes SDL factices (aucune
+                fenêtre ni son), pour les simulations sans écran
+            seed: Graine de la partie (None pour une graine aléatoire)
+            sim_worker: Si True, les vagues sont simulées dans un processus
+                séparé (None : valeur de simulation.worker_process)
+            dirty_rects: Si True, seules les zones modifiées de l'écran sont
+                mises à jour (None : valeur de window.dirty_rects)
+        """
+        self.headless = headless
+
+        # Graine de la partie : chaque vague en dérive ses flux aléatoires
+        self.rng = RandomStreams(seed)
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
         pygame.init()
 
         # Configuration (charge depuis game/config.json)
         config_path = os.path.join(os.path.dirname(__file__), 'config.json')
         self.config = Config(config_path)
+        if sim_worker is None:
+            sim_worker = self.config.get('simulation', 'worker_process', False)
+        self.sim_worker = sim_worker
+
+        # Réglages figés lus dans la boucle principale (voir Config.snapshot)
+        self.settings = self.config.snapshot()
+        self.config.subscribe(self._on_config_changed)
 
         # Fenêtre
         self.screen = pygame.display.set_mode(
@@ -61,6 +93,11 @@ class Game:
         )
         pygame.display.set_caption(self.config.window_title)
 
+        # Rendu par zones modifiées (optionnel) : None pour l'affichage complet
+        if dirty_rects is None:
+            dirty_rects = getattr(self.settings, 'window_dirty_rects', False)
+        self.dirty_rects = DirtyRects(self.screen.get_size()) if dirty_rects else None
+
         # Horloge pour gérer les FPS
         self.clock = pygame.time.Clock()
 
@@ -83,6 +120,13 @@ class Game:
         self.paused = False
         self.selected_wave = 1  # Vague sélectionnée par défaut
 
+        # Simulation à pas fixe (indépendante du framerate d'affichage)
+        self.tick_duration = 1.0 / self.config.tick_rate
+        self.max_catchup_steps = self.config.max_catchup_steps
+        self.accumulator = 0.0
+        self.render_alpha = 1.0  # Fraction du tick écoulée, pour l'interpolation
+        self._input_consumed = True
+
         # Debug
         self.show_fps = self.config.show_fps
         self.show_hitboxes = self.config.show_hitboxes
@@ -98,11 +142,18 @@ class Game:
         self.assets.load_font('medium', None, 48)
         self.assets.load_font('small', None, 28)
 
+        # Compteur de FPS : glyphes rendus une fois, assemblés à chaque frame
+        self.fps_glyphs = GlyphAtlas(self.assets.get_font('small'), (0, 255, 0), "0123456789FPS: |Texte%")
+
         # TODO: Charger les images et sons
         # self.assets.load_image('player', 'assets/images/player.png', scale=(32, 32))
         # self.audio.load_sound('shoot', 'assets/sounds/shoot.wav')
         # self.audio.play_music('assets/sounds/music.mp3')
 
+    def _on_config_changed(self, section, key, value):
+        """Rafraîchit les réglages figés après un changement de configuration."""
+        self.settings = self.config.snapshot()
+
     def _load_keybindings(self):
         """Charge les keybindings personnalisés depuis la config."""
         if 'keybindings' in self.config.data:
@@ -118,9 +169,11 @@ class Game:
         self.scene_manager.add_scene('settings', SettingsScene(self))
 
         # Scènes de vagues (système universel)
-        # On crée des instances pour les 20 vagues
+        # On crée des instances pour les 20 vagues, simulées ici ou dans
+        # un processus séparé
+        wave_scene = RemoteWaveScene if self.sim_worker else WaveScene
         for i in range(1, 21):
-            self.scene_manager.add_scene(f'wave{i}', WaveScene(self, wave_number=i))
+            self.scene_manager.add_scene(f'wave{i}', wave_scene(self, wave_number=i))
 
         # Scènes de fin de jeu
         self.scene_manager.add_scene('game_over', GameOverScene(self))
@@ -149,8 +202,8 @@ class Game:
                 elif event.key == pygame.K_F4:
                     self.show_hitboxes = not self.show_hitboxes
 
-        # Met à jour l'input handler
-        self.input.update(events)
+        # Met à jour l'input handler (garde les "just pressed" si aucun tick ne les a lus)
+        self.input.update(events, reset=self._input_consumed)
 
         # Passe les événements à la scène courante
         self.scene_manager.handle_events(events)
@@ -167,6 +220,14 @@ class Game:
 
     def draw(self):
         """Dessine le jeu."""
+        if self.dirty_rects is not None:
+            # Seules les zones modifiées sont envoyées à l'écran
+            self.scene_manager.draw_dirty(self.screen, self.dirty_rects)
+            if self.show_fps:
+                self.dirty_rects.add(self._draw_fps())
+            self.dirty_rects.present()
+            return
+
         # Dessine la scène courante
         self.scene_manager.draw(self.screen)
 
@@ -178,21 +239,102 @@ class Game:
         pygame.display.flip()
 
     def _draw_fps(self):
-        """Affiche le compteur de FPS."""
-        font = pygame.font.Font(None, 28)
+        """Affiche les FPS et le taux de succès du cache de texte ; retourne la zone dessinée."""
         fps = int(self.clock.get_fps())
-        fps_text = font.render(f"FPS: {fps}", True, (0, 255, 0))
-        self.screen.blit(fps_text, (10, 10))
+        text_hits = int(text_cache.hit_rate() * 100)
+        return self.fps_glyphs.draw(self.screen, f"FPS: {fps} | Texte: {text_hits}%", (10, 10))
+
+    def step(self, frame_time):
+        """
+        Avance la simulation par pas fixes pour le temps écoulé.
+
+        Le temps réel s'accumule et la simulation consomme des ticks de
+        durée fixe. Le nombre de ticks rattrapés par frame est borné : après
+        un gros ralentissement, le retard excédentaire est abandonné plutôt
+        que de faire exploser le coût des frames suivantes.
+
+        Args:
+            frame_time: Temps réel écoulé depuis la frame précédente (secondes)
+        """
+        self.accumulator += frame_time
+
+        steps = 0
+        while self.accumulator >= self.tick_duration and steps < self.max_catchup_steps:
+            self.update(self.tick_duration)
+            self.accumulator -= self.tick_duration
+            steps += 1
+
+        if steps == self.max_catchup_steps:
+            self.accumulator = min(self.accumulator, self.tick_duration)
+
+        self._input_consumed = steps > 0
+        self.render_alpha = self.accumulator / self.tick_duration
+
+    def run_headless(self, wave_number, max_ticks, bot='circle', seed=None):
+        """
+        Simule une vague aussi vite que possible, sans aucun rendu.
+
+        Le joueur est piloté par un bot (entrées synthétiques) et la
+        simulation avance par ticks fixes jusqu'à la fin de la vague ou
+        jusqu'à max_ticks.
+
+        Args:
+            wave_number: Numéro de la vague à simuler
+            max_ticks: Nombre maximum de ticks de simulation
+            bot: Nom du bot dans BOTS
+            seed: Graine de la simulation (None pour une graine aléatoire) ;
+                la même graine rejoue exactement la même vague
+
+        Returns:
+            dict: Résultat de la simulation et ticks par seconde
+        """
+        self.rng.reseed(seed)
+        self.input = ScriptedInput(BOTS[bot](self))
+
+        scene_name = f'wave{wave_number}'
+        self.scene_manager.change_scene(scene_name)
+
+        ticks = 0
+        start = time.perf_counter()
+        while ticks < max_ticks:
+            self.input.update([])
+            self.update(self.tick_duration)
+            ticks += 1
+
+            # La vague demande un changement de scène : victoire ou défaite
+            if self.scene_manager.next_scene:
+                break
+        elapsed = time.perf_counter() - start
+
+        scene = self.scene_manager.scenes[scene_name]
+        outcome = self.scene_manager.next_scene or 'timeout'
+        return {
+            'wave': wave_number,
+            'bot': bot,
+            'seed': self.rng.seed,
+            'outcome': outcome,
+            'ticks': ticks,
+            'sim_time': ticks * self.tick_duration,
+            'elapsed': elapsed,
+            'ticks_per_second': ticks / elapsed if elapsed > 0 else 0.0,
+            'score': scene.score,
+            'enemies_killed': scene.enemies_killed,
+            'seeds_collected': scene.seeds_collected,
+            'health': scene.player.health,
+            'damage_taken': scene.player.max_health - scene.player.health,
+            'pools': scene.pool_stats(),
+            'state_hash': scene.state_hash(),
+        }
 
     async def run(self):
         """Boucle principale du jeu (async pour pygbag)."""
         while self.running:
-            # Delta time en secondes
-            dt = self.clock.tick(self.config.fps) / 1000.0
+            # Temps réel écoulé en secondes
+            frame_time = self.clock.tick(self.settings.window_fps) / 1000.0
 
             # Game loop
             self.handle_events()
-            self.update(dt)
+            self.step(frame_time)
             self.draw()
 
             # Requis pour pygbag (compatibilité web)
@@ -211,11 +353,59 @@ class Game:
         sys.exit()
 
 
-async def main():
-    """Point d'entrée du programme."""
-    game = Game()
+async def main(sim_worker=None, dirty_rects=None):
+    """
+    Point d'entrée du programme.
+
+    Args:
+        sim_worker, dirty_rects: Voir Game
+    """
+    game = Game(sim_worker=sim_worker, dirty_rects=dirty_rects)
     await game.run()
 
 
+def parse_args(argv=None):
+    """Analyse les options de ligne de commande."""
+    parser = argparse.ArgumentParser(description="Ridiculously Overpowered")
+    parser.add_argument("--headless", action="store_true",
+                        help="Simule une vague sans fenêtre et affiche les ticks/s")
+    parser.add_argument("--wave", type=int, default=1,
+                        help="Vague à simuler en mode headless")
+    parser.add_argument("--ticks", type=int, default=36000,
+                        help="Nombre maximum de ticks en mode headless")
+    parser.add_argument("--bot", choices=sorted(BOTS), default='circle',
+                        help="Bot qui pilote le joueur en mode headless")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Graine de la partie (rejoue une simulation à l'identique)")
+    parser.add_argument("--sim-worker", action="store_true", default=None,
+                        help="Simule les vagues dans un processus séparé (multicœur)")
+    parser.add_argument("--dirty-rects", action="store_true", default=None,
+                        help="Ne met à jour que les zones modifiées de l'écran")
+    # parse_known_args : pygbag peut passer ses propres arguments
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
+def run_headless(args):
+    """Lance une simulation headless et affiche le résultat."""
+    game = Game(headless=True)
+    result = game.run_headless(args.wave, args.ticks, args.bot, args.seed)
+    pygame.quit()
+
+    print(f"Vague {result['wave']} ({result['bot']}): {result['outcome']}")
+    print(f"  Graine: {result['seed']} | Empreinte: {result['state_hash'][:16]}")
+    print(f"  Ticks: {result['ticks']} ({result['sim_time']:.1f} s simulées en {result['elapsed']:.2f} s)")
+    print(f"  Ticks/s: {result['ticks_per_second']:.0f}")
+    print(f"  Score: {result['score']} | Ennemis: {result['enemies_killed']} | "
+          f"Graines: {result['seeds_collected']} | Vie: {result['health']}")
+    for name, stats in result['pools'].items():
+        print(f"  Pool {name}: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['dropped']} ignorées, pic {stats['high_water']}")
+
+
 if __name__ == '__main__':
-    asyncio.run(main())
+    cli_args = parse_args()
+    if cli_args.headless:
+        run_headless(cli_args)
+    else:
+        asyncio.run(main(cli_args.sim_worker, cli_args.dirty_rects))
@@ -9,6 +9,7 @@ if template_path not in sys.path:
 
 import pygame
 from scenes.scene_manager import Scene
+from entities import text_cache
 
 
 class GameOverScene(Scene):
@@ -64,27 +65,27 @@ class GameOverScene(Scene):
         screen.fill((60, 20, 20))
 
         # Overlay sombre pour effet dramatique
-        overlay = pygame.Surface((self.game.config.window_width, self.game.config.window_height))
+        overlay = pygame.Surface((self.settings.window_width, self.settings.window_height))
         overlay.set_alpha(100)
         overlay.fill((0, 0, 0))
         screen.blit(overlay, (0, 0))
 
         # Polices
-        font_title = pygame.font.Font(None, 120)
-        font_big = pygame.font.Font(None, 64)
-        font_medium = pygame.font.Font(None, 48)
-        font_small = pygame.font.Font(None, 36)
+        font_title = self.game.assets.font(None, 120)
+        font_big = self.game.assets.font(None, 64)
+        font_medium = self.game.assets.font(None, 48)
+        font_small = self.game.assets.font(None, 36)
 
-        center_x = self.game.config.window_width // 2
+        center_x = self.settings.window_width // 2
 
         # GAME OVER avec effet d'ombre
         title_text = "GAME OVER"
         # Ombre
-        title_shadow = font_title.render(title_text, True, (0, 0, 0))
+        title_shadow = text_cache.render(font_title, title_text, True, (0, 0, 0))
         title_shadow_rect = title_shadow.get_rect(center=(center_x + 4, 124))
         screen.blit(title_shadow, title_shadow_rect)
         # Texte principal
-        title = font_title.render(title_text, True, (255, 80, 80))
+        title = text_cache.render(font_title, title_text, True, (255, 80, 80))
         title_rect = title.get_rect(center=(center_x, 120))
         screen.blit(title, title_rect)
 
@@ -96,7 +97,7 @@ class GameOverScene(Scene):
 
         # Vague atteinte
         wave_text = f"Vague atteinte: {self.wave_reached}"
-        wave_surface = font_big.render(wave_text, True, (255, 200, 100))
+        wave_surface = text_cache.render(font_big, wave_text, True, (255, 200, 100))
         wave_rect = wave_surface.get_rect(center=(center_x, stats_y))
         screen.blit(wave_surface, wave_rect)
 
@@ -104,7 +105,7 @@ class GameOverScene(Scene):
 
         # Score
         score_text = f"Score: {self.score}"
-        score_surface = font_medium.render(score_text, True, (255, 255, 255))
+        score_surface = text_cache.render(font_medium, score_text, True, (255, 255, 255))
         score_rect = score_surface.get_rect(center=(center_x, stats_y))
         screen.blit(score_surface, score_rect)
 
@@ -112,7 +113,7 @@ class GameOverScene(Scene):
 
         # Ennemis tués
         enemies_text = f"Ennemis \u00e9limin\u00e9s: {self.enemies_killed}"
-        enemies_surface = font_medium.render(enemies_text, True, (200, 200, 200))
+        enemies_surface = text_cache.render(font_medium, enemies_text, True, (200, 200, 200))
         enemies_rect = enemies_surface.get_rect(center=(center_x, stats_y))
         screen.blit(enemies_surface, enemies_rect)
 
@@ -122,7 +123,7 @@ class GameOverScene(Scene):
         minutes = int(self.time_survived // 60)
         seconds = int(self.time_survived % 60)
         time_text = f"Temps: {minutes:02d}:{seconds:02d}"
-        time_surface = font_medium.render(time_text, True, (200, 200, 200))
+        time_surface = text_cache.render(font_medium, time_text, True, (200, 200, 200))
         time_rect = time_surface.get_rect(center=(center_x, stats_y))
         screen.blit(time_surface, time_rect)
 
@@ -132,19 +133,19 @@ class GameOverScene(Scene):
         if self.current_delay > 0:
             # Message de délai
             wait_text = "..."
-            wait_surface = font_small.render(wait_text, True, (150, 150, 150))
+            wait_surface = text_cache.render(font_small, wait_text, True, (150, 150, 150))
             wait_rect = wait_surface.get_rect(center=(center_x, instructions_y))
             screen.blit(wait_surface, wait_rect)
         else:
             # Instructions normales
             inst1 = f"SPACE: Réessayer (Vague {self.wave_reached})"
-            inst1_surface = font_small.render(inst1, True, (150, 255, 150))
+            inst1_surface = text_cache.render(font_small, inst1, True, (150, 255, 150))
             inst1_rect = inst1_surface.get_rect(center=(center_x, instructions_y))
             screen.blit(inst1_surface, inst1_rect)
 
             instructions_y += 45
 
             inst2 = "S: S\u00e9lection de vague  |  M: Menu  |  ESC: Quitter"
-            inst2_surface = font_small.render(inst2, True, (180, 180, 180))
+            inst2_surface = text_cache.render(font_small, inst2, True, (180, 180, 180))
             inst2_rect = inst2_surface.get_rect(center=(center_x, instructions_y))
             screen.blit(inst2_surface, inst2_rect)
@@ -30,14 +30,14 @@ class MenuScene(Scene):
         font_medium = self.game.assets.get_font('medium')
 
         if not font_large:
-            font_large = pygame.font.Font(None, 72)
+            font_large = self.game.assets.font(None, 72)
         if not font_medium:
-            font_medium = pygame.font.Font(None, 48)
+            font_medium = self.game.assets.font(None, 48)
 
         # Titre - Couleur pastel pêche/corail
         self.title = Text(
             "RIDICULOUSLY OVERPOWERED",
-            self.game.config.window_width // 2,
+            self.settings.window_width // 2,
             100,
             font_large,
             (255, 179, 186),  # Rose pastel
@@ -45,10 +45,10 @@ class MenuScene(Scene):
         )
 
         # Sous-titre
-        font_small = pygame.font.Font(None, 32)
+        font_small = self.game.assets.font(None, 32)
         self.subtitle = Text(
             "Navet vs Poubelles & Ratons Laveurs",
-            self.game.config.window_width // 2,
+            self.settings.window_width // 2,
             170,
             font_small,
             (200, 220, 230),  # Bleu pastel très clair
@@ -58,7 +58,7 @@ class MenuScene(Scene):
         # Boutons avec couleurs pastel
         button_width = 350
         button_height = 70
-        button_x = (self.game.config.window_width - button_width) // 2
+        button_x = (self.settings.window_width - button_width) // 2
         start_y = 280
 
         # Bouton jouer - Vert pastel (navet)
@@ -142,7 +142,7 @@ class MenuScene(Scene):
             # Cercles rose pastel
             color = (255 - i * 10, 200 - i * 5, 210 - i * 5)
             pygame.draw.circle(screen, color,
-                             (self.game.config.window_width // 2, 100),
+                             (self.settings.window_width // 2, 100),
                              200 + i * 30, 2)
 
         self.title.draw(screen)
@@ -154,11 +154,11 @@ class MenuScene(Scene):
         self.quit_button.draw(screen)
 
         # Instructions en bas - couleur pastel
-        font_small = pygame.font.Font(None, 20)
+        font_small = self.game.assets.font(None, 20)
         instructions = Text(
             "Un navet contre des ratons laveurs et des poubelles - Collecte des gems pour level up!",
-            self.game.config.window_width // 2,
-            self.game.config.window_height - 30,
+            self.settings.window_width // 2,
+            self.settings.window_height - 30,
             font_small,
             (150, 150, 170),  # Gris-bleu pastel
             center=True
@@ -74,16 +74,16 @@ class SettingsScene(Scene):
         font_small = self.game.assets.get_font('small')
 
         if not font_large:
-            font_large = pygame.font.Font(None, 72)
+            font_large = self.game.assets.font(None, 72)
         if not font_medium:
-            font_medium = pygame.font.Font(None, 42)
+            font_medium = self.game.assets.font(None, 42)
         if not font_small:
-            font_small = pygame.font.Font(None, 28)
+            font_small = self.game.assets.font(None, 28)
 
         # Titre - Rose pastel
         self.title = Text(
             "PARAMETRES",
-            self.game.config.window_width // 2,
+            self.settings.window_width // 2,
             70,
             font_large,
             (255, 179, 186),  # Rose pastel
@@ -93,14 +93,14 @@ class SettingsScene(Scene):
         # Section Audio - Bleu pastel
         self.audio_title = Text(
             "Audio",
-            self.game.config.window_width // 2,
+            self.settings.window_width // 2,
             170,
             font_medium,
             (180, 210, 255),  # Bleu pastel
             center=True
         )
 
-        slider_x = self.game.config.window_width // 2 - 150
+        slider_x = self.settings.window_width // 2 - 150
         slider_width = 300
         slider_height = 25
 
@@ -134,7 +134,7 @@ class SettingsScene(Scene):
         # Section Gameplay - Violet pastel
         self.gameplay_title = Text(
             "Gameplay",
-            self.game.config.window_width // 2,
+            self.settings.window_width // 2,
             360,
             font_medium,
             (200, 180, 220),  # Violet pastel
@@ -161,8 +161,8 @@ class SettingsScene(Scene):
 
         # Bouton retour - Gris pastel
         self.back_button = Button(
-            (self.game.config.window_width - 300) // 2,
-            self.game.config.window_height - 100,
+            (self.settings.window_width - 300) // 2,
+            self.settings.window_height - 100,
             300, 60,
             "RETOUR AU MENU", font_medium,
             color=(200, 200, 210),  # Gris pastel
@@ -221,7 +221,7 @@ class SettingsScene(Scene):
         self.sfx_slider.draw(screen)
 
         # Affiche les pourcentages
-        font_small = pygame.font.Font(None, 24)
+        font_small = self.game.assets.font(None, 24)
         music_percent = Text(
             f"{int(self.music_slider.value * 100)}%",
             self.music_slider.rect.x + self.music_slider.rect.width + 30,
@@ -249,11 +249,11 @@ class SettingsScene(Scene):
         self.back_button.draw(screen)
 
         # Instructions
-        font_tiny = pygame.font.Font(None, 18)
+        font_tiny = self.game.assets.font(None, 18)
         instructions = Text(
             "F3 pour toggle FPS | F4 pour toggle Hitboxes",
-            self.game.config.window_width // 2,
-            self.game.config.window_height - 30,
+            self.settings.window_width // 2,
+            self.settings.window_height - 30,
             font_tiny,
             (120, 120, 120),
             center=True
@@ -9,6 +9,7 @@ if template_path not in sys.path:
 
 import pygame
 from scenes.scene_manager import Scene
+from entities import text_cache
 
 
 class ShopScene(Scene):
@@ -135,15 +136,15 @@ class ShopScene(Scene):
         screen.fill((30, 40, 50))
 
         # Polices
-        font_title = pygame.font.Font(None, 80)
-        font_big = pygame.font.Font(None, 48)
-        font_medium = pygame.font.Font(None, 36)
-        font_small = pygame.font.Font(None, 28)
+        font_title = self.game.assets.font(None, 80)
+        font_big = self.game.assets.font(None, 48)
+        font_medium = self.game.assets.font(None, 36)
+        font_small = self.game.assets.font(None, 28)
 
-        center_x = self.game.config.window_width // 2
+        center_x = self.settings.window_width // 2
 
         # Titre
-        title = font_title.render("SHOP", True, (255, 220, 100))
+        title = text_cache.render(font_title, "SHOP", True, (255, 220, 100))
         title_rect = title.get_rect(center=(center_x, 60))
         screen.blit(title, title_rect)
 
@@ -152,11 +153,11 @@ class ShopScene(Scene):
         if self.seed_image:
             screen.blit(self.seed_image, (center_x - 80, seeds_y - 15))
         seeds_text = f"x {self.upgrades.seeds if self.upgrades else 0}"
-        seeds_surface = font_big.render(seeds_text, True, (255, 220, 100))
+        seeds_surface = text_cache.render(font_big, seeds_text, True, (255, 220, 100))
         screen.blit(seeds_surface, (center_x - 30, seeds_y))
 
         # Ligne de séparation
-        pygame.draw.line(screen, (100, 100, 100), (100, 180), (self.game.config.window_width - 100, 180), 2)
+        pygame.draw.line(screen, (100, 100, 100), (100, 180), (self.settings.window_width - 100, 180), 2)
 
         # Affiche les améliorations
         start_y = 220
@@ -172,7 +173,7 @@ class ShopScene(Scene):
 
             # Fond de l'item (rectangle)
             bg_color = (60, 70, 80) if is_selected else (40, 50, 60)
-            box_rect = pygame.Rect(150, y - 10, self.game.config.window_width - 300, item_height - 20)
+            box_rect = pygame.Rect(150, y - 10, self.settings.window_width - 300, item_height - 20)
             pygame.draw.rect(screen, bg_color, box_rect, border_radius=10)
 
             # Bordure si sélectionné
@@ -181,16 +182,16 @@ class ShopScene(Scene):
 
             # Nom de l'amélioration
             name_color = item['color'] if can_afford or is_maxed else (150, 150, 150)
-            name_surface = font_big.render(item['name'], True, name_color)
+            name_surface = text_cache.render(font_big, item['name'], True, name_color)
             screen.blit(name_surface, (180, y))
 
             # Description
-            desc_surface = font_small.render(item['description'], True, (180, 180, 180))
+            desc_surface = text_cache.render(font_small, item['description'], True, (180, 180, 180))
             screen.blit(desc_surface, (180, y + 40))
 
             # Niveau actuel (barres)
             max_level = self.upgrades.max_level if self.upgrades else 5
-            bar_x = self.game.config.window_width - 350
+            bar_x = self.settings.window_width - 350
             for lvl in range(max_level):
                 bar_rect = pygame.Rect(bar_x + lvl * 25, y + 10, 20, 30)
                 if lvl < level:
@@ -199,7 +200,7 @@ class ShopScene(Scene):
                     pygame.draw.rect(screen, (80, 80, 80), bar_rect, border_radius=3)
 
             # Coût
-            cost_x = self.game.config.window_width - 200
+            cost_x = self.settings.window_width - 200
             if is_maxed:
                 cost_text = "MAX"
                 cost_color = (100, 255, 100)
@@ -207,7 +208,7 @@ class ShopScene(Scene):
                 cost_text = f"{cost}"
                 cost_color = (255, 220, 100) if can_afford else (255, 100, 100)
 
-            cost_surface = font_medium.render(cost_text, True, cost_color)
+            cost_surface = text_cache.render(font_medium, cost_text, True, cost_color)
             screen.blit(cost_surface, (cost_x + 40, y + 15))
 
             # Petite icône de graine à côté du coût
@@ -216,10 +217,10 @@ class ShopScene(Scene):
                 screen.blit(small_seed, (cost_x + 10, y + 15))
 
         # Instructions en bas
-        instructions_y = self.game.config.window_height - 80
+        instructions_y = self.settings.window_height - 80
 
         inst1 = "HAUT/BAS: Naviguer  |  SPACE: Acheter  |  C/ESC: Continuer"
-        inst1_surface = font_medium.render(inst1, True, (150, 150, 150))
+        inst1_surface = text_cache.render(font_medium, inst1, True, (150, 150, 150))
         inst1_rect = inst1_surface.get_rect(center=(center_x, instructions_y))
         screen.blit(inst1_surface, inst1_rect)
 
@@ -227,6 +228,6 @@ class ShopScene(Scene):
             inst2 = f"Prochaine vague: {self.next_wave}"
         else:
             inst2 = "Toutes les vagues terminees!"
-        inst2_surface = font_small.render(inst2, True, (100, 200, 100))
+        inst2_surface = text_cache.render(font_small, inst2, True, (100, 200, 100))
         inst2_rect = inst2_surface.get_rect(center=(center_x, instructions_y + 35))
         screen.blit(inst2_surface, inst2_rect)
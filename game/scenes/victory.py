@@ -9,6 +9,7 @@ if template_path not in sys.path:
 
 import pygame
 from scenes.scene_manager import Scene
+from entities import text_cache
 
 
 class VictoryScene(Scene):
@@ -67,33 +68,33 @@ class VictoryScene(Scene):
         screen.fill((20, 60, 30))
 
         # Overlay pour effet
-        overlay = pygame.Surface((self.game.config.window_width, self.game.config.window_height))
+        overlay = pygame.Surface((self.settings.window_width, self.settings.window_height))
         overlay.set_alpha(80)
         overlay.fill((0, 0, 0))
         screen.blit(overlay, (0, 0))
 
         # Polices
-        font_title = pygame.font.Font(None, 120)
-        font_big = pygame.font.Font(None, 72)
-        font_medium = pygame.font.Font(None, 48)
-        font_small = pygame.font.Font(None, 36)
+        font_title = self.game.assets.font(None, 120)
+        font_big = self.game.assets.font(None, 72)
+        font_medium = self.game.assets.font(None, 48)
+        font_small = self.game.assets.font(None, 36)
 
-        center_x = self.game.config.window_width // 2
+        center_x = self.settings.window_width // 2
 
         # VICTOIRE avec effet d'ombre
         title_text = "BRAVO !"
         # Ombre
-        title_shadow = font_title.render(title_text, True, (0, 0, 0))
+        title_shadow = text_cache.render(font_title, title_text, True, (0, 0, 0))
         title_shadow_rect = title_shadow.get_rect(center=(center_x + 4, 104))
         screen.blit(title_shadow, title_shadow_rect)
         # Texte principal
-        title = font_title.render(title_text, True, (100, 255, 100))
+        title = text_cache.render(font_title, title_text, True, (100, 255, 100))
         title_rect = title.get_rect(center=(center_x, 100))
         screen.blit(title, title_rect)
 
         # Vague terminée
         wave_text = f"Vague {self.wave_number} termin\u00e9e !"
-        wave_surface = font_big.render(wave_text, True, (255, 220, 100))
+        wave_surface = text_cache.render(font_big, wave_text, True, (255, 220, 100))
         wave_rect = wave_surface.get_rect(center=(center_x, 220))
         screen.blit(wave_surface, wave_rect)
 
@@ -105,7 +106,7 @@ class VictoryScene(Scene):
 
         # Score
         score_text = f"Score: {self.score}"
-        score_surface = font_medium.render(score_text, True, (255, 255, 255))
+        score_surface = text_cache.render(font_medium, score_text, True, (255, 255, 255))
         score_rect = score_surface.get_rect(center=(center_x, stats_y))
         screen.blit(score_surface, score_rect)
 
@@ -113,7 +114,7 @@ class VictoryScene(Scene):
 
         # Ennemis tués
         enemies_text = f"Ennemis \u00e9limin\u00e9s: {self.enemies_killed}"
-        enemies_surface = font_medium.render(enemies_text, True, (200, 200, 200))
+        enemies_surface = text_cache.render(font_medium, enemies_text, True, (200, 200, 200))
         enemies_rect = enemies_surface.get_rect(center=(center_x, stats_y))
         screen.blit(enemies_surface, enemies_rect)
 
@@ -123,7 +124,7 @@ class VictoryScene(Scene):
         minutes = int(self.time_taken // 60)
         seconds = int(self.time_taken % 60)
         time_text = f"Temps: {minutes:02d}:{seconds:02d}"
-        time_surface = font_medium.render(time_text, True, (200, 200, 200))
+        time_surface = text_cache.render(font_medium, time_text, True, (200, 200, 200))
         time_rect = time_surface.get_rect(center=(center_x, stats_y))
         screen.blit(time_surface, time_rect)
 
@@ -133,33 +134,33 @@ class VictoryScene(Scene):
         if self.current_delay > 0:
             # Message de délai
             wait_text = "..."
-            wait_surface = font_small.render(wait_text, True, (150, 150, 150))
+            wait_surface = text_cache.render(font_small, wait_text, True, (150, 150, 150))
             wait_rect = wait_surface.get_rect(center=(center_x, instructions_y))
             screen.blit(wait_surface, wait_rect)
         else:
             # Vérifier s'il y a une prochaine vague
             if self.wave_number < 20:
                 inst1 = f"SPACE: Vague {self.wave_number + 1}"
-                inst1_surface = font_medium.render(inst1, True, (150, 255, 150))
+                inst1_surface = text_cache.render(font_medium, inst1, True, (150, 255, 150))
                 inst1_rect = inst1_surface.get_rect(center=(center_x, instructions_y))
                 screen.blit(inst1_surface, inst1_rect)
 
                 instructions_y += 50
 
                 inst2 = "S: S\u00e9lection de vague  |  M: Menu  |  ESC: Quitter"
-                inst2_surface = font_small.render(inst2, True, (180, 180, 180))
+                inst2_surface = text_cache.render(font_small, inst2, True, (180, 180, 180))
                 inst2_rect = inst2_surface.get_rect(center=(center_x, instructions_y))
                 screen.blit(inst2_surface, inst2_rect)
             else:
                 # Toutes les vagues terminées!
                 complete_text = "TOUTES LES VAGUES TERMIN\u00c9ES !"
-                complete_surface = font_big.render(complete_text, True, (255, 220, 50))
+                complete_surface = text_cache.render(font_big, complete_text, True, (255, 220, 50))
                 complete_rect = complete_surface.get_rect(center=(center_x, instructions_y))
                 screen.blit(complete_surface, complete_rect)
 
                 instructions_y += 60
 
                 inst = "SPACE: Retour au menu"
-                inst_surface = font_small.render(inst, True, (180, 180, 180))
+                inst_surface = text_cache.render(font_small, inst, True, (180, 180, 180))
                 inst_rect = inst_surface.get_rect(center=(center_x, instructions_y))
                 screen.blit(inst_surface, inst_rect)
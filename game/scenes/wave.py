@@ -1,18 +1,23 @@
 """Système de vagues universel."""
 import sys
 import os
-import random
 import math
+import time
+import hashlib
 
 # Ajoute le dossier template au path
 template_path = os.path.join(os.path.dirname(__file__), '..', '..', 'template')
 if template_path not in sys.path:
     sys.path.insert(0, template_path)
 
+import numpy as np
 import pygame
 from scenes.scene_manager import Scene
-from entities import Entity, ParticleSystem
+from entities import Entity, ParticleSystem, PickupStore, GlyphAtlas, text_cache
+from utils import Vector2D, RandomStreams, Scheduler
 from entities.ui import Text, HealthBar
+from systems import SpatialHash, FlowField
+from ecs import World, systems
 
 
 # Système d'améliorations global (persiste entre les scènes)
@@ -81,11 +86,183 @@ WAVE_CONFIG = {
     # Formule: spawn_interval = 3.5 - (level * 0.2)
 }
 
+# Nombre maximum d'ennemis simultanés à l'écran
+MAX_ENEMIES_AT_ONCE = 10
+
+# Distance minimale entre deux ennemis (séparation)
+ENEMY_MIN_DISTANCE = 60
+
+# Vitesse des projectiles (pixels par seconde)
+PLAYER_PROJECTILE_SPEED = 400
+ENEMY_PROJECTILE_SPEED = 250
+
+# Rayon de touche des projectiles (autour du centre de la cible)
+PROJECTILE_HIT_RADIUS = 30
+
+# Durée de vie des projectiles (secondes)
+PROJECTILE_LIFETIME = 3.0
+
+# Graines : distance de collecte, portée par défaut de l'aimant (remplacée
+# par game.xp_magnet_range dans config.json) et vitesse des graines
+# attirées. L'aimant n'agit qu'au-delà de la distance de collecte : sa
+# portée doit la dépasser nettement pour que l'attraction se voie.
+SEED_PICKUP_RADIUS = 40
+SEED_MAGNET_RANGE = 150
+SEED_MAGNET_SPEED = 400
+
+# Niveau de détail de l'IA des ennemis : à chaque tick près du joueur, un
+# tick sur AI_FAR_RATE plus loin, un tick sur AI_OFFSCREEN_RATE hors écran
+AI_NEAR_DISTANCE = 300
+AI_FAR_RATE = 4
+AI_OFFSCREEN_RATE = 8
+
+# Champ de flux des ennemis : taille des cellules, zone bloquée par un arbre
+# et nombre d'ennemis à partir duquel il est utilisé (en dessous, viser le
+# joueur en ligne droite ne coûte rien, alors que le champ refait un
+# Dijkstra chaque fois que le joueur change de cellule)
+FLOW_CELL_SIZE = 40
+TREE_BLOCK_RADIUS = 40
+FLOW_FIELD_MIN_CHASERS = 32
+
+
+# Caractéristiques de base des ennemis ; le composant 'kind' est l'indice
+# du type dans ENEMY_KINDS
+ENEMY_KINDS = ('basic', 'raccoon')
+ENEMY_STATS = {
+    'basic': {  # basic trash
+        'speed': 60, 'health': 20, 'damage': 3, 'score_value': 10,
+        'anim_speed': 0.25, 'shoot_interval': 3.0, 'color': (80, 80, 80),
+    },
+    'raccoon': {
+        'speed': 80, 'health': 30, 'damage': 5, 'score_value': 15,
+        'anim_speed': 0.2, 'shoot_interval': 2.0, 'color': (150, 100, 80),
+    },
+}
+
+# Nombre d'images des animations
+ANIMATION_FRAMES = 4
+
+# Composants des archétypes de la vague
+ENEMY_COMPONENTS = (
+    'enemy', 'pos', 'prev_pos', 'vel', 'speed', 'health', 'max_health',
+    'damage', 'score_value', 'kind', 'anim_timer', 'anim_speed', 'frame',
+    'shots', 'ai_elapsed'
+)
+SHOT_COMPONENTS = ('pos', 'prev_pos', 'vel', 'expires_at')
+
+# Simulation dans un processus séparé (RemoteWaveScene) : colonnes publiées
+# à chaque tick par archétype, et capacité des tableaux partagés
+SNAPSHOT_ARCHETYPES = {
+    'enemies': ('pos', 'prev_pos', 'kind', 'frame', 'anim_timer', 'health', 'max_health'),
+    'player_shots': ('pos', 'prev_pos'),
+    'enemy_shots': ('pos', 'prev_pos'),
+}
+SNAPSHOT_SHOTS = 1024
+SNAPSHOT_SEEDS = 256
+SNAPSHOT_PARTICLES = 2048
+PARTICLE_FIELDS = ('pos', 'color', 'size', 'age', 'lifetime')
+
+# Issue de la vague publiée par la simulation (indice dans ce tuple)
+SNAPSHOT_OUTCOMES = (None, 'victory', 'game_over')
+
+# Entrées envoyées au processus de simulation
+INPUT_LAYOUT = {'mouse': (float, 2, 1)}
+
+
+def create_world():
+    """Déclare les composants utilisés par la vague."""
+    world = World()
+    for name in ('pos', 'prev_pos', 'vel'):
+        world.component(name, float, 2)
+    for name in ('speed', 'expires_at', 'anim_timer', 'anim_speed', 'ai_elapsed'):
+        world.component(name, float)
+    for name in ('health', 'max_health', 'damage', 'score_value', 'kind', 'frame', 'shots'):
+        world.component(name, int)
+    for name in ('enemy', 'player_shot', 'enemy_shot'):
+        world.tag(name)
+    return world
+
+
+def snapshot_layout():
+    """
+    Champs publiés par la simulation d'une vague (voir WaveScene.snapshot).
+
+    Returns:
+        dict: Nom -> (dtype, forme d'une ligne, capacité), pour SharedDoubleBuffer
+    """
+    specs = create_world().specs
+    capacities = {
+        'enemies': MAX_ENEMIES_AT_ONCE,
+        'player_shots': SNAPSHOT_SHOTS,
+        'enemy_shots': SNAPSHOT_SHOTS,
+    }
+    layout = {}
+    for name, columns in SNAPSHOT_ARCHETYPES.items():
+        for column in columns:
+            dtype, shape = specs[column]
+            layout[f'{name}.{column}'] = (dtype, shape, capacities[name])
+
+    layout.update({
+        'player.pos': (float, 2, 1),
+        'player.prev_pos': (float, 2, 1),
+        'player.state': (int, 4, 1),  # Vie, vie max, image, vivant
+        'counters': (int, 5, 1),  # Score, ennemis tués, graines, intro, issue
+        'wave_time': (float, (), 1),
+        # Instant de la publication (time.perf_counter, horloge monotone
+        # commune aux processus), ajouté par game/sim_worker.py
+        'published_at': (float, (), 1),
+        'seeds.pos': (float, 2, SNAPSHOT_SEEDS),
+        'seeds.spawn_time': (float, (), SNAPSHOT_SEEDS),
+        'particles.pos': (float, 2, SNAPSHOT_PARTICLES),
+        'particles.color': (np.uint8, 3, SNAPSHOT_PARTICLES),
+        'particles.size': (float, (), SNAPSHOT_PARTICLES),
+        'particles.age': (float, (), SNAPSHOT_PARTICLES),
+        'particles.lifetime': (float, (), SNAPSHOT_PARTICLES),
+    })
+    return layout
+
+
+def load_frames(sprite_sheet, size=80):
+    """
+    Découpe une sprite sheet horizontale en ANIMATION_FRAMES images.
+
+    Une image simple (pas assez large pour être une sprite sheet) est
+    répétée pour chaque image de l'animation.
+
+    Args:
+        sprite_sheet: Surface pygame (None pour aucune image)
+        size: Côté des images mises à l'échelle
+
+    Returns:
+        list: Images de l'animation (vide sans sprite sheet)
+    """
+    if not sprite_sheet:
+        return []
+
+    sheet_width = sprite_sheet.get_width()
+    sheet_height = sprite_sheet.get_height()
+
+    if sheet_width > sheet_height * 1.5:
+        # C'est probablement une sprite sheet horizontale
+        frame_width = sheet_width // ANIMATION_FRAMES
+        return [
+            pygame.transform.scale(
+                sprite_sheet.subsurface((i * frame_width, 0, frame_width, sheet_height)),
+                (size, size)
+            )
+            for i in range(ANIMATION_FRAMES)
+        ]
+
+    # Image simple, on crée des variations
+    scaled = pygame.transform.scale(sprite_sheet, (size, size))
+    return [scaled] * ANIMATION_FRAMES
+
+
 def get_wave_config(level):
     """Retourne la configuration pour une vague donnée."""
     return {
         'enemies_total': 9 * level,
-        'max_at_once': min(3 + level, 10),  # Max 10 ennemis simultanés
+        'max_at_once': min(3 + level, MAX_ENEMIES_AT_ONCE),
         'spawn_interval': max(1.0, 3.5 - (level * 0.2)),  # Min 1 seconde
         'raccoon_ratio': min(0.3 + (level * 0.05), 0.6),  # Plus de raccoons dans les niveaux avancés
         'enemy_health_multiplier': 1 + (level - 1) * 0.2,  # +20% HP par niveau
@@ -95,50 +272,13 @@ def get_wave_config(level):
     }
 
 
-class Seed:
-    """Graine dropée par les ennemis."""
-
-    def __init__(self, x, y, sprite=None):
-        self.pos = type('Vector2D', (), {'x': x, 'y': y})()
-        self.alive = True
-        self.bob_offset = 0  # Pour l'effet de flottement
-        self.bob_speed = 3
-        self.sprite = sprite
-
-        # Taille si sprite fourni
-        if sprite:
-            self.width = sprite.get_width()
-            self.height = sprite.get_height()
-        else:
-            self.width = 16
-            self.height = 16
-
-    def update(self, dt):
-        """Met à jour la graine."""
-        self.bob_offset += self.bob_speed * dt
-
-    def draw(self, screen):
-        """Dessine la graine."""
-        # Effet de flottement
-        y_offset = math.sin(self.bob_offset) * 3
-        draw_y = self.pos.y + y_offset
-
-        if self.sprite:
-            # Dessine le sprite centré
-            draw_x = self.pos.x - self.width // 2
-            draw_y_adjusted = draw_y - self.height // 2
-            screen.blit(self.sprite, (int(draw_x), int(draw_y_adjusted)))
-        else:
-            # Fallback: cercle doré
-            pygame.draw.circle(screen, (255, 220, 100), (int(self.pos.x), int(draw_y)), 8)
-            pygame.draw.circle(screen, (200, 160, 50), (int(self.pos.x), int(draw_y)), 8, 2)
-
-
 class Decoration:
     """Décoration de fond (arbre ou buisson)."""
 
+    __slots__ = ('pos', 'type', 'sprite', 'width', 'height')
+
     def __init__(self, x, y, sprite=None, decoration_type='tree'):
-        self.pos = type('Vector2D', (), {'x': x, 'y': y})()
+        self.pos = Vector2D(x, y)
         self.type = decoration_type
         self.sprite = sprite
 
@@ -174,62 +314,15 @@ class Decoration:
                 pygame.draw.circle(screen, (90, 160, 90), (int(self.pos.x), int(self.pos.y - 10)), 12)
 
 
-class Projectile(Entity):
-    """Projectile du joueur ou ennemi."""
-
-    def __init__(self, x, y, angle=None, is_player=True):
-        super().__init__(x, y, 8, 8)
-        self.speed = 400 if is_player else 250
-        self.is_player = is_player
-
-        # Direction aléatoire ou spécifiée
-        if angle is None:
-            angle = random.uniform(0, 360)
-
-        # Convertit l'angle en vélocité
-        self.velocity.x = math.cos(math.radians(angle)) * self.speed
-        self.velocity.y = math.sin(math.radians(angle)) * self.speed
-
-        self.lifetime = 3.0  # Durée de vie en secondes
-
-    def update(self, dt, screen_width, screen_height):
-        """Met à jour le projectile."""
-        super().update(dt)
-
-        # Réduit la durée de vie
-        self.lifetime -= dt
-        if self.lifetime <= 0:
-            self.destroy()
-
-        # Détruit si hors écran
-        if (self.pos.x < -50 or self.pos.x > screen_width + 50 or
-            self.pos.y < -50 or self.pos.y > screen_height + 50):
-            self.destroy()
-
-    def draw(self, screen, camera=None):
-        """Dessine le projectile."""
-        if camera:
-            draw_pos = camera.apply(self.pos)
-        else:
-            draw_pos = self.pos
-
-        if self.is_player:
-            # Projectile jaune/orange pour le joueur
-            pygame.draw.circle(screen, (255, 200, 50),
-                             (int(draw_pos.x), int(draw_pos.y)), 4)
-            pygame.draw.circle(screen, (255, 255, 100),
-                             (int(draw_pos.x), int(draw_pos.y)), 2)
-        else:
-            # Projectile rouge pour les ennemis
-            pygame.draw.circle(screen, (200, 50, 50),
-                             (int(draw_pos.x), int(draw_pos.y)), 4)
-            pygame.draw.circle(screen, (255, 100, 100),
-                             (int(draw_pos.x), int(draw_pos.y)), 2)
-
-
 class Player(Entity):
     """Joueur Navet - suit la souris."""
 
+    __slots__ = (
+        'speed', 'max_health', 'health', 'damage_multiplier', 'shoot_interval',
+        'sprite_sheet', 'sprites', 'current_sprite', 'animation_timer',
+        'animation_speed', 'shoot_timer'
+    )
+
     def __init__(self, x, y, sprite_sheet=None):
         super().__init__(x, y, 48, 48)
 
@@ -246,7 +339,6 @@ class Player(Entity):
         self.shoot_interval = base_shoot_interval / player_upgrades.get_fire_rate_multiplier()
 
         self.sprite_sheet = sprite_sheet
-        self.sprites = []
         self.current_sprite = 0
         self.animation_timer = 0
         self.animation_speed = 0.15
@@ -255,26 +347,7 @@ class Player(Entity):
         self.shoot_timer = 0
 
         # Charge les sprites
-        if sprite_sheet:
-            self._load_sprites()
-
-    def _load_sprites(self):
-        """Découpe la sprite sheet en frames."""
-        sheet_width = self.sprite_sheet.get_width()
-        sheet_height = self.sprite_sheet.get_height()
-
-        # Essaie de détecter si c'est une sprite sheet ou une image simple
-        if sheet_width > sheet_height * 1.5:
-            # C'est probablement une sprite sheet horizontale
-            frame_width = sheet_width // 4
-            for i in range(4):
-                frame = self.sprite_sheet.subsurface((i * frame_width, 0, frame_width, sheet_height))
-                self.sprites.append(pygame.transform.scale(frame, (80, 80)))
-        else:
-            # Image simple, on crée des variations
-            scaled = pygame.transform.scale(self.sprite_sheet, (80, 80))
-            for i in range(4):
-                self.sprites.append(scaled)
+        self.sprites = load_frames(sprite_sheet)
 
     def take_damage(self, amount):
         """Inflige des dégâts au joueur."""
@@ -316,12 +389,11 @@ class Player(Entity):
             return True
         return False
 
-    def draw(self, screen, camera=None):
-        """Dessine le joueur."""
+    def draw(self, screen, camera=None, alpha=1.0):
+        """Dessine le joueur (position interpolée selon alpha)."""
+        draw_pos = self.lerp_pos(alpha)
         if camera:
-            draw_pos = camera.apply(self.pos)
-        else:
-            draw_pos = self.pos
+            draw_pos = camera.apply(draw_pos)
 
         if self.sprites:
             sprite = self.sprites[self.current_sprite]
@@ -337,163 +409,6 @@ class Player(Entity):
                             (draw_pos.x - 24, draw_pos.y - 24, 48, 48))
 
 
-class Enemy(Entity):
-    """Ennemi basique."""
-
-    def __init__(self, x, y, enemy_type='basic', sprite_sheet=None, wave_config=None):
-        super().__init__(x, y, 48, 48)
-        self.enemy_type = enemy_type
-        self.sprite_sheet = sprite_sheet
-        self.sprites = []
-        self.current_sprite = 0
-        self.animation_timer = 0
-
-        # Config de base
-        if enemy_type == 'raccoon':
-            base_speed = 80
-            base_health = 30
-            self.damage = 5
-            self.score_value = 15
-            self.animation_speed = 0.2
-            base_shoot_interval = 2.0
-        else:  # basic trash
-            base_speed = 60
-            base_health = 20
-            self.damage = 3
-            self.score_value = 10
-            self.animation_speed = 0.25
-            base_shoot_interval = 3.0
-
-        # Applique les multiplicateurs de vague
-        if wave_config:
-            self.speed = base_speed * wave_config['enemy_speed_multiplier']
-            self.health = int(base_health * wave_config['enemy_health_multiplier'])
-            self.max_health = self.health  # Pour afficher la barre de vie
-            self.shoot_interval = base_shoot_interval * wave_config['enemy_shoot_speed']
-            self.projectiles_count = wave_config['enemy_projectiles_count']
-        else:
-            self.speed = base_speed
-            self.health = base_health
-            self.max_health = base_health
-            self.shoot_interval = base_shoot_interval
-            self.projectiles_count = 1
-
-        # Tir
-        self.shoot_timer = random.uniform(0, self.shoot_interval)
-
-        # Charge les sprites
-        if sprite_sheet:
-            self._load_sprites()
-
-    def _load_sprites(self):
-        """Découpe la sprite sheet en frames."""
-        sheet_width = self.sprite_sheet.get_width()
-        sheet_height = self.sprite_sheet.get_height()
-
-        if sheet_width > sheet_height * 1.5:
-            frame_width = sheet_width // 4
-            for i in range(4):
-                frame = self.sprite_sheet.subsurface((i * frame_width, 0, frame_width, sheet_height))
-                self.sprites.append(pygame.transform.scale(frame, (80, 80)))
-        else:
-            scaled = pygame.transform.scale(self.sprite_sheet, (80, 80))
-            for i in range(4):
-                self.sprites.append(scaled)
-
-    def take_damage(self, amount):
-        """Inflige des dégâts à l'ennemi."""
-        self.health -= amount
-        if self.health <= 0:
-            self.destroy()
-
-    def update(self, dt, player=None):
-        """Met à jour l'ennemi."""
-        if player and player.alive:
-            # Poursuit le joueur
-            dx = player.pos.x - self.pos.x
-            dy = player.pos.y - self.pos.y
-
-            distance = math.sqrt(dx * dx + dy * dy)
-            if distance > 0:
-                self.velocity.x = (dx / distance) * self.speed
-                self.velocity.y = (dy / distance) * self.speed
-
-        # Animation
-        self.animation_timer += dt
-        if self.animation_timer >= self.animation_speed:
-            self.animation_timer = 0
-            self.current_sprite = (self.current_sprite + 1) % max(len(self.sprites), 1)
-
-        # Tir
-        self.shoot_timer += dt
-
-        # Applique le mouvement
-        super().update(dt)
-
-    def can_shoot(self):
-        """Vérifie si l'ennemi peut tirer et retourne le nombre de projectiles."""
-        if self.shoot_timer >= self.shoot_interval:
-            self.shoot_timer = 0
-            return self.projectiles_count
-        return 0
-
-    def draw(self, screen, camera=None):
-        """Dessine l'ennemi."""
-        if camera:
-            draw_pos = camera.apply(self.pos)
-        else:
-            draw_pos = self.pos
-
-        if self.sprites:
-            # Animation avec rebond
-            offset_y = math.sin(self.animation_timer * 10) * 3
-            sprite = self.sprites[self.current_sprite]
-            screen.blit(sprite, (draw_pos.x - 40, draw_pos.y - 40 + offset_y))
-        elif self.sprite_sheet:
-            # Utilise l'image telle quelle
-            offset_y = math.sin(self.animation_timer * 10) * 3
-            scaled = pygame.transform.scale(self.sprite_sheet, (80, 80))
-            screen.blit(scaled, (draw_pos.x - 40, draw_pos.y - 40 + offset_y))
-        else:
-            # Fallback selon le type
-            if self.enemy_type == 'raccoon':
-                color = (150, 100, 80)
-            else:
-                color = (80, 80, 80)
-            pygame.draw.rect(screen, color,
-                            (draw_pos.x - 24, draw_pos.y - 24, 48, 48))
-
-        # Barre de vie au-dessus de l'ennemi
-        if self.health < self.max_health:
-            bar_width = 60
-            bar_height = 6
-            bar_x = draw_pos.x - bar_width // 2
-            bar_y = draw_pos.y - 50
-
-            # Fond de la barre (rouge foncé)
-            pygame.draw.rect(screen, (80, 20, 20),
-                           (bar_x, bar_y, bar_width, bar_height))
-
-            # Barre de vie (vert -> jaune -> rouge selon le pourcentage)
-            health_percent = self.health / self.max_health
-            current_bar_width = int(bar_width * health_percent)
-
-            if health_percent > 0.6:
-                bar_color = (50, 200, 50)  # Vert
-            elif health_percent > 0.3:
-                bar_color = (255, 200, 50)  # Jaune
-            else:
-                bar_color = (255, 50, 50)  # Rouge
-
-            if current_bar_width > 0:
-                pygame.draw.rect(screen, bar_color,
-                               (bar_x, bar_y, current_bar_width, bar_height))
-
-            # Bordure de la barre
-            pygame.draw.rect(screen, (200, 200, 200),
-                           (bar_x, bar_y, bar_width, bar_height), 1)
-
-
 class WaveScene(Scene):
     """Scène de vague universelle."""
 
@@ -502,53 +417,126 @@ class WaveScene(Scene):
         self.wave_number = wave_number
         self.wave_config = get_wave_config(wave_number)
 
+        # Ennemis et projectiles : archétypes ECS (composants en tableaux,
+        # traités par lots par les systèmes), réutilisés à chaque entrée
+        self.world = create_world()
+        self.enemies = self.world.archetype(*ENEMY_COMPONENTS, capacity=MAX_ENEMIES_AT_ONCE)
+        self.player_shots = self.world.archetype(*SHOT_COMPONENTS, 'player_shot', capacity=256)
+        self.enemy_shots = self.world.archetype(*SHOT_COMPONENTS, 'enemy_shot', capacity=256)
+
+        self.particle_system = ParticleSystem()
+        self.scheduler = Scheduler()  # Apparitions et tirs des ennemis
+        self.fire_handles = {}  # Id d'ennemi -> TimerHandle de son tir
+        self.seeds = PickupStore()  # Graines à collecter
+
+        # Graine de la vague : tirée dans le flux 'waves' de la partie à
+        # chaque entrée, sauf si seed_override est fixée (processus de
+        # simulation, qui doit rejouer la vague du processus principal)
+        self.wave_seed = None
+        self.seed_override = None
+
     def on_enter(self):
         """Initialise la vague."""
         # Charge les assets
         self._load_assets()
 
         # Crée le joueur au centre
-        player_x = self.game.config.window_width // 2
-        player_y = self.game.config.window_height // 2
+        player_x = self.settings.window_width // 2
+        player_y = self.settings.window_height // 2
         self.player = Player(player_x, player_y, self.player_image)
 
-        # Listes
-        self.enemies = []
-        self.projectiles = []
-        self.seeds = []  # Graines à collecter
+        # Conteneurs (vidés aussi dans on_exit)
+        self.world.clear()
+        self.seeds.clear()
+        self.scheduler.clear()
+        self.fire_handles.clear()
         self.decorations = []  # Décorations de fond
 
+        # Flux aléatoires de la vague, dérivés de la graine de la partie :
+        # les effets visuels ont leur propre flux et ne changent jamais le jeu
+        if self.seed_override is not None:
+            self.wave_seed = self.seed_override
+        else:
+            self.wave_seed = self.game.rng.derive_seed('waves')
+        self.rng = RandomStreams(self.wave_seed)
+        self.spawn_rng = self.rng.stream('spawning')
+        self.combat_rng = self.rng.stream('combat')
+        self.loot_rng = self.rng.stream('loot')
+        self.particle_system.reseed(self.rng.derive_seed('cosmetic'))
+
         # Crée les décorations
         self._create_decorations()
 
+        # Fond statique (couleur, grille, décorations) composé une seule fois
+        self.background = self._bake_background()
+
         # Système de particules
-        self.particle_system = ParticleSystem()
+        self.particle_system.clear()
+
+        # Grilles spatiales reconstruites à chaque frame pour les collisions
+        self.shots_grid = SpatialHash(cell_size=64)
+        self.separation_grid = SpatialHash(cell_size=ENEMY_MIN_DISTANCE)
+
+        # Champ de flux vers le joueur, qui contourne les arbres
+        self.flow_field = FlowField(
+            self.settings.window_width,
+            self.settings.window_height,
+            cell_size=FLOW_CELL_SIZE
+        )
+        for decoration in self.decorations:
+            if decoration.type == 'tree':
+                self.flow_field.block_circle(decoration.pos.x, decoration.pos.y, TREE_BLOCK_RADIUS)
 
         # UI - Tout en haut en colonnes
         font_medium = self.game.assets.get_font('medium')
         font_small = self.game.assets.get_font('small')
 
         if not font_medium:
-            font_medium = pygame.font.Font(None, 32)
+            font_medium = self.game.assets.font(None, 32)
         if not font_small:
-            font_small = pygame.font.Font(None, 24)
+            font_small = self.game.assets.font(None, 24)
 
         # Crée les objets UI pour compatibilité (mis à jour dans update())
         self.score_text = Text("Score: 0", 10, 10, font_small, (255, 255, 255))
         self.health_bar = HealthBar(10, 40, 200, 20, self.player.max_health)
 
+        # Polices et textes fixes de la barre du haut, créés une fois : le
+        # cache de texte reconnaît une police à son identité
+        self.font_ui = self.game.assets.font(None, 28)
+        self.font_title = self.game.assets.font(None, 36)
+
+        # Compteurs de la barre du haut : chiffres et libellés rastérisés
+        # une fois par couleur, assemblés à chaque frame
+        self.score_glyphs = GlyphAtlas(self.font_ui, (255, 255, 255), "0123456789Score: ")
+        self.hp_low_glyphs = GlyphAtlas(self.font_ui, (255, 100, 100), "0123456789Vie: /")
+        self.hp_glyphs = GlyphAtlas(self.font_ui, (100, 255, 100), "0123456789Vie: /")
+        self.seeds_glyphs = GlyphAtlas(self.font_ui, (255, 220, 100), "0123456789Graines: ")
+        self.enemy_glyphs = GlyphAtlas(self.font_ui, (255, 150, 150), "0123456789Ennemis: /")
+        self.instructions = Text(
+            "Souris: déplacer | Tir: automatique | ESC: menu",
+            self.settings.window_width // 2,
+            self.settings.window_height - 20,
+            self.game.assets.font(None, 22),
+            (100, 100, 100),
+            center=True
+        )
+
         # Stats
         self.score = 0
         self.enemies_killed = 0
         self.seeds_collected = 0  # Compteur de graines
         self.wave_time = 0  # Temps écoulé dans la vague
+        self.magnet_range = getattr(self.settings, 'game_xp_magnet_range', SEED_MAGNET_RANGE)
+        self.tick = 0  # Ticks simulés (répartit les mises à jour de l'IA)
 
-        # Spawn system avec config de vague
-        self.spawn_timer = 0
+        # Spawn system avec config de vague (apparitions programmées)
         self.spawn_interval = self.wave_config['spawn_interval']
         self.enemies_to_spawn = self.wave_config['enemies_total']
         self.enemies_spawned = 0
         self.max_enemies_at_once = self.wave_config['max_at_once']
+        self.spawn_handle = None
+        self.spawn_remaining = None  # Délai restant du minuteur en pause (arène pleine)
+        self._schedule_spawn()
 
         # Message de début
         self.show_intro = True
@@ -558,6 +546,33 @@ class WaveScene(Scene):
         self.show_shop_menu = False
         self.shop_selected = 0
 
+    def on_config_changed(self, section, key, value):
+        """Rafraîchit les réglages (et la portée de l'aimant) après un changement."""
+        super().on_config_changed(section, key, value)
+        self.magnet_range = getattr(self.settings, 'game_xp_magnet_range', SEED_MAGNET_RANGE)
+
+    def on_exit(self):
+        """Vide les conteneurs de la vague."""
+        self.world.clear()
+        self.seeds.clear()
+        self.scheduler.clear()
+        self.fire_handles.clear()
+
+    def pool_stats(self):
+        """
+        Retourne les compteurs des pools utilisés par la vague.
+
+        Returns:
+            dict: Par pool, hits / misses / active / high_water
+        """
+        return {
+            'player_shots': self.player_shots.stats.as_dict(),
+            'enemy_shots': self.enemy_shots.stats.as_dict(),
+            'enemies': self.enemies.stats.as_dict(),
+            'seeds': self.seeds.stats.as_dict(),
+            'particles': self.particle_system.stats.as_dict(),
+        }
+
     def _load_assets(self):
         """Charge les assets du jeu."""
         assets_path = os.path.join(os.path.dirname(__file__), '..', '..', 'assets')
@@ -583,6 +598,12 @@ class WaveScene(Scene):
         else:
             self.enemy_image = None
 
+        # Images des animations par type d'ennemi (indice = composant 'kind')
+        self.enemy_frames = [
+            load_frames(self.raccoon_image if kind == 'raccoon' else self.enemy_image)
+            for kind in ENEMY_KINDS
+        ]
+
         # Charge les sprites de décoration (arbres x5, buissons x3)
         tree_path = os.path.join(assets_path, 'tree.png')
         if os.path.exists(tree_path):
@@ -609,8 +630,11 @@ class WaveScene(Scene):
             new_width = seed_img.get_width() * 2
             new_height = seed_img.get_height() * 2
             self.seed_image = pygame.transform.scale(seed_img, (new_width, new_height))
+            # Version bien visible du sprite (70x70) pour l'interface
+            self.hud_seed_image = pygame.transform.scale(self.seed_image, (70, 70))
         else:
             self.seed_image = None
+            self.hud_seed_image = None
 
     def _create_decorations(self):
         """Crée les décorations de fond (arbres et buissons)."""
@@ -620,43 +644,139 @@ class WaveScene(Scene):
 
         # Arbres
         for _ in range(num_trees):
-            x = random.randint(50, self.game.config.window_width - 50)
-            y = random.randint(50, self.game.config.window_height - 50)
+            x = self.spawn_rng.randint(50, self.settings.window_width - 50)
+            y = self.spawn_rng.randint(50, self.settings.window_height - 50)
             self.decorations.append(Decoration(x, y, self.tree_image, 'tree'))
 
         # Buissons
         for _ in range(num_bushes):
-            x = random.randint(30, self.game.config.window_width - 30)
-            y = random.randint(30, self.game.config.window_height - 30)
+            x = self.spawn_rng.randint(30, self.settings.window_width - 30)
+            y = self.spawn_rng.randint(30, self.settings.window_height - 30)
             self.decorations.append(Decoration(x, y, self.bush_image, 'bush'))
 
     def _spawn_enemy(self):
         """Fait apparaître un ennemi."""
         # Choix aléatoire du type selon le ratio de la vague
-        enemy_type = 'raccoon' if random.random() < self.wave_config['raccoon_ratio'] else 'basic'
+        enemy_type = 'raccoon' if self.spawn_rng.random() < self.wave_config['raccoon_ratio'] else 'basic'
 
         # Position aléatoire hors écran
-        side = random.choice(['top', 'bottom', 'left', 'right'])
+        side = self.spawn_rng.choice(['top', 'bottom', 'left', 'right'])
 
         if side == 'top':
-            x = random.randint(0, self.game.config.window_width)
+            x = self.spawn_rng.randint(0, self.settings.window_width)
             y = -30
         elif side == 'bottom':
-            x = random.randint(0, self.game.config.window_width)
-            y = self.game.config.window_height + 30
+            x = self.spawn_rng.randint(0, self.settings.window_width)
+            y = self.settings.window_height + 30
         elif side == 'left':
             x = -30
-            y = random.randint(0, self.game.config.window_height)
+            y = self.spawn_rng.randint(0, self.settings.window_height)
         else:  # right
-            x = self.game.config.window_width + 30
-            y = random.randint(0, self.game.config.window_height)
+            x = self.settings.window_width + 30
+            y = self.spawn_rng.randint(0, self.settings.window_height)
 
         # Crée l'ennemi avec la config de vague
-        image = self.raccoon_image if enemy_type == 'raccoon' else self.enemy_image
-        enemy = Enemy(x, y, enemy_type, image, self.wave_config)
-        self.enemies.append(enemy)
+        stats = ENEMY_STATS[enemy_type]
+        health = int(stats['health'] * self.wave_config['enemy_health_multiplier'])
+        shoot_interval = stats['shoot_interval'] * self.wave_config['enemy_shoot_speed']
+        speed = stats['speed'] * self.wave_config['enemy_speed_multiplier']
+
+        # Vélocité initiale vers le joueur : un ennemi hors écran n'est mis
+        # à jour par l'IA qu'à son tour (niveau de détail) et ne doit pas
+        # rester immobile jusque-là
+        dx = self.player.pos.x - x
+        dy = self.player.pos.y - y
+        distance = math.hypot(dx, dy) or 1.0
+
+        rows = self.enemies.spawn(
+            pos=(x, y),
+            prev_pos=(x, y),
+            vel=(dx / distance * speed, dy / distance * speed),
+            speed=speed,
+            health=health,
+            max_health=health,  # Pour afficher la barre de vie
+            damage=stats['damage'],
+            score_value=stats['score_value'],
+            kind=ENEMY_KINDS.index(enemy_type),
+            anim_speed=stats['anim_speed'],
+            shots=self.wave_config['enemy_projectiles_count'],
+        )
         self.enemies_spawned += 1
 
+        # Premier tir après un délai aléatoire, puis toutes les
+        # shoot_interval secondes (annulé à la mort de l'ennemi)
+        entity_id = int(self.enemies.ids[rows.start])
+        self.fire_handles[entity_id] = self.scheduler.schedule(
+            self.combat_rng.uniform(0, shoot_interval),
+            self._on_enemy_fire,
+            entity_id,
+            interval=shoot_interval
+        )
+
+    def _schedule_spawn(self):
+        """Programme la prochaine apparition s'il reste des ennemis à faire venir."""
+        if self.enemies_spawned < self.enemies_to_spawn:
+            self.spawn_handle = self.scheduler.schedule(self.spawn_interval, self._on_spawn_timer)
+        else:
+            self.spawn_handle = None
+
+    def _on_spawn_timer(self):
+        """Apparition programmée (appelée par le scheduler)."""
+        self.spawn_handle = None
+        self._spawn_enemy()
+        self._schedule_spawn()
+
+    def _pause_spawn_when_full(self):
+        """
+        Suspend le minuteur d'apparition tant que l'arène est pleine.
+
+        L'apparition est annulée avec le délai qu'il lui restait, puis
+        reprogrammée avec ce délai quand une place se libère : le minuteur
+        ne s'écoule que lorsqu'un ennemi peut apparaître.
+        """
+        full = len(self.enemies) >= self.max_enemies_at_once
+        if full and self.spawn_handle is not None:
+            self.spawn_remaining = self.spawn_handle.time - self.scheduler.time
+            self.spawn_handle.cancel()
+            self.spawn_handle = None
+        elif not full and self.spawn_remaining is not None:
+            self.spawn_handle = self.scheduler.schedule(self.spawn_remaining, self._on_spawn_timer)
+            self.spawn_remaining = None
+
+    def _on_enemy_fire(self, entity_id):
+        """
+        Tir d'un ennemi (appelé par le scheduler) : plusieurs projectiles
+        selon la vague, dans des directions aléatoires.
+
+        Args:
+            entity_id: Id de l'ennemi qui tire
+        """
+        row = self.enemies.find(entity_id)
+        if row is None:
+            return
+        x, y = self.enemies['pos'][row].tolist()
+        angles = [self.combat_rng.uniform(0, 360) for _ in range(int(self.enemies['shots'][row]))]
+        self._fire(self.enemy_shots, x, y, angles, ENEMY_PROJECTILE_SPEED)
+
+    def _fire(self, shots, x, y, angles, speed):
+        """
+        Crée une salve de projectiles partant du même point.
+
+        Args:
+            shots: Archétype des projectiles (du joueur ou des ennemis)
+            x, y: Position de départ
+            angles: Liste des angles en degrés (un projectile par angle)
+            speed: Vitesse en pixels par seconde
+        """
+        radians = np.radians(angles)
+        shots.spawn(
+            len(angles),
+            pos=(x, y),
+            prev_pos=(x, y),
+            vel=np.column_stack((np.cos(radians) * speed, np.sin(radians) * speed)),
+            expires_at=self.wave_time + PROJECTILE_LIFETIME,
+        )
+
     def handle_events(self, events):
         """Gère les événements."""
         for event in events:
@@ -727,6 +847,7 @@ class WaveScene(Scene):
 
         # Incrémente le temps de la vague
         self.wave_time += dt
+        self.tick += 1
 
         # Position de la souris
         mouse_pos = self.game.input.get_mouse_pos()
@@ -738,157 +859,135 @@ class WaveScene(Scene):
             # Tir automatique dans des directions aléatoires
             if self.player.can_shoot(dt):
                 # Tire 2 projectiles dans des directions aléatoires
-                for _ in range(2):
-                    angle = random.uniform(0, 360)
-                    projectile = Projectile(
-                        self.player.pos.x,
-                        self.player.pos.y,
-                        angle=angle,
-                        is_player=True
-                    )
-                    self.projectiles.append(projectile)
-
-        # Met à jour les projectiles
-        for proj in self.projectiles[:]:
-            if not proj.alive:
-                self.projectiles.remove(proj)
-            else:
-                proj.update(dt, self.game.config.window_width, self.game.config.window_height)
-
-        # Spawn des ennemis
-        if self.enemies_spawned < self.enemies_to_spawn and len(self.enemies) < self.max_enemies_at_once:
-            self.spawn_timer += dt
-            if self.spawn_timer >= self.spawn_interval:
-                self.spawn_timer = 0
-                self._spawn_enemy()
-
-        # Met à jour les ennemis
-        for enemy in self.enemies[:]:
-            if not enemy.alive:
-                # Crée des particules
-                self.particle_system.emit(
-                    enemy.pos.x + 24,
-                    enemy.pos.y + 24,
-                    count=20,
-                    color=(255, 150, 50)
+                angles = [self.combat_rng.uniform(0, 360) for _ in range(2)]
+                self._fire(
+                    self.player_shots,
+                    self.player.pos.x,
+                    self.player.pos.y,
+                    angles,
+                    PLAYER_PROJECTILE_SPEED
                 )
-                self.score += enemy.score_value
-                self.enemies_killed += 1
 
-                # Drop de graine (30% de chance)
-                if random.random() < 0.3:
-                    seed = Seed(enemy.pos.x, enemy.pos.y, self.seed_image)
-                    self.seeds.append(seed)
+        enemies = self.enemies
+        width = self.settings.window_width
+        height = self.settings.window_height
+
+        # IA avec niveau de détail : seuls les ennemis dont c'est le tour
+        # sont mis à jour, avec le temps écoulé depuis leur dernier tour
+        ai_rows, ai_elapsed = systems.level_of_detail(
+            enemies, dt, self.tick,
+            self.player.pos.x, self.player.pos.y,
+            (0, 0, width, height),
+            AI_NEAR_DISTANCE,
+            far_rate=AI_FAR_RATE,
+            offscreen_rate=AI_OFFSCREEN_RATE
+        )
 
-                self.enemies.remove(enemy)
-            else:
-                enemy.update(dt, self.player)
-
-                # Tir aléatoire des ennemis (plusieurs projectiles selon la vague)
-                projectiles_count = enemy.can_shoot()
-                if projectiles_count > 0:
-                    for _ in range(projectiles_count):
-                        angle = random.uniform(0, 360)
-                        projectile = Projectile(
-                            enemy.pos.x,
-                            enemy.pos.y,
-                            angle=angle,
-                            is_player=False
-                        )
-                        self.projectiles.append(projectile)
-
-                # Collision avec le joueur
-                if self.player.alive:
-                    dx = enemy.pos.x - self.player.pos.x
-                    dy = enemy.pos.y - self.player.pos.y
-                    distance = math.sqrt(dx * dx + dy * dy)
-
-                    if distance < 50:
-                        self.player.take_damage(enemy.damage)
-                        enemy.take_damage(999)
-
-                # Collision avec les projectiles du joueur
-                for proj in self.projectiles[:]:
-                    if proj.alive and proj.is_player:
-                        dx = proj.pos.x - enemy.pos.x
-                        dy = proj.pos.y - enemy.pos.y
-                        distance = math.sqrt(dx * dx + dy * dy)
-
-                        if distance < 30:
-                            # Dégâts de base * multiplicateur d'amélioration
-                            damage = int(10 * self.player.damage_multiplier)
-                            enemy.take_damage(damage)
-                            proj.destroy()
-                            self.particle_system.emit(
-                                proj.pos.x,
-                                proj.pos.y,
-                                count=5,
-                                color=(255, 255, 100)
-                            )
-
-        # Collision des projectiles ennemis avec le joueur
+        # Poursuite du joueur, via le champ de flux quand les ennemis sont
+        # nombreux (recalculé seulement si le joueur change de cellule),
+        # puis animation
         if self.player.alive:
-            for proj in self.projectiles[:]:
-                if proj.alive and not proj.is_player:
-                    dx = proj.pos.x - self.player.pos.x
-                    dy = proj.pos.y - self.player.pos.y
-                    distance = math.sqrt(dx * dx + dy * dy)
-
-                    if distance < 30:
-                        self.player.take_damage(5)
-                        proj.destroy()
-                        self.particle_system.emit(
-                            proj.pos.x,
-                            proj.pos.y,
-                            count=5,
-                            color=(255, 100, 100)
-                        )
+            flow_field = None
+            if enemies.count >= FLOW_FIELD_MIN_CHASERS:
+                flow_field = self.flow_field
+                flow_field.update(self.player.pos.x, self.player.pos.y)
+            systems.chase(enemies, self.player.pos.x, self.player.pos.y, flow_field, ai_rows)
+        systems.animate(enemies, ai_elapsed, ANIMATION_FRAMES, ai_rows)
+
+        # Mouvement des ennemis et des projectiles, expiration et sortie d'écran
+        systems.movement(self.world, dt)
+        systems.lifetime(self.world, self.wave_time, bounds=(width, height))
+
+        # Collision des ennemis avec le joueur
+        if self.player.alive and enemies.count:
+            offset = enemies['pos'] - (self.player.pos.x, self.player.pos.y)
+            touching = np.flatnonzero((offset * offset).sum(axis=1) < 50 * 50)
+            for row in touching.tolist():
+                if not self.player.alive:
+                    break
+                self.player.take_damage(int(enemies['damage'][row]))
+                enemies['health'][row] -= 999
+
+        # Projectiles du joueur contre les ennemis (tout le trajet du tick)
+        shot_rows, enemy_rows, points = systems.swept_hits(
+            self.player_shots,
+            enemies,
+            PROJECTILE_HIT_RADIUS,
+            PROJECTILE_HIT_RADIUS + PLAYER_PROJECTILE_SPEED * dt,
+            self.shots_grid
+        )
+        if len(shot_rows):
+            # Dégâts de base * multiplicateur d'amélioration
+            damage = int(10 * self.player.damage_multiplier)
+            np.subtract.at(enemies['health'], enemy_rows, damage)
+            self.player_shots.kill(shot_rows)
+            for hit_x, hit_y in points.tolist():
+                self.particle_system.emit(hit_x, hit_y, count=5, color=(255, 255, 100))
+
+        # Ennemis morts : effets, score, butin
+        dead = np.flatnonzero(enemies.alive[:enemies.count] & (enemies['health'] <= 0))
+        for row in dead.tolist():
+            x, y = enemies['pos'][row].tolist()
+            self.particle_system.emit(x + 24, y + 24, count=20, color=(255, 150, 50))
+            self.score += int(enemies['score_value'][row])
+            self.enemies_killed += 1
+            self.fire_handles.pop(int(enemies.ids[row])).cancel()
+
+            # Drop de graine (30% de chance)
+            if self.loot_rng.random() < 0.3:
+                self.seeds.spawn(x, y, self.wave_time)
+        enemies.kill(dead)
+
+        # Projectiles ennemis contre le joueur
+        if self.player.alive:
+            shot_rows, _, points = systems.swept_hits(
+                self.enemy_shots,
+                [(self.player.pos.x, self.player.pos.y)],
+                PROJECTILE_HIT_RADIUS,
+                PROJECTILE_HIT_RADIUS + ENEMY_PROJECTILE_SPEED * dt,
+                self.shots_grid
+            )
+            self.enemy_shots.kill(shot_rows)
+            for hit_x, hit_y in points.tolist():
+                self.player.take_damage(5)
+                self.particle_system.emit(hit_x, hit_y, count=5, color=(255, 100, 100))
+
+        # Retire les entités détruites en une seule passe
+        self.world.flush()
+
+        # Apparitions et tirs des ennemis programmés (minuteur d'apparition
+        # en pause si l'arène est pleine)
+        self._pause_spawn_when_full()
+        self.scheduler.update(dt)
 
         # Collisions entre ennemis (les repousse pour éviter qu'ils se superposent)
-        for i, enemy1 in enumerate(self.enemies):
-            for enemy2 in self.enemies[i + 1:]:
-                dx = enemy2.pos.x - enemy1.pos.x
-                dy = enemy2.pos.y - enemy1.pos.y
-                distance = math.sqrt(dx * dx + dy * dy)
-
-                # Si les ennemis sont trop proches, les repousse
-                min_distance = 60  # Distance minimale entre ennemis
-                if distance < min_distance and distance > 0:
-                    # Normalise la direction
-                    nx = dx / distance
-                    ny = dy / distance
-
-                    # Force de répulsion
-                    push_force = (min_distance - distance) * 0.5
-
-                    # Applique la force aux deux ennemis
-                    enemy1.pos.x -= nx * push_force
-                    enemy1.pos.y -= ny * push_force
-                    enemy2.pos.x += nx * push_force
-                    enemy2.pos.y += ny * push_force
-
-        # Met à jour les graines
-        for seed in self.seeds[:]:
-            seed.update(dt)
-
-        # Collecte des graines
+        systems.separation(
+            enemies,
+            ENEMY_MIN_DISTANCE,
+            strength=0.5,
+            grid=self.separation_grid
+        )
+
+        # Aimant puis collecte des graines (seules les graines des cellules
+        # proches du joueur sont testées)
         if self.player.alive:
-            for seed in self.seeds[:]:
-                dx = seed.pos.x - self.player.pos.x
-                dy = seed.pos.y - self.player.pos.y
-                distance = math.sqrt(dx * dx + dy * dy)
-
-                # Si le joueur est assez proche, collecte la graine
-                if distance < 40:
-                    self.seeds_collected += 1
-                    self.seeds.remove(seed)
-                    # Particules dorées
-                    self.particle_system.emit(
-                        seed.pos.x,
-                        seed.pos.y,
-                        count=10,
-                        color=(255, 220, 100)
-                    )
+            self.seeds.attract(
+                self.player.pos.x,
+                self.player.pos.y,
+                self.magnet_range,
+                SEED_MAGNET_SPEED,
+                dt
+            )
+            for seed_x, seed_y in self.seeds.collect(self.player.pos.x, self.player.pos.y,
+                                                     SEED_PICKUP_RADIUS):
+                self.seeds_collected += 1
+                # Particules dorées
+                self.particle_system.emit(
+                    seed_x,
+                    seed_y,
+                    count=10,
+                    color=(255, 220, 100)
+                )
 
         # Met à jour les particules
         self.particle_system.update(dt)
@@ -903,15 +1002,64 @@ class WaveScene(Scene):
 
         # Game Over
         if not self.player.alive:
-            # Passe les stats à la scène game_over
-            game_over_scene = self.game.scene_manager.scenes['game_over']
-            game_over_scene.set_stats(
-                score=self.score,
-                wave=self.wave_number,
-                enemies_killed=self.enemies_killed,
-                time_survived=self.wave_time
-            )
-            self.game.scene_manager.change_scene('game_over')
+            self._game_over()
+
+    def state_hash(self):
+        """
+        Empreinte de l'état de jeu (sans les particules, purement visuelles).
+
+        Deux parties lancées avec la même graine et les mêmes entrées
+        doivent donner la même empreinte au même tick.
+
+        Returns:
+            str: Empreinte SHA-256 en hexadécimal
+        """
+        digest = hashlib.sha256()
+        player = self.player
+        digest.update(repr((
+            player.pos.x, player.pos.y, player.health, player.shoot_timer,
+            self.score, self.enemies_killed, self.seeds_collected,
+            self.enemies_spawned, self.scheduler.time, self.wave_time, self.tick,
+            self.spawn_handle.time if self.spawn_handle else None,
+            self.spawn_remaining,
+            tuple(self.fire_handles[entity_id].time for entity_id in sorted(self.fire_handles))
+        )).encode())
+
+        for archetype in (self.enemies, self.player_shots, self.enemy_shots):
+            for name in sorted(archetype.columns):
+                digest.update(archetype[name].tobytes())
+        digest.update(self.seeds.pos[:self.seeds.count].tobytes())
+        return digest.hexdigest()
+
+    def snapshot(self):
+        """
+        État à dessiner, au format de snapshot_layout() (voir RemoteWaveScene).
+
+        Returns:
+            dict: Champ -> lignes à publier
+        """
+        player = self.player
+        outcome = self.game.scene_manager.next_scene
+        values = {
+            'player.pos': [(player.pos.x, player.pos.y)],
+            'player.prev_pos': [(player.prev_pos.x, player.prev_pos.y)],
+            'player.state': [(player.health, player.max_health, player.current_sprite,
+                              player.alive)],
+            'counters': [(self.score, self.enemies_killed, self.seeds_collected,
+                          self.show_intro,
+                          SNAPSHOT_OUTCOMES.index(outcome) if outcome in SNAPSHOT_OUTCOMES else 0)],
+            'wave_time': [self.wave_time],
+            'seeds.pos': self.seeds.pos[:self.seeds.count],
+            'seeds.spawn_time': self.seeds.spawn_time[:self.seeds.count],
+        }
+        for name, columns in SNAPSHOT_ARCHETYPES.items():
+            archetype = getattr(self, name)
+            for column in columns:
+                values[f'{name}.{column}'] = archetype[column]
+        particles = self.particle_system
+        for field in PARTICLE_FIELDS:
+            values[f'particles.{field}'] = getattr(particles, field)[:particles.count]
+        return values
 
     def _complete_wave(self):
         """Vague terminée."""
@@ -928,176 +1076,353 @@ class WaveScene(Scene):
         )
         self.game.scene_manager.change_scene('victory')
 
+    def _game_over(self):
+        """Joueur mort."""
+        # Passe les stats à la scène game_over
+        game_over_scene = self.game.scene_manager.scenes['game_over']
+        game_over_scene.set_stats(
+            score=self.score,
+            wave=self.wave_number,
+            enemies_killed=self.enemies_killed,
+            time_survived=self.wave_time
+        )
+        self.game.scene_manager.change_scene('game_over')
+
     def draw(self, screen):
         """Dessine la vague."""
-        # Fond pastel nature
-        screen.fill((170, 200, 180))
+        # Interpolation entre les deux derniers ticks de simulation
+        alpha = self._render_alpha()
 
-        # Grille subtile
-        self._draw_grid(screen)
+        # Fond, grille et décorations : une seule copie du fond précalculé
+        screen.blit(self.background, (0, 0))
 
-        # Décorations (arbres et buissons en arrière-plan)
-        for decoration in self.decorations:
-            decoration.draw(screen)
+        self._draw_world(screen, alpha)
+        self._draw_hud(screen)
+
+        # Menu shop en jeu (Tab)
+        if self.show_shop_menu:
+            self._draw_shop_menu(screen)
 
-        # Graines
-        for seed in self.seeds:
-            seed.draw(screen)
+        # Intro
+        if self.show_intro:
+            overlay = pygame.Surface((self.settings.window_width, self.settings.window_height))
+            overlay.set_alpha(200)
+            overlay.fill((0, 0, 0))
+            screen.blit(overlay, (0, 0))
+
+            font_large = self.game.assets.get_font('large')
+            if not font_large:
+                font_large = self.game.assets.font(None, 72)
+
+            intro_text = Text(
+                f"VAGUE {self.wave_number}",
+                self.settings.window_width // 2,
+                self.settings.window_height // 2 - 40,
+                font_large,
+                (255, 200, 100),
+                center=True
+            )
+            intro_text.draw(screen)
+
+            font_medium = self.game.assets.get_font('medium')
+            if not font_medium:
+                font_medium = self.game.assets.font(None, 36)
+
+            # Message dynamique selon le niveau
+            if self.wave_number == 1:
+                msg = "Bougez avec la souris et tirez automatiquement !"
+            else:
+                msg = f"{self.enemies_to_spawn} ennemis à éliminer - Bonne chance !"
+
+            sub_text = Text(
+                msg,
+                self.settings.window_width // 2,
+                self.settings.window_height // 2 + 40,
+                font_medium,
+                (200, 200, 200),
+                center=True
+            )
+            sub_text.draw(screen)
+
+    def draw_dirty(self, screen, dirty):
+        """
+        Dessine la vague en ne redessinant que ce qui bouge (mode dirty rects).
+
+        Les zones de la frame précédente sont effacées avec le fond
+        précalculé, puis les entités et l'interface sont redessinées et
+        leurs rectangles signalés à dirty. L'intro et le menu shop couvrent
+        tout l'écran : la frame est alors entièrement redessinée.
+        """
+        if self.show_intro or self.show_shop_menu:
+            self.draw(screen)
+            dirty.invalidate()
+            return
+
+        alpha = self._render_alpha()
+        dirty.restore(screen, self.background)
+        self._draw_world(screen, alpha)
+        self._draw_hud(screen)
+        dirty.add_many(self._world_rects(alpha))
+        dirty.add_many(self._hud_rects())
+
+    def _render_alpha(self):
+        """Fraction du tick écoulée depuis le dernier tick simulé (0 à 1)."""
+        return self.game.render_alpha
+
+    def _draw_world(self, screen, alpha):
+        """Dessine les graines, les entités, les projectiles et les particules."""
+        # Graines (flottement calculé à partir du temps de la vague)
+        self.seeds.draw(screen, self.seed_image, self.wave_time)
 
         # Entités
-        for enemy in self.enemies:
-            enemy.draw(screen)
+        self._draw_enemies(screen, alpha)
 
         # Projectiles
-        for proj in self.projectiles:
-            proj.draw(screen)
+        self._draw_shots(screen, self.player_shots, alpha, (255, 200, 50), (255, 255, 100))
+        self._draw_shots(screen, self.enemy_shots, alpha, (200, 50, 50), (255, 100, 100))
 
         if self.player.alive:
-            self.player.draw(screen)
+            self.player.draw(screen, alpha=alpha)
 
         # Particules
         self.particle_system.draw(screen)
 
+    def _draw_hud(self, screen):
+        """Dessine l'interface (barre du haut et instructions)."""
         # ===== UI EN HAUT DE L'ÉCRAN EN COLONNES =====
-        font_ui = pygame.font.Font(None, 28)
-        font_title = pygame.font.Font(None, 36)
+        # Titre rendu via le cache de texte, compteurs assemblés à partir de
+        # glyphes pré-rendus : aucune rastérisation pendant la partie
+        font_title = self.font_title
         y_pos = 15
 
         # Barre de fond semi-transparente pour l'UI
-        ui_bar = pygame.Surface((self.game.config.window_width, 50))
+        ui_bar = pygame.Surface((self.settings.window_width, 50))
         ui_bar.set_alpha(150)
         ui_bar.fill((40, 40, 50))
         screen.blit(ui_bar, (0, 0))
 
         # Colonne 1: Vague (centrée)
         wave_text = f"VAGUE {self.wave_number}"
-        wave_surface = font_title.render(wave_text, True, (255, 200, 100))
-        wave_x = self.game.config.window_width // 2 - wave_surface.get_width() // 2
+        wave_surface = text_cache.render(font_title, wave_text, True, (255, 200, 100))
+        wave_x = self.settings.window_width // 2 - wave_surface.get_width() // 2
         screen.blit(wave_surface, (wave_x, y_pos))
 
         # Colonne 2 (gauche): Score
-        score_text = f"Score: {self.score}"
-        score_surface = font_ui.render(score_text, True, (255, 255, 255))
-        screen.blit(score_surface, (20, y_pos + 5))
+        self.score_glyphs.draw(screen, f"Score: {self.score}", (20, y_pos + 5))
 
         # Colonne 3 (sous score): Vie
         hp_text = f"Vie: {self.player.health}/{self.player.max_health}"
-        hp_color = (255, 100, 100) if self.player.health < self.player.max_health / 2 else (100, 255, 100)
-        hp_surface = font_ui.render(hp_text, True, hp_color)
-        screen.blit(hp_surface, (150, y_pos + 5))
+        hp_glyphs = self.hp_low_glyphs if self.player.health < self.player.max_health / 2 else self.hp_glyphs
+        hp_glyphs.draw(screen, hp_text, (150, y_pos + 5))
 
         # Colonne 4 (droite): Graines avec sprite
         seeds_text = f"Graines: {self.seeds_collected}"
-        seeds_surface = font_ui.render(seeds_text, True, (255, 220, 100))
-        seeds_x = self.game.config.window_width - seeds_surface.get_width() - 200
+        seeds_x = self.settings.window_width - self.seeds_glyphs.width(seeds_text) - 200
 
         # Dessine le sprite de graine à côté du texte
-        if self.seed_image:
-            # Version bien visible du sprite (70x70)
-            small_seed = pygame.transform.scale(self.seed_image, (70, 70))
-            screen.blit(small_seed, (seeds_x - 75, y_pos - 30))
+        if self.hud_seed_image:
+            screen.blit(self.hud_seed_image, (seeds_x - 75, y_pos - 30))
 
-        screen.blit(seeds_surface, (seeds_x, y_pos + 5))
+        self.seeds_glyphs.draw(screen, seeds_text, (seeds_x, y_pos + 5))
 
         # Colonne 5 (droite): Ennemis
         enemy_text = f"Ennemis: {self.enemies_killed}/{self.enemies_to_spawn}"
-        enemy_surface = font_ui.render(enemy_text, True, (255, 150, 150))
-        enemy_x = self.game.config.window_width - enemy_surface.get_width() - 20
-        screen.blit(enemy_surface, (enemy_x, y_pos + 5))
+        enemy_x = self.settings.window_width - self.enemy_glyphs.width(enemy_text) - 20
+        self.enemy_glyphs.draw(screen, enemy_text, (enemy_x, y_pos + 5))
 
         # Instructions (en bas)
-        font_instructions = pygame.font.Font(None, 22)
-        instructions = Text(
-            "Souris: déplacer | Tir: automatique | ESC: menu",
-            self.game.config.window_width // 2,
-            self.game.config.window_height - 20,
-            font_instructions,
-            (100, 100, 100),
-            center=True
+        self.instructions.draw(screen)
+
+    def _hud_rects(self):
+        """Zones occupées par l'interface dessinée par _draw_hud."""
+        width = self.settings.window_width
+        height = self.settings.window_height
+        # Barre du haut (et l'icône de graine qui dépasse) et instructions en bas
+        return [pygame.Rect(0, 0, width, 60), pygame.Rect(0, height - 35, width, 30)]
+
+    def _world_rects(self, alpha):
+        """
+        Rectangles englobants des éléments dessinés par _draw_world.
+
+        Args:
+            alpha: Interpolation utilisée pour le dessin
+
+        Returns:
+            list: Rectangles pygame
+        """
+        rects = []
+
+        seeds = self.seeds
+        if seeds.count:
+            if self.seed_image:
+                width, height = self.seed_image.get_size()
+            else:
+                width, height = 18, 18
+            margin = seeds.bob_height + 1
+            for x, y in seeds.pos[:seeds.count].tolist():
+                rects.append(pygame.Rect(x - width // 2 - 1, y - height // 2 - margin,
+                                         width + 2, height + 2 * margin))
+
+        # Ennemis (image 80x80 avec rebond de 3 px et barre de vie au-dessus)
+        # et projectiles (cercle de rayon 4)
+        for archetype, half, top, size in ((self.enemies, 40, 53, (80, 96)),
+                                           (self.player_shots, 5, 5, (10, 10)),
+                                           (self.enemy_shots, 5, 5, (10, 10))):
+            if archetype.count == 0:
+                continue
+            prev = archetype['prev_pos']
+            positions = (prev + (archetype['pos'] - prev) * alpha).tolist()
+            rects.extend(pygame.Rect(x - half, y - top, *size) for x, y in positions)
+
+        if self.player.alive:
+            draw_pos = self.player.lerp_pos(alpha)
+            rects.append(pygame.Rect(draw_pos.x - 41, draw_pos.y - 41, 82, 82))
+
+        particles = self.particle_system
+        if particles.count:
+            n = particles.count
+            sizes = (particles.size[:n] * 2 + 2).tolist()
+            rects.extend(pygame.Rect(x - 1, y - 1, size, size)
+                         for (x, y), size in zip(particles.pos[:n].tolist(), sizes))
+        return rects
+
+    def _draw_enemies(self, screen, alpha):
+        """Dessine les ennemis (positions interpolées selon alpha)."""
+        enemies = self.enemies
+        n = enemies.count
+        if n == 0:
+            return
+
+        prev = enemies['prev_pos']
+        positions = (prev + (enemies['pos'] - prev) * alpha).tolist()
+        rows = zip(
+            positions,
+            enemies['kind'].tolist(),
+            enemies['frame'].tolist(),
+            enemies['anim_timer'].tolist(),
+            enemies['health'].tolist(),
+            enemies['max_health'].tolist()
         )
-        instructions.draw(screen)
 
-        # Menu shop en jeu (Tab)
-        if self.show_shop_menu:
-            self._draw_shop_menu(screen)
+        for (x, y), kind, frame, anim_timer, health, max_health in rows:
+            frames = self.enemy_frames[kind]
+            if frames:
+                # Animation avec rebond
+                offset_y = math.sin(anim_timer * 10) * 3
+                screen.blit(frames[frame % len(frames)], (x - 40, y - 40 + offset_y))
+            else:
+                # Fallback selon le type
+                color = ENEMY_STATS[ENEMY_KINDS[kind]]['color']
+                pygame.draw.rect(screen, color, (x - 24, y - 24, 48, 48))
+
+            # Barre de vie au-dessus de l'ennemi
+            if health < max_health:
+                self._draw_enemy_health(screen, x, y, health / max_health)
+
+    def _draw_enemy_health(self, screen, x, y, health_percent):
+        """Dessine la barre de vie d'un ennemi centrée au-dessus de (x, y)."""
+        bar_width = 60
+        bar_height = 6
+        bar_x = x - bar_width // 2
+        bar_y = y - 50
+
+        # Fond de la barre (rouge foncé)
+        pygame.draw.rect(screen, (80, 20, 20),
+                       (bar_x, bar_y, bar_width, bar_height))
+
+        # Barre de vie (vert -> jaune -> rouge selon le pourcentage)
+        current_bar_width = int(bar_width * health_percent)
+
+        if health_percent > 0.6:
+            bar_color = (50, 200, 50)  # Vert
+        elif health_percent > 0.3:
+            bar_color = (255, 200, 50)  # Jaune
+        else:
+            bar_color = (255, 50, 50)  # Rouge
 
-        # Intro
-        if self.show_intro:
-            overlay = pygame.Surface((self.game.config.window_width, self.game.config.window_height))
-            overlay.set_alpha(200)
-            overlay.fill((0, 0, 0))
-            screen.blit(overlay, (0, 0))
+        if current_bar_width > 0:
+            pygame.draw.rect(screen, bar_color,
+                           (bar_x, bar_y, current_bar_width, bar_height))
 
-            font_large = self.game.assets.get_font('large')
-            if not font_large:
-                font_large = pygame.font.Font(None, 72)
+        # Bordure de la barre
+        pygame.draw.rect(screen, (200, 200, 200),
+                       (bar_x, bar_y, bar_width, bar_height), 1)
 
-            intro_text = Text(
-                f"VAGUE {self.wave_number}",
-                self.game.config.window_width // 2,
-                self.game.config.window_height // 2 - 40,
-                font_large,
-                (255, 200, 100),
-                center=True
-            )
-            intro_text.draw(screen)
+    def _draw_shots(self, screen, shots, alpha, color, core_color):
+        """Dessine un archétype de projectiles (positions interpolées selon alpha)."""
+        if shots.count == 0:
+            return
 
-            font_medium = self.game.assets.get_font('medium')
-            if not font_medium:
-                font_medium = pygame.font.Font(None, 36)
+        prev = shots['prev_pos']
+        positions = (prev + (shots['pos'] - prev) * alpha).tolist()
+        for x, y in positions:
+            center = (int(x), int(y))
+            pygame.draw.circle(screen, color, center, 4)
+            pygame.draw.circle(screen, core_color, center, 2)
 
-            # Message dynamique selon le niveau
-            if self.wave_number == 1:
-                msg = "Bougez avec la souris et tirez automatiquement !"
-            else:
-                msg = f"{self.enemies_to_spawn} ennemis à éliminer - Bonne chance !"
+    def _bake_background(self):
+        """
+        Compose le fond statique de la vague sur une surface opaque.
 
-            sub_text = Text(
-                msg,
-                self.game.config.window_width // 2,
-                self.game.config.window_height // 2 + 40,
-                font_medium,
-                (200, 200, 200),
-                center=True
-            )
-            sub_text.draw(screen)
+        Rien ne bouge dans le fond pendant une vague : la couleur, la grille
+        et les décorations (sprites ou formes de secours) sont dessinées une
+        fois, puis le fond est copié d'un bloc à chaque frame, quel que soit
+        le nombre de décorations.
+
+        Returns:
+            Surface pygame de la taille de la fenêtre
+        """
+        background = pygame.Surface((self.settings.window_width, self.settings.window_height))
+
+        # Fond pastel nature
+        background.fill((170, 200, 180))
+
+        # Grille subtile
+        self._draw_grid(background)
+
+        # Décorations (arbres et buissons en arrière-plan)
+        for decoration in self.decorations:
+            decoration.draw(background)
+
+        # Même format de pixels que l'écran : la copie n'a pas de conversion à faire
+        return background.convert()
 
     def _draw_grid(self, screen):
         """Dessine une grille de fond."""
         grid_size = 50
         color = (180, 210, 190)
 
-        for x in range(0, self.game.config.window_width, grid_size):
-            pygame.draw.line(screen, color, (x, 0), (x, self.game.config.window_height), 1)
+        for x in range(0, self.settings.window_width, grid_size):
+            pygame.draw.line(screen, color, (x, 0), (x, self.settings.window_height), 1)
 
-        for y in range(0, self.game.config.window_height, grid_size):
-            pygame.draw.line(screen, color, (0, y), (self.game.config.window_width, y), 1)
+        for y in range(0, self.settings.window_height, grid_size):
+            pygame.draw.line(screen, color, (0, y), (self.settings.window_width, y), 1)
 
     def _draw_shop_menu(self, screen):
         """Dessine le menu shop en jeu."""
         # Overlay sombre
-        overlay = pygame.Surface((self.game.config.window_width, self.game.config.window_height))
+        overlay = pygame.Surface((self.settings.window_width, self.settings.window_height))
         overlay.set_alpha(180)
         overlay.fill((0, 0, 0))
         screen.blit(overlay, (0, 0))
 
         # Polices
-        font_title = pygame.font.Font(None, 60)
-        font_big = pygame.font.Font(None, 40)
-        font_medium = pygame.font.Font(None, 32)
-        font_small = pygame.font.Font(None, 24)
+        font_title = self.game.assets.font(None, 60)
+        font_big = self.game.assets.font(None, 40)
+        font_medium = self.game.assets.font(None, 32)
+        font_small = self.game.assets.font(None, 24)
 
-        center_x = self.game.config.window_width // 2
+        center_x = self.settings.window_width // 2
 
         # Titre
-        title = font_title.render("AMELIORATIONS", True, (255, 220, 100))
+        title = text_cache.render(font_title, "AMELIORATIONS", True, (255, 220, 100))
         title_rect = title.get_rect(center=(center_x, 80))
         screen.blit(title, title_rect)
 
         # Graines disponibles (total global + collectées dans cette vague)
         total_seeds = player_upgrades.seeds + self.seeds_collected
         seeds_text = f"Graines disponibles: {total_seeds}"
-        seeds_surface = font_big.render(seeds_text, True, (255, 220, 100))
+        seeds_surface = text_cache.render(font_big, seeds_text, True, (255, 220, 100))
         seeds_rect = seeds_surface.get_rect(center=(center_x, 130))
         screen.blit(seeds_surface, seeds_rect)
 
@@ -1121,7 +1446,7 @@ class WaveScene(Scene):
 
             # Fond
             bg_color = (60, 70, 80) if is_selected else (40, 50, 60)
-            box_rect = pygame.Rect(200, y, self.game.config.window_width - 400, item_height - 10)
+            box_rect = pygame.Rect(200, y, self.settings.window_width - 400, item_height - 10)
             pygame.draw.rect(screen, bg_color, box_rect, border_radius=8)
 
             # Bordure si sélectionné
@@ -1130,15 +1455,15 @@ class WaveScene(Scene):
 
             # Nom
             name_color = color if can_afford or is_maxed else (150, 150, 150)
-            name_surface = font_big.render(name, True, name_color)
+            name_surface = text_cache.render(font_big, name, True, name_color)
             screen.blit(name_surface, (220, y + 10))
 
             # Description
-            desc_surface = font_small.render(desc, True, (180, 180, 180))
+            desc_surface = text_cache.render(font_small, desc, True, (180, 180, 180))
             screen.blit(desc_surface, (220, y + 45))
 
             # Barres de niveau
-            bar_x = self.game.config.window_width - 350
+            bar_x = self.settings.window_width - 350
             for lvl in range(player_upgrades.max_level):
                 bar_rect = pygame.Rect(bar_x + lvl * 22, y + 15, 18, 25)
                 if lvl < level:
@@ -1147,7 +1472,7 @@ class WaveScene(Scene):
                     pygame.draw.rect(screen, (80, 80, 80), bar_rect, border_radius=2)
 
             # Coût
-            cost_x = self.game.config.window_width - 230
+            cost_x = self.settings.window_width - 230
             if is_maxed:
                 cost_text = "MAX"
                 cost_color = (100, 255, 100)
@@ -1155,12 +1480,148 @@ class WaveScene(Scene):
                 cost_text = f"{cost}"
                 cost_color = (255, 220, 100) if can_afford else (255, 100, 100)
 
-            cost_surface = font_medium.render(cost_text, True, cost_color)
+            cost_surface = text_cache.render(font_medium, cost_text, True, cost_color)
             screen.blit(cost_surface, (cost_x, y + 20))
 
         # Instructions en bas
-        inst_y = self.game.config.window_height - 60
+        inst_y = self.settings.window_height - 60
         inst_text = "HAUT/BAS: Naviguer | SPACE: Acheter | TAB/ESC: Fermer"
-        inst_surface = font_medium.render(inst_text, True, (150, 150, 150))
+        inst_surface = text_cache.render(font_medium, inst_text, True, (150, 150, 150))
         inst_rect = inst_surface.get_rect(center=(center_x, inst_y))
         screen.blit(inst_surface, inst_rect)
+
+
+class RemoteWaveScene(WaveScene):
+    """
+    Vague simulée dans un processus séparé (voir game/sim_worker.py).
+
+    Le processus de simulation fait avancer une WaveScene à pas fixes et
+    publie à chaque tick l'état à dessiner dans un SharedDoubleBuffer.
+    Cette scène ne simule rien : elle envoie la position de la souris,
+    recopie le dernier état publié et le dessine avec le code de
+    WaveScene. Sur une machine multicœur, la simulation et le rendu ne se
+    ralentissent plus l'un l'autre.
+
+    Le menu d'améliorations en jeu (TAB) n'est pas disponible dans ce mode.
+    """
+
+    def on_enter(self):
+        """Prépare l'affichage puis lance le processus de simulation."""
+        # Assets, joueur et décorations comme une vague locale ; le
+        # processus de simulation reçoit la graine de la vague (wave_seed)
+        super().on_enter()
+
+        # Importés ici : multiprocessing et la mémoire partagée n'existent
+        # pas dans la version web (pygbag). game/ (dossier de main.py) est
+        # dans le path.
+        import multiprocessing
+        import sim_worker
+        from utils.shared_buffer import SharedDoubleBuffer
+
+        context = multiprocessing.get_context('spawn')
+        self.state = SharedDoubleBuffer(snapshot_layout())
+        self.inputs = SharedDoubleBuffer(INPUT_LAYOUT)
+        self.stop_event = context.Event()
+        self.frame = 0  # Dernière publication recopiée
+        self.published_at = 0.0  # Instant de cette publication (perf_counter)
+
+        upgrades = {
+            name: getattr(player_upgrades, name)
+            for name in ('health_level', 'speed_level', 'damage_level', 'fire_rate_level')
+        }
+        self.worker = context.Process(
+            target=sim_worker.run,
+            args=(self.wave_number, self.wave_seed, upgrades,
+                  self.state.name, self.inputs.name, self.stop_event),
+            daemon=True
+        )
+        self.worker.start()
+
+    def on_exit(self):
+        """Arrête le processus de simulation et libère la mémoire partagée."""
+        self.stop_event.set()
+        self.worker.join(timeout=1.0)
+        if self.worker.is_alive():
+            self.worker.terminate()
+            self.worker.join()
+        self.state.close()
+        self.inputs.close()
+        super().on_exit()
+
+    def handle_events(self, events):
+        """Gère les événements (pas de menu d'améliorations)."""
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                self.game.scene_manager.change_scene('menu')
+
+    def update(self, dt):
+        """Envoie la souris et recopie le dernier état publié."""
+        self.inputs.publish({'mouse': [self.game.input.get_mouse_pos()]})
+
+        if self.state.frame == self.frame:
+            if not self.worker.is_alive():
+                print(f"Processus de simulation arrêté (code {self.worker.exitcode})")
+                self.game.scene_manager.change_scene('menu')
+            return
+
+        self.frame, data = self.state.read()
+        outcome = self._apply_snapshot(data)
+        if outcome == 'victory':
+            self._complete_wave()
+        elif outcome == 'game_over':
+            self._game_over()
+
+    def _render_alpha(self):
+        """
+        Fraction du tick du processus de simulation écoulée depuis la
+        dernière publication : les ticks du processus principal n'ont pas
+        lieu aux mêmes instants et render_alpha ne les décrit pas.
+        """
+        elapsed = time.perf_counter() - self.published_at
+        return min(max(elapsed / self.game.tick_duration, 0.0), 1.0)
+
+    def _apply_snapshot(self, data):
+        """
+        Recopie un état publié par WaveScene.snapshot().
+
+        Args:
+            data: Dictionnaire champ -> lignes (SharedDoubleBuffer.read)
+
+        Returns:
+            Issue de la vague ('victory', 'game_over') ou None
+        """
+        player = self.player
+        (player.pos.x, player.pos.y), = data['player.pos'].tolist()
+        (player.prev_pos.x, player.prev_pos.y), = data['player.prev_pos'].tolist()
+        health, max_health, sprite, alive = data['player.state'][0].tolist()
+        player.health = health
+        player.max_health = max_health
+        player.current_sprite = sprite
+        player.alive = bool(alive)
+
+        score, killed, seeds, intro, outcome = data['counters'][0].tolist()
+        self.score = score
+        self.enemies_killed = killed
+        self.seeds_collected = seeds
+        self.show_intro = bool(intro)
+        self.wave_time = float(data['wave_time'][0])
+        self.published_at = float(data['published_at'][0])
+
+        for name, columns in SNAPSHOT_ARCHETYPES.items():
+            archetype = getattr(self, name)
+            archetype.clear()
+            count = len(data[f'{name}.pos'])
+            if count:
+                archetype.spawn(count, **{column: data[f'{name}.{column}'] for column in columns})
+
+        self.seeds.clear()
+        for (x, y), spawn_time in zip(data['seeds.pos'].tolist(),
+                                      data['seeds.spawn_time'].tolist()):
+            self.seeds.spawn(x, y, spawn_time)
+
+        particles = self.particle_system
+        particles.count = len(data['particles.pos'])
+        for field in PARTICLE_FIELDS:
+            getattr(particles, field)[:particles.count] = data[f'particles.{field}']
+
+        return SNAPSHOT_OUTCOMES[outcome]
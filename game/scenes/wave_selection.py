@@ -9,14 +9,16 @@ if template_path not in sys.path:
 
 import pygame
 from scenes.scene_manager import Scene
+from entities import text_cache
 from entities.ui import Button, Text
 
 
 class WaveCard:
     """Carte représentant une vague."""
 
-    def __init__(self, x, y, width, height, wave_number, description, difficulty):
+    def __init__(self, x, y, width, height, wave_number, description, difficulty, assets):
         self.rect = pygame.Rect(x, y, width, height)
+        self.assets = assets  # AssetManager : polices partagées
         self.wave_number = wave_number
         self.description = description
         self.difficulty = difficulty
@@ -52,24 +54,24 @@ class WaveCard:
         pygame.draw.rect(screen, (180, 180, 200), self.rect, 3, border_radius=10)  # Bordure pastel
 
         # Numéro de vague - Texte sombre sur fond pastel
-        font_large = pygame.font.Font(None, 48)
-        wave_text = font_large.render(f"Vague {self.wave_number}", True, (80, 70, 90))
+        font_large = self.assets.font(None, 48)
+        wave_text = text_cache.render(font_large, f"Vague {self.wave_number}", True, (80, 70, 90))
         wave_rect = wave_text.get_rect(center=(self.rect.centerx, self.rect.y + 40))
         screen.blit(wave_text, wave_rect)
 
         # Description - Texte sombre
-        font_small = pygame.font.Font(None, 20)
+        font_small = self.assets.font(None, 20)
         desc_lines = self.description.split('\n')
         y_offset = self.rect.y + 80
         for line in desc_lines:
-            desc_text = font_small.render(line, True, (90, 80, 100))
+            desc_text = text_cache.render(font_small, line, True, (90, 80, 100))
             desc_rect = desc_text.get_rect(center=(self.rect.centerx, y_offset))
             screen.blit(desc_text, desc_rect)
             y_offset += 25
 
         # Difficulté - Couleur pastel chaude
-        font_medium = pygame.font.Font(None, 28)
-        diff_text = font_medium.render(self.difficulty, True, (200, 120, 140))  # Rose-pêche pastel
+        font_medium = self.assets.font(None, 28)
+        diff_text = text_cache.render(font_medium, self.difficulty, True, (200, 120, 140))  # Rose-pêche pastel
         diff_rect = diff_text.get_rect(center=(self.rect.centerx, self.rect.bottom - 25))
         screen.blit(diff_text, diff_rect)
 
@@ -90,14 +92,14 @@ class WaveSelectionScene(Scene):
         font_medium = self.game.assets.get_font('medium')
 
         if not font_large:
-            font_large = pygame.font.Font(None, 60)
+            font_large = self.game.assets.font(None, 60)
         if not font_medium:
-            font_medium = pygame.font.Font(None, 36)
+            font_medium = self.game.assets.font(None, 36)
 
         # Titre - Violet pastel
         self.title = Text(
             "SELECTION DE VAGUE",
-            self.game.config.window_width // 2,
+            self.settings.window_width // 2,
             50,
             font_large,
             (180, 140, 200),  # Violet pastel
@@ -113,7 +115,7 @@ class WaveSelectionScene(Scene):
         cards_per_row = 5
         rows = 4  # 5x4 = 20 vagues
 
-        start_x = (self.game.config.window_width - (cards_per_row * card_width + (cards_per_row - 1) * spacing_x)) // 2
+        start_x = (self.settings.window_width - (cards_per_row * card_width + (cards_per_row - 1) * spacing_x)) // 2
         start_y = 120
 
         for i in range(1, 21):  # 20 vagues
@@ -141,14 +143,15 @@ class WaveSelectionScene(Scene):
                 card_x, card_y, card_width, card_height,
                 i,
                 desc,
-                difficulty
+                difficulty,
+                self.game.assets
             )
             self.wave_cards.append(card)
 
         # Bouton retour - Gris pastel
         self.back_button = Button(
-            (self.game.config.window_width - 250) // 2,
-            self.game.config.window_height - 100,
+            (self.settings.window_width - 250) // 2,
+            self.settings.window_height - 100,
             250, 50,
             "RETOUR", font_medium,
             color=(200, 200, 210),  # Gris pastel
@@ -156,11 +159,11 @@ class WaveSelectionScene(Scene):
         )
 
         # Info supplémentaire - Texte pastel
-        font_small = pygame.font.Font(None, 22)
+        font_small = self.game.assets.font(None, 22)
         self.info_text = Text(
             "Sélectionnez une vague pour commencer. Les vagues plus difficiles offrent plus de récompenses!",
-            self.game.config.window_width // 2,
-            self.game.config.window_height - 150,
+            self.settings.window_width // 2,
+            self.settings.window_height - 150,
             font_small,
             (130, 140, 160),  # Gris-bleu pastel
             center=True
@@ -203,11 +206,11 @@ class WaveSelectionScene(Scene):
 
         # Effet de particules pastel en arrière-plan
         for i in range(10):
-            x = (i * 150 + pygame.time.get_ticks() // 10) % self.game.config.window_width
-            y = (i * 80) % self.game.config.window_height
+            x = (i * 150 + pygame.time.get_ticks() // 10) % self.settings.window_width
+            y = (i * 80) % self.settings.window_height
             # Petites étoiles pastel
             pygame.draw.circle(screen, (255, 220, 230), (int(x), y), 3)
-            pygame.draw.circle(screen, (220, 230, 255), (int(x) + 200, (y + 50) % self.game.config.window_height), 2)
+            pygame.draw.circle(screen, (220, 230, 255), (int(x) + 200, (y + 50) % self.settings.window_height), 2)
 
         self.title.draw(screen)
         self.info_text.draw(screen)
@@ -0,0 +1,85 @@
+"""
+Simulation d'une vague dans un processus séparé (option --sim-worker).
+
+Lancé par RemoteWaveScene : le processus crée un jeu headless, fait
+avancer la WaveScene à pas fixes au rythme du temps réel et publie l'état
+à dessiner à chaque tick dans un SharedDoubleBuffer. La position de la
+souris arrive par un second tampon, écrit par le processus principal.
+"""
+import os
+import time
+
+
+def run(wave_number, wave_seed, upgrades, state_name, input_name, stop):
+    """
+    Simule une vague jusqu'à sa fin ou jusqu'à la demande d'arrêt.
+
+    Args:
+        wave_number: Numéro de la vague à simuler
+        wave_seed: Graine de la vague tirée par le processus principal
+            (WaveScene.wave_seed) : mêmes décorations, mêmes obstacles
+        upgrades: Niveaux des améliorations du joueur (attribut -> niveau)
+        state_name: Nom du tampon où publier l'état (snapshot_layout)
+        input_name: Nom du tampon des entrées (INPUT_LAYOUT)
+        stop: multiprocessing.Event levé pour arrêter la simulation
+    """
+    # Comme les processus de balance.py : pas de gestion des signaux par
+    # SDL (terminate() doit arrêter le processus) ni de message d'accueil
+    os.environ['SDL_NO_SIGNAL_HANDLERS'] = '1'
+    os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    import main
+    from utils.shared_buffer import SharedDoubleBuffer
+    from systems import ScriptedInput
+
+    wave_module = main.wave_system_module
+    for attr_name, level in upgrades.items():
+        setattr(wave_module.player_upgrades, attr_name, level)
+
+    game = main.Game(headless=True, seed=wave_seed, sim_worker=False)
+    state = SharedDoubleBuffer(wave_module.snapshot_layout(), name=state_name)
+    inputs = SharedDoubleBuffer(wave_module.INPUT_LAYOUT, name=input_name)
+    center = (game.config.window_width / 2, game.config.window_height / 2)
+
+    def mouse(tick):
+        """Dernière position de la souris envoyée par le processus principal."""
+        _, data = inputs.read()
+        if data is None:
+            return center
+        return tuple(data['mouse'][0].tolist())
+
+    game.input = ScriptedInput(mouse)
+    scene_name = f'wave{wave_number}'
+    scene = game.scene_manager.scenes[scene_name]
+    scene.seed_override = wave_seed
+    game.scene_manager.change_scene(scene_name)
+
+    tick_duration = game.tick_duration
+    next_tick = time.perf_counter()
+    try:
+        while not stop.is_set():
+            game.input.update([])
+            game.update(tick_duration)
+            snapshot = scene.snapshot()
+            snapshot['published_at'] = [time.perf_counter()]
+            dropped = state.publish(snapshot)
+            if dropped and state.dropped == dropped:
+                # Signalé une fois ; les suivants sont comptés dans state.dropped
+                print(f"État tronqué : {dropped} lignes au-delà de la capacité du tampon")
+
+            # Victoire ou défaite : l'issue est publiée, la simulation s'arrête
+            if game.scene_manager.next_scene:
+                break
+
+            next_tick += tick_duration
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif -delay > tick_duration * game.max_catchup_steps:
+                # Trop de retard : abandonné, comme dans Game.step
+                next_tick = time.perf_counter()
+    finally:
+        if state.dropped:
+            print(f"Lignes ignorées par le tampon d'état : {state.dropped}")
+        state.close()
+        inputs.close()
+        main.pygame.quit()
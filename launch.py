@@ -5,22 +5,39 @@ Usage:
     python launch.py           # Lance le jeu normalement
     python launch.py --web     # Build et lance le serveur web
     python launch.py --build   # Build pour le web sans lancer
+    python launch.py --headless --wave 5   # Simule une vague sans fenêtre
 """
 import sys
 import os
 import subprocess
 import argparse
 
-def run_game():
-    """Lance le jeu normalement."""
-    print("🎮 Lancement du jeu en mode local...")
+def get_python():
+    """Retourne l'interpréteur à utiliser (venv de la template si présent)."""
     venv_python = os.path.join("template", "venv", "bin", "python3")
 
     if os.path.exists(venv_python):
-        subprocess.run([venv_python, "game/main.py"])
-    else:
-        print("⚠️  Environnement virtuel non trouvé, utilisation de python3 système")
-        subprocess.run(["python3", "game/main.py"])
+        return venv_python
+    print("⚠️  Environnement virtuel non trouvé, utilisation de python3 système")
+    return "python3"
+
+def run_game():
+    """Lance le jeu normalement."""
+    print("🎮 Lancement du jeu en mode local...")
+    subprocess.run([get_python(), "game/main.py"])
+
+def run_headless(wave, ticks, bot, seed=None):
+    """Simule une vague sans fenêtre (équilibrage, tests de performance)."""
+    print(f"🤖 Simulation headless de la vague {wave}...")
+    command = [
+        get_python(), "game/main.py", "--headless",
+        "--wave", str(wave),
+        "--ticks", str(ticks),
+        "--bot", bot
+    ]
+    if seed is not None:
+        command += ["--seed", str(seed)]
+    subprocess.run(command)
 
 def build_web():
     """Build le jeu pour le web avec pygbag."""
@@ -76,6 +93,8 @@ Exemples:
   python launch.py           Lance le jeu normalement
   python launch.py --web     Build et lance le serveur web
   python launch.py --build   Build seulement (pour upload itch.io)
+  python launch.py --headless --wave 5 --bot circle
+                             Simule la vague 5 sans fenêtre et affiche les ticks/s
         """
     )
 
@@ -91,6 +110,39 @@ Exemples:
         help="Build pour le web sans lancer le serveur"
     )
 
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Simule une vague sans fenêtre, aussi vite que possible"
+    )
+
+    parser.add_argument(
+        "--wave",
+        type=int,
+        default=1,
+        help="Vague à simuler en mode headless (défaut: 1)"
+    )
+
+    parser.add_argument(
+        "--ticks",
+        type=int,
+        default=36000,
+        help="Nombre maximum de ticks en mode headless (défaut: 36000)"
+    )
+
+    parser.add_argument(
+        "--bot",
+        default="circle",
+        help="Bot qui pilote le joueur en mode headless (idle, circle)"
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Graine de la simulation headless (rejoue une partie à l'identique)"
+    )
+
     args = parser.parse_args()
 
     # Change vers le répertoire du script
@@ -101,6 +153,8 @@ Exemples:
         build_web()
     elif args.web:
         run_web_server()
+    elif args.headless:
+        run_headless(args.wave, args.ticks, args.bot, args.seed)
     else:
         run_game()
 
@@ -10,6 +10,10 @@ case "$1" in
         echo "🔨 Build du jeu pour le web..."
         python3 launch.py --build
         ;;
+    --headless)
+        echo "🤖 Simulation headless..."
+        python3 launch.py "$@"
+        ;;
     *)
         echo "🎮 Lancement du jeu..."
         python3 launch.py
@@ -0,0 +1,5 @@
+"""ECS par archétypes : composants en tableaux NumPy, systèmes par lots."""
+from .world import World, Archetype
+from . import systems
+
+__all__ = ['World', 'Archetype', 'systems']
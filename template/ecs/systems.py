@@ -0,0 +1,336 @@
+"""
+Systèmes ECS : chaque fonction traite des archétypes entiers en une passe.
+
+Composants attendus (à déclarer dans le World) :
+    pos, prev_pos, vel  -- vecteurs (float, 2)
+    speed               -- vitesse de poursuite (float)
+    expires_at          -- instant de destruction (float)
+    anim_timer, anim_speed, frame -- animation (float, float, int)
+    ai_elapsed          -- temps écoulé depuis la dernière mise à jour de l'IA
+
+Chaque opération NumPy a un coût fixe de l'ordre de la microseconde : avec
+une dizaine d'entités (une vague normale), il dépasse le gain du
+traitement par lots. En dessous de SMALL_BATCH lignes, les systèmes les
+plus coûteux traitent donc les lignes une par une sur des listes Python,
+avec les mêmes résultats (voir benchmarks/bench_ecs.py).
+"""
+import math
+import numpy as np
+from systems.collision import CollisionSystem
+
+SMALL_BATCH = 32
+
+
+def movement(world, dt):
+    """
+    Déplace toutes les entités qui ont pos, prev_pos et vel.
+
+    Args:
+        world: World
+        dt: Delta time en secondes
+    """
+    for archetype in world.query('pos', 'prev_pos', 'vel'):
+        n = archetype.count
+        if n == 0:
+            continue
+        pos = archetype['pos']
+        archetype['prev_pos'][:] = pos
+        pos += archetype['vel'] * dt
+
+
+def lifetime(world, time, bounds=None, margin=50):
+    """
+    Détruit les entités expirées (et, optionnellement, sorties de l'écran).
+
+    Args:
+        world: World
+        time: Horloge courante (comparée à expires_at)
+        bounds: Tuple (largeur, hauteur) de l'écran, ou None
+        margin: Distance hors écran avant destruction
+    """
+    for archetype in world.query('expires_at'):
+        n = archetype.count
+        if n == 0:
+            continue
+        if n < SMALL_BATCH:
+            _lifetime_small(archetype, time, bounds, margin)
+            continue
+        dead = archetype['expires_at'] <= time
+        if bounds is not None and 'pos' in archetype:
+            x = archetype['pos'][:, 0]
+            y = archetype['pos'][:, 1]
+            dead |= (x < -margin) | (x > bounds[0] + margin)
+            dead |= (y < -margin) | (y > bounds[1] + margin)
+        if dead.any():
+            archetype.kill(np.flatnonzero(dead))
+
+
+def _lifetime_small(archetype, time, bounds, margin):
+    """lifetime() ligne par ligne, pour quelques entités."""
+    expires = archetype['expires_at'].tolist()
+    if bounds is None or 'pos' not in archetype:
+        dead = [row for row, expires_at in enumerate(expires) if expires_at <= time]
+    else:
+        right = bounds[0] + margin
+        bottom = bounds[1] + margin
+        dead = [
+            row for row, (expires_at, (x, y)) in enumerate(zip(expires, archetype['pos'].tolist()))
+            if expires_at <= time or x < -margin or x > right or y < -margin or y > bottom
+        ]
+    if dead:
+        archetype.kill(dead)
+
+
+def level_of_detail(archetype, dt, tick, target_x, target_y, view, near,
+                    far_rate=4, offscreen_rate=8):
+    """
+    Choisit les entités dont l'IA est mise à jour ce tick.
+
+    Les entités proches de la cible sont mises à jour à chaque tick, les
+    entités éloignées un tick sur far_rate et celles hors de la vue un
+    tick sur offscreen_rate. Le tick de mise à jour est décalé selon
+    l'identifiant de l'entité : les entités lentes se répartissent sur les
+    ticks au lieu d'être toutes traitées ensemble. Chaque entité cumule
+    le temps écoulé depuis sa dernière mise à jour (ai_elapsed), à passer
+    comme pas de temps aux systèmes d'IA.
+
+    Args:
+        archetype: Archétype avec pos et ai_elapsed
+        dt: Delta time du tick en secondes
+        tick: Numéro du tick courant
+        target_x, target_y: Position de la cible (le joueur)
+        view: Rectangle visible (x, y, largeur, hauteur)
+        near: Distance en dessous de laquelle l'IA tourne à chaque tick
+        far_rate: Période (en ticks) des entités éloignées mais visibles
+        offscreen_rate: Période (en ticks) des entités hors de la vue
+
+    Returns:
+        Tuple (rows, elapsed) : lignes à mettre à jour et temps écoulé
+        depuis leur dernière mise à jour
+    """
+    n = archetype.count
+    if n == 0:
+        return np.zeros(0, dtype=int), np.zeros(0)
+
+    elapsed = archetype['ai_elapsed']
+    elapsed += dt
+
+    if n < SMALL_BATCH:
+        rows = _level_of_detail_rows(archetype, tick, target_x, target_y, view, near,
+                                     far_rate, offscreen_rate)
+    else:
+        pos = archetype['pos']
+        offset = pos - (target_x, target_y)
+        close = (offset * offset).sum(axis=1) <= near * near
+        x = pos[:, 0]
+        y = pos[:, 1]
+        visible = (x >= view[0]) & (x <= view[0] + view[2]) & (y >= view[1]) & (y <= view[1] + view[3])
+        rate = np.where(close, 1, np.where(visible, far_rate, offscreen_rate))
+
+        due = ((tick + archetype.ids[:n]) % rate == 0) & archetype.alive[:n]
+        rows = np.flatnonzero(due)
+    step = elapsed[rows]
+    elapsed[rows] = 0
+    return rows, step
+
+
+def _level_of_detail_rows(archetype, tick, target_x, target_y, view, near,
+                          far_rate, offscreen_rate):
+    """Lignes dues de level_of_detail(), ligne par ligne, pour quelques entités."""
+    n = archetype.count
+    near_sq = near * near
+    left, top = view[0], view[1]
+    right = left + view[2]
+    bottom = top + view[3]
+    alive = archetype.alive[:n].tolist()
+    ids = archetype.ids[:n].tolist()
+
+    rows = []
+    for row, (x, y) in enumerate(archetype['pos'].tolist()):
+        if not alive[row]:
+            continue
+        dx = x - target_x
+        dy = y - target_y
+        if dx * dx + dy * dy <= near_sq:
+            rate = 1
+        elif left <= x <= right and top <= y <= bottom:
+            rate = far_rate
+        else:
+            rate = offscreen_rate
+        if (tick + ids[row]) % rate == 0:
+            rows.append(row)
+    return np.array(rows, dtype=int)
+
+
+def chase(archetype, target_x, target_y, flow_field=None, rows=None):
+    """
+    IA de poursuite : fixe la vélocité vers une cible.
+
+    Les entités suivent le champ de flux quand il donne une direction ;
+    près de la cible (ou sans champ), elles la visent en ligne droite.
+
+    Args:
+        archetype: Archétype avec pos, vel et speed
+        target_x, target_y: Position de la cible
+        flow_field: FlowField vers la cible (optionnel)
+        rows: Lignes à mettre à jour (toutes par défaut)
+    """
+    if rows is None:
+        rows = np.arange(archetype.count)
+    if len(rows) == 0:
+        return
+    if len(rows) < SMALL_BATCH:
+        _chase_small(archetype, target_x, target_y, flow_field, rows)
+        return
+
+    pos = archetype['pos'][rows]
+
+    # Ligne droite vers la cible (les entités déjà sur la cible gardent leur vélocité)
+    offset = (target_x, target_y) - pos
+    distance = np.sqrt((offset * offset).sum(axis=1))[:, None]
+    direction = np.divide(offset, distance, out=np.zeros_like(offset), where=distance > 0)
+    moving = distance[:, 0] > 0
+
+    # Suit le champ de flux quand il donne une direction
+    if flow_field is not None:
+        directions, found = flow_field.sample_many(pos)
+        direction[found] = directions[found]
+        moving |= found
+
+    targets = rows[moving]
+    archetype['vel'][targets] = direction[moving] * archetype['speed'][targets, None]
+
+
+def _chase_small(archetype, target_x, target_y, flow_field, rows):
+    """chase() ligne par ligne, pour quelques entités."""
+    positions = archetype['pos'].tolist()
+    speeds = archetype['speed'].tolist()
+    targets = []
+    velocities = []
+    for row in rows.tolist():
+        x, y = positions[row]
+        direction = flow_field.sample(x, y) if flow_field is not None else None
+        if direction is None:
+            dx = target_x - x
+            dy = target_y - y
+            distance = math.sqrt(dx * dx + dy * dy)
+            if distance == 0:
+                continue  # Déjà sur la cible : garde sa vélocité
+            direction = (dx / distance, dy / distance)
+        speed = speeds[row]
+        targets.append(row)
+        velocities.append((direction[0] * speed, direction[1] * speed))
+    if targets:
+        archetype['vel'][targets] = velocities
+
+
+def animate(archetype, dt, frames, rows=None):
+    """
+    Avance les animations (anim_timer, anim_speed, frame).
+
+    Args:
+        archetype: Archétype animé
+        dt: Delta time en secondes (ou tableau, un pas par ligne)
+        frames: Nombre d'images des animations
+        rows: Lignes à mettre à jour (toutes par défaut)
+    """
+    if rows is None:
+        rows = np.arange(archetype.count)
+    if len(rows) == 0:
+        return
+    timer = archetype['anim_timer']
+    timer[rows] += dt
+    done = rows[timer[rows] >= archetype['anim_speed'][rows]]
+    timer[done] = 0
+    frame = archetype['frame']
+    frame[done] = (frame[done] + 1) % max(frames, 1)
+
+
+def swept_hits(shots, targets, radius, reach, grid):
+    """
+    Collisions continues entre des projectiles et des cibles circulaires.
+
+    Le trajet complet du tick (prev_pos -> pos) de chaque projectile vivant
+    est testé. Les projectiles sont rangés dans une grille : seules les
+    paires (projectile, cible) voisines sont testées, toutes en une seule
+    opération vectorisée. Avec moins de SMALL_BATCH² paires, la grille
+    coûte plus qu'elle n'économise : les paires voisines sont alors
+    trouvées en comparant toutes les distances d'un coup. Un projectile ne
+    touche que la première cible rencontrée dans l'ordre des lignes.
+
+    Args:
+        shots: Archétype des projectiles (pos, prev_pos)
+        targets: Archétype des cibles (pos) ou liste de centres (x, y)
+        radius: Rayon de touche autour du centre des cibles
+        reach: Rayon de recherche autour des cibles (radius + distance
+            maximale parcourue par un projectile pendant le tick)
+        grid: SpatialHash réutilisé pour ranger les projectiles
+
+    Returns:
+        Tuple (shot_rows, target_rows, points) : lignes des projectiles qui
+        touchent, ligne de la cible touchée, points de contact (k, 2)
+    """
+    empty = np.zeros(0, dtype=int)
+    if hasattr(targets, 'columns'):
+        centers = targets['pos']
+        target_alive = targets.alive[:targets.count]
+    else:
+        centers = np.asarray(targets, dtype=float).reshape(-1, 2)
+        target_alive = np.ones(len(centers), dtype=bool)
+    if shots.count == 0 or len(centers) == 0:
+        return empty, empty, np.zeros((0, 2))
+
+    ends = shots['pos']
+    shot_alive = shots.alive[:shots.count]
+    if shots.count * len(centers) < SMALL_BATCH * SMALL_BATCH:
+        # Toutes les paires à portée, dans l'ordre des cibles puis des
+        # projectiles (le même que celui des requêtes dans la grille)
+        offset = ends[None, :, :] - centers[:, None, :]
+        in_reach = (offset * offset).sum(axis=2) <= reach * reach
+        in_reach &= target_alive[:, None]
+        pair_targets, pair_shots = np.nonzero(in_reach)
+        if len(pair_shots) == 0:
+            return empty, empty, np.zeros((0, 2))
+    else:
+        grid.clear()
+        grid.insert_many(range(shots.count), ends[:, 0].tolist(), ends[:, 1].tolist())
+
+        pair_shots = []
+        pair_targets = []
+        alive = target_alive.tolist()
+        for target, (x, y) in enumerate(centers.tolist()):
+            if not alive[target]:
+                continue
+            candidates = grid.query(x, y, reach)
+            candidates.sort()
+            pair_shots.extend(candidates)
+            pair_targets.extend([target] * len(candidates))
+        if not pair_shots:
+            return empty, empty, np.zeros((0, 2))
+
+        pair_shots = np.array(pair_shots)
+        pair_targets = np.array(pair_targets)
+    hits, points = CollisionSystem.segments_circles(
+        shots['prev_pos'][pair_shots], ends[pair_shots], centers[pair_targets], radius
+    )
+    hits &= shot_alive[pair_shots]
+
+    # Les paires sont dans l'ordre des cibles : la première occurrence d'un
+    # projectile est la première cible qu'il touche
+    hit_pairs = np.flatnonzero(hits)
+    _, first = np.unique(pair_shots[hit_pairs], return_index=True)
+    hit_pairs = np.sort(hit_pairs[first])
+    return pair_shots[hit_pairs], pair_targets[hit_pairs], points[hit_pairs]
+
+
+def separation(archetype, min_distance, strength=0.5, grid=None):
+    """
+    Repousse les entités trop proches (voir CollisionSystem.separate).
+
+    Args:
+        archetype: Archétype avec pos
+        min_distance: Distance minimale entre deux entités
+        strength: Fraction du chevauchement appliquée à chaque entité
+        grid: SpatialHash réutilisable (optionnel)
+    """
+    CollisionSystem.separate_points(archetype['pos'], min_distance, strength, grid)
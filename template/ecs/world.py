@@ -0,0 +1,258 @@
+"""Monde ECS : entités rangées par archétype dans des tableaux NumPy."""
+import numpy as np
+from entities.pool import PoolStats
+
+
+class Archetype:
+    """
+    Toutes les entités qui ont exactement le même ensemble de composants.
+
+    Chaque composant est une colonne NumPy : les entités vivantes occupent
+    les lignes [0, count[ de toutes les colonnes. Un système traite une
+    colonne entière en une opération au lieu d'appeler une méthode par
+    objet.
+
+    Les lignes restent stables pendant une frame : kill() marque seulement
+    les entités, compact() les retire en conservant l'ordre des autres.
+    Les lignes libérées sont réutilisées : stats compte comme « miss »
+    chaque entité qui a obligé à agrandir les colonnes.
+    """
+
+    def __init__(self, world, names, capacity=64):
+        """
+        Args:
+            world: World propriétaire (fournit les définitions et les ids)
+            names: Noms des composants et des étiquettes de l'archétype
+            capacity: Nombre d'entités préallouées (agrandi au besoin)
+        """
+        self.world = world
+        self.names = frozenset(names)
+        # Les étiquettes n'ont pas de colonne : elles servent aux requêtes
+        self.specs = {name: world.specs[name] for name in sorted(self.names)
+                      if world.specs[name] is not None}
+        self.count = 0
+        self.stats = PoolStats()
+        self.columns = {}
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Alloue (ou agrandit) les colonnes en conservant les entités."""
+        old = self.count
+        columns = {}
+        for name, (dtype, shape) in self.specs.items():
+            column = np.zeros((capacity,) + shape, dtype=dtype)
+            if old:
+                column[:old] = self.columns[name][:old]
+            columns[name] = column
+
+        ids = np.zeros(capacity, dtype=np.int64)
+        alive = np.zeros(capacity, dtype=bool)
+        if old:
+            ids[:old] = self.ids[:old]
+            alive[:old] = self.alive[:old]
+
+        self.capacity = capacity
+        self.columns = columns
+        self.ids = ids
+        self.alive = alive
+
+    def spawn(self, count=1, **values):
+        """
+        Ajoute des entités.
+
+        Args:
+            count: Nombre d'entités à créer
+            **values: Valeur initiale par composant (scalaire, ligne ou un
+                tableau de count lignes) ; les autres composants valent 0
+
+        Returns:
+            slice: Lignes des nouvelles entités
+        """
+        start = self.count
+        end = start + count
+        grown = end > self.capacity
+        if grown:
+            self._allocate(max(end, self.capacity * 2))
+        self.stats.record_acquire(hit=not grown, count=count)
+
+        for name, column in self.columns.items():
+            column[start:end] = values.pop(name, 0)
+        if values:
+            raise KeyError(f"composants absents de l'archétype: {', '.join(values)}")
+
+        self.ids[start:end] = self.world.next_ids(count)
+        self.alive[start:end] = True
+        self.count = end
+        return slice(start, end)
+
+    def kill(self, rows):
+        """Détruit des entités (retirées à la prochaine compaction)."""
+        self.alive[rows] = False
+
+    def compact(self):
+        """
+        Retire les entités détruites en conservant l'ordre des autres.
+
+        Returns:
+            int: Nombre d'entités retirées
+        """
+        n = self.count
+        if self.alive[:n].all():
+            # Rien à retirer (cas de la plupart des ticks)
+            self.stats.set_active(n)
+            return 0
+
+        keep = self.alive[:n].copy()
+        kept = int(np.count_nonzero(keep))
+        for column in self.columns.values():
+            column[:kept] = column[:n][keep]
+        self.ids[:kept] = self.ids[:n][keep]
+        self.alive[:kept] = True
+        self.alive[kept:n] = False
+        self.count = kept
+        self.stats.set_active(kept)
+        return n - kept
+
+    def living(self):
+        """Retourne les lignes des entités non détruites."""
+        return np.flatnonzero(self.alive[:self.count])
+
+    def find(self, entity_id):
+        """
+        Retrouve la ligne d'une entité (elle change à chaque compaction).
+
+        Args:
+            entity_id: Identifiant attribué par le World
+
+        Returns:
+            int: Ligne de l'entité, ou None si elle est détruite ou absente
+        """
+        rows = np.flatnonzero(self.ids[:self.count] == entity_id)
+        if len(rows) == 0 or not self.alive[rows[0]]:
+            return None
+        return int(rows[0])
+
+    def clear(self):
+        """Supprime toutes les entités."""
+        self.alive[:self.count] = False
+        self.count = 0
+        self.stats.set_active(0)
+
+    def __getitem__(self, name):
+        """Colonne d'un composant, limitée aux entités existantes."""
+        return self.columns[name][:self.count]
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def __len__(self):
+        return self.count
+
+
+class World:
+    """
+    Registre des composants et des archétypes.
+
+    Les composants sont déclarés une fois (type et forme d'une valeur),
+    puis chaque combinaison de composants obtient son archétype. Les
+    systèmes demandent les archétypes qui possèdent certains composants
+    (query) et les traitent colonne par colonne.
+
+    Exemple:
+        world = World()
+        world.component('pos', float, 2)
+        world.component('vel', float, 2)
+        world.tag('bullet')
+        bullets = world.archetype('pos', 'vel', 'bullet')
+        bullets.spawn(3, pos=(100, 100), vel=[(50, 0), (0, 50), (-50, 0)])
+        for archetype in world.query('pos', 'vel'):
+            archetype['pos'] += archetype['vel'] * dt
+    """
+
+    def __init__(self):
+        self.specs = {}       # Nom -> (dtype, forme) ou None pour une étiquette
+        self.archetypes = {}  # frozenset des noms -> Archetype
+        self._queries = {}    # Noms demandés -> archétypes (vidé à chaque nouvel archétype)
+        self._next_id = 0
+
+    def component(self, name, dtype=float, shape=()):
+        """
+        Déclare un composant.
+
+        Args:
+            name: Nom du composant
+            dtype: Type NumPy d'une valeur
+            shape: Forme d'une valeur (() pour un scalaire, 2 pour un vecteur)
+        """
+        if isinstance(shape, int):
+            shape = (shape,)
+        self.specs[name] = (np.dtype(dtype), tuple(shape))
+
+    def tag(self, name):
+        """Déclare une étiquette (composant sans donnée, pour les requêtes)."""
+        self.specs[name] = None
+
+    def archetype(self, *names, capacity=64):
+        """
+        Retourne l'archétype d'un ensemble de composants (créé au premier appel).
+
+        Args:
+            *names: Composants et étiquettes déclarés
+            capacity: Capacité initiale si l'archétype est créé
+
+        Returns:
+            Archetype
+        """
+        key = frozenset(names)
+        archetype = self.archetypes.get(key)
+        if archetype is None:
+            unknown = [name for name in names if name not in self.specs]
+            if unknown:
+                raise KeyError(f"composants non déclarés: {', '.join(unknown)}")
+            archetype = Archetype(self, key, capacity)
+            self.archetypes[key] = archetype
+            self._queries.clear()
+        return archetype
+
+    def query(self, *names):
+        """
+        Retourne les archétypes qui possèdent tous les composants demandés.
+
+        Args:
+            *names: Composants ou étiquettes requis
+
+        Returns:
+            list: Archétypes correspondants (dans l'ordre de création ;
+            liste mémorisée, à ne pas modifier)
+        """
+        archetypes = self._queries.get(names)
+        if archetypes is None:
+            required = frozenset(names)
+            archetypes = [archetype for key, archetype in self.archetypes.items() if required <= key]
+            self._queries[names] = archetypes
+        return archetypes
+
+    def next_ids(self, count):
+        """Réserve count identifiants d'entités consécutifs."""
+        first = self._next_id
+        self._next_id += count
+        return np.arange(first, first + count, dtype=np.int64)
+
+    def flush(self):
+        """Compacte tous les archétypes (retire les entités détruites)."""
+        for archetype in self.archetypes.values():
+            archetype.compact()
+
+    def clear(self):
+        """
+        Supprime toutes les entités (les archétypes restent déclarés).
+
+        Les identifiants repartent de 0 : un monde vidé se remplit de la
+        même façon qu'un monde neuf.
+        """
+        for archetype in self.archetypes.values():
+            archetype.clear()
+        self._next_id = 0
+
+    def __len__(self):
+        return sum(archetype.count for archetype in self.archetypes.values())
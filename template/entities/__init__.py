@@ -2,6 +2,10 @@
 from .entity import Entity
 from .camera import Camera
 from .particle import ParticleSystem, Particle
+from .pickup_store import PickupStore
+from .pool import PoolStats
 from .ui import Button, Text, HealthBar
+from .text_cache import TextCache, text_cache
+from .glyph_atlas import GlyphAtlas
 
-__all__ = ['Entity', 'Camera', 'ParticleSystem', 'Particle', 'Button', 'Text', 'HealthBar']
+__all__ = ['Entity', 'Camera', 'ParticleSystem', 'Particle', 'PickupStore', 'PoolStats', 'Button', 'Text', 'HealthBar', 'TextCache', 'text_cache', 'GlyphAtlas']
@@ -34,18 +34,19 @@ class Enemy(Entity):
         if self.health <= 0:
             self.destroy()
 
-    def update(self, dt, player=None):
+    def update(self, dt, player=None, flow_field=None):
         """
         Met à jour l'ennemi.
 
         Args:
             dt: Delta time
             player: Référence au joueur (optionnel)
+            flow_field: FlowField partagé vers le joueur (optionnel)
         """
         if self.behavior == 'wander':
             self._wander(dt)
         elif self.behavior == 'chase' and player:
-            self._chase(player, dt)
+            self._chase(player, dt, flow_field)
 
         # Applique le mouvement
         super().update(dt)
@@ -63,8 +64,16 @@ class Enemy(Entity):
             self.velocity.x = math.cos(math.radians(angle)) * self.speed
             self.velocity.y = math.sin(math.radians(angle)) * self.speed
 
-    def _chase(self, player, dt):
-        """Poursuit le joueur."""
+    def _chase(self, player, dt, flow_field=None):
+        """Poursuit le joueur (via le champ de flux s'il y en a un)."""
+        if flow_field:
+            # Direction précalculée pour la cellule de l'ennemi
+            direction = flow_field.sample(self.pos.x, self.pos.y)
+            if direction:
+                self.velocity.x = direction[0] * self.speed
+                self.velocity.y = direction[1] * self.speed
+                return
+
         # Direction vers le joueur
         dx = player.pos.x - self.pos.x
         dy = player.pos.y - self.pos.y
@@ -4,7 +4,18 @@ from utils.vector import Vector2D
 
 
 class Entity:
-    """Classe de base pour les entités du jeu."""
+    """
+    Classe de base pour les entités du jeu.
+
+    Les attributs sont déclarés dans __slots__ (pas de __dict__ par
+    instance). Une classe enfant qui ne déclare pas ses propres __slots__
+    retrouve un __dict__ et peut ajouter librement des attributs.
+    """
+
+    __slots__ = (
+        'pos', 'prev_pos', 'velocity', 'width', 'height', 'alive',
+        'rect', 'radius', 'sprite'
+    )
 
     def __init__(self, x, y, width=32, height=32):
         """
@@ -15,6 +26,7 @@ class Entity:
             height: Hauteur
         """
         self.pos = Vector2D(x, y)
+        self.prev_pos = Vector2D(x, y)  # Position au tick précédent (interpolation)
         self.velocity = Vector2D(0, 0)
         self.width = width
         self.height = height
@@ -36,6 +48,10 @@ class Entity:
         Args:
             dt: Delta time en secondes
         """
+        # Mémorise la position pour l'interpolation du rendu
+        self.prev_pos.x = self.pos.x
+        self.prev_pos.y = self.pos.y
+
         # Applique la vélocité
         self.pos.x += self.velocity.x * dt
         self.pos.y += self.velocity.y * dt
@@ -64,6 +80,22 @@ class Entity:
             pygame.draw.rect(screen, (255, 255, 255),
                            (draw_pos.x, draw_pos.y, self.width, self.height))
 
+    def lerp_pos(self, alpha):
+        """
+        Position interpolée entre le tick précédent et le tick courant.
+
+        Args:
+            alpha: Fraction du tick écoulée (0 = tick précédent, 1 = courant)
+
+        Returns:
+            Vector2D de la position à dessiner
+        """
+        prev = self.prev_pos
+        return Vector2D(
+            prev.x + (self.pos.x - prev.x) * alpha,
+            prev.y + (self.pos.y - prev.y) * alpha
+        )
+
     def destroy(self):
         """Détruit l'entité."""
         self.alive = False
@@ -0,0 +1,75 @@
+"""Glyphes pré-rendus pour les compteurs qui changent à chaque frame."""
+import pygame
+
+DIGITS = "0123456789"
+
+
+class GlyphAtlas:
+    """
+    Caractères d'une police rendus une fois, assemblés à chaque affichage.
+
+    Un compteur (score, vie, FPS) change presque à chaque frame : un cache
+    de chaînes complètes rate à chaque fois. L'atlas rastérise chaque
+    caractère une seule fois (chiffres et caractères des libellés) puis un
+    texte est dessiné en un seul appel à Surface.blits, glyphe par glyphe.
+
+    Les caractères absents de l'atlas sont rendus à leur première
+    apparition puis gardés. Les glyphes sont placés côte à côte selon leur
+    largeur, sans crénage : le rendu peut différer d'un pixel de celui de
+    font.render() sur la chaîne entière.
+    """
+
+    def __init__(self, font, color, characters=DIGITS, antialias=True):
+        """
+        Args:
+            font: Police pygame
+            color: Couleur du texte
+            characters: Caractères à rendre d'avance (chiffres par défaut ;
+                ajouter ceux des libellés)
+            antialias: Lissage des glyphes
+        """
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.height = font.get_height()
+        self.glyphs = {}  # Caractère -> surface
+        self.add(characters)
+
+    def add(self, characters):
+        """Rend d'avance des caractères supplémentaires."""
+        for character in characters:
+            if character not in self.glyphs:
+                self.glyphs[character] = self.font.render(character, self.antialias, self.color)
+
+    def width(self, text):
+        """Largeur en pixels d'un texte dessiné avec l'atlas."""
+        glyphs = self.glyphs
+        if any(character not in glyphs for character in text):
+            self.add(text)
+        return sum(glyphs[character].get_width() for character in text)
+
+    def draw(self, screen, text, pos):
+        """
+        Dessine un texte en un seul appel à blits.
+
+        Args:
+            screen: Surface pygame
+            text: Texte à dessiner
+            pos: Coin supérieur gauche (x, y)
+
+        Returns:
+            pygame.Rect: Zone dessinée
+        """
+        glyphs = self.glyphs
+        if any(character not in glyphs for character in text):
+            self.add(text)
+
+        x, y = pos
+        start = x
+        sequence = []
+        for character in text:
+            glyph = glyphs[character]
+            sequence.append((glyph, (x, y)))
+            x += glyph.get_width()
+        screen.blits(sequence, doreturn=False)
+        return pygame.Rect(start, y, x - start, self.height)
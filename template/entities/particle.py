@@ -1,13 +1,15 @@
 """Système de particules pour les effets visuels."""
 import pygame
-import random
-import math
+import numpy as np
 from utils.vector import Vector2D
+from .pool import PoolStats
 
 
 class Particle:
     """Particule individuelle."""
 
+    __slots__ = ('pos', 'velocity', 'color', 'size', 'lifetime', 'age', 'alive')
+
     def __init__(self, x, y, velocity, color, size, lifetime):
         """
         Args:
@@ -52,10 +54,34 @@ class Particle:
 
 
 class ParticleSystem:
-    """Système de gestion des particules."""
-
-    def __init__(self):
-        self.particles = []
+    """
+    Système de particules stocké dans des tableaux NumPy préalloués.
+
+    L'état de chaque particule (position, vélocité, couleur, taille, âge,
+    durée de vie) occupe une ligne des tableaux. Les particules vivantes
+    sont toujours regroupées dans [0, count[ : la mise à jour et
+    l'expiration sont vectorisées et les particules mortes sont retirées en
+    une seule passe de compaction. Au-delà de la capacité, les nouvelles
+    particules sont ignorées.
+    """
+
+    def __init__(self, capacity=2048, seed=None):
+        """
+        Args:
+            capacity: Nombre maximum de particules simultanées
+            seed: Graine du générateur aléatoire (None pour une graine aléatoire)
+        """
+        self.capacity = capacity
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+        self.stats = PoolStats()  # dropped = particules ignorées (capacité pleine)
+
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.size = np.zeros(capacity)
+        self.age = np.zeros(capacity)
+        self.lifetime = np.ones(capacity)
 
     def emit(self, x, y, count=10, color=(255, 255, 255), speed_range=(50, 150),
              size_range=(2, 5), lifetime_range=(0.5, 1.5), angle_range=(0, 360)):
@@ -71,37 +97,82 @@ class ParticleSystem:
             lifetime_range: Tuple (min, max) de la durée de vie
             angle_range: Tuple (min, max) de l'angle en degrés
         """
-        for _ in range(count):
-            # Angle aléatoire
-            angle = math.radians(random.uniform(*angle_range))
-            speed = random.uniform(*speed_range)
-
-            # Vélocité
-            velocity = Vector2D(
-                math.cos(angle) * speed,
-                math.sin(angle) * speed
-            )
-
-            # Propriétés
-            size = random.uniform(*size_range)
-            lifetime = random.uniform(*lifetime_range)
-
-            # Crée la particule
-            particle = Particle(x, y, velocity, color, size, lifetime)
-            self.particles.append(particle)
+        start = self.count
+        end = min(start + count, self.capacity)
+        n = end - start
+        self.stats.dropped += count - max(n, 0)
+        if n <= 0:
+            return
+        self.stats.record_acquire(hit=True, count=n)
+
+        rng = self.rng
+        angles = np.radians(rng.uniform(angle_range[0], angle_range[1], n))
+        speeds = rng.uniform(speed_range[0], speed_range[1], n)
+
+        self.pos[start:end] = (x, y)
+        self.vel[start:end, 0] = np.cos(angles) * speeds
+        self.vel[start:end, 1] = np.sin(angles) * speeds
+        self.color[start:end] = color
+        self.size[start:end] = rng.uniform(size_range[0], size_range[1], n)
+        self.age[start:end] = 0
+        self.lifetime[start:end] = rng.uniform(lifetime_range[0], lifetime_range[1], n)
+        self.count = end
 
     def update(self, dt):
         """Met à jour toutes les particules."""
-        for particle in self.particles[:]:
-            particle.update(dt)
-            if not particle.alive:
-                self.particles.remove(particle)
+        n = self.count
+        if n == 0:
+            return
+
+        self.pos[:n] += self.vel[:n] * dt
+        self.age[:n] += dt
+
+        alive = self.age[:n] < self.lifetime[:n]
+        kept = int(np.count_nonzero(alive))
+        if kept != n:
+            # Compaction en une passe : les survivantes passent au début
+            self.pos[:kept] = self.pos[:n][alive]
+            self.vel[:kept] = self.vel[:n][alive]
+            self.color[:kept] = self.color[:n][alive]
+            self.size[:kept] = self.size[:n][alive]
+            self.age[:kept] = self.age[:n][alive]
+            self.lifetime[:kept] = self.lifetime[:n][alive]
+            self.count = kept
+            self.stats.set_active(kept)
 
     def draw(self, screen, camera=None):
         """Dessine toutes les particules."""
-        for particle in self.particles:
-            particle.draw(screen, camera)
+        n = self.count
+        if n == 0:
+            return
+
+        offset_x = camera.pos.x if camera else 0
+        offset_y = camera.pos.y if camera else 0
+
+        # Alpha basé sur l'âge, calculé pour toutes les particules d'un coup
+        alphas = (255 * (1 - self.age[:n] / self.lifetime[:n])).astype(int).tolist()
+        positions = self.pos[:n].tolist()
+        colors = self.color[:n].tolist()
+        sizes = self.size[:n].tolist()
+
+        for (x, y), (r, g, b), size, alpha in zip(positions, colors, sizes, alphas):
+            surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (r, g, b, alpha), (size, size), size)
+            screen.blit(surf, (int(x - offset_x), int(y - offset_y)))
+
+    def reseed(self, seed):
+        """
+        Recrée le générateur aléatoire des particules.
+
+        Args:
+            seed: Nouvelle graine
+        """
+        self.rng = np.random.default_rng(seed)
 
     def clear(self):
         """Supprime toutes les particules."""
-        self.particles.clear()
+        self.count = 0
+        self.stats.set_active(0)
+
+    def __len__(self):
+        return self.count
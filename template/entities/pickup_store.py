@@ -0,0 +1,206 @@
+"""Stockage des objets à ramasser en tableaux NumPy."""
+import math
+import numpy as np
+import pygame
+from systems.spatial_hash import SpatialHash
+from .pool import PoolStats
+
+
+class PickupStore:
+    """
+    Conteneur d'objets à ramasser (graines, pièces, bonus...).
+
+    Les objets occupent les indices [0, count[ de tableaux contigus. Ils
+    n'ont pas de mise à jour individuelle : l'effet de flottement est
+    calculé à l'affichage à partir d'une horloge partagée (le temps de la
+    scène) et de l'instant d'apparition.
+
+    Les objets sont aussi rangés dans une grille (SpatialHash) : la collecte
+    et l'aimant ne testent que les objets des cellules proches du
+    ramasseur, quel que soit le nombre d'objets au sol. La grille suit les
+    objets déplacés par l'aimant et n'est reconstruite qu'après une
+    collecte (les indices changent à la compaction).
+    """
+
+    def __init__(self, capacity=64, bob_speed=3, bob_height=3, cell_size=64):
+        """
+        Args:
+            capacity: Nombre d'objets préalloués (agrandi au besoin)
+            bob_speed: Vitesse du flottement (radians par seconde)
+            bob_height: Amplitude du flottement en pixels
+            cell_size: Taille des cellules de la grille en pixels
+        """
+        self.bob_speed = bob_speed
+        self.bob_height = bob_height
+        self.count = 0
+        self.stats = PoolStats()
+        self.grid = SpatialHash(cell_size)
+        self._grid_valid = True
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Alloue (ou agrandit) les tableaux en conservant les objets."""
+        old = self.count
+        pos = np.zeros((capacity, 2))
+        spawn_time = np.zeros(capacity)
+
+        if old:
+            pos[:old] = self.pos[:old]
+            spawn_time[:old] = self.spawn_time[:old]
+
+        self.capacity = capacity
+        self.pos = pos
+        self.spawn_time = spawn_time
+
+    def spawn(self, x, y, time):
+        """
+        Ajoute un objet.
+
+        Args:
+            x, y: Position
+            time: Horloge de la scène au moment de l'apparition
+        """
+        index = self.count
+        grown = index >= self.capacity
+        if grown:
+            self._allocate(self.capacity * 2)
+        self.stats.record_acquire(hit=not grown)
+
+        self.pos[index] = (x, y)
+        self.spawn_time[index] = time
+        self.count = index + 1
+        if self._grid_valid:
+            self.grid.insert(index, x, y)
+
+    def query(self, x, y, radius):
+        """
+        Retourne les indices des objets à moins de radius d'un point.
+
+        Args:
+            x, y: Centre de la recherche
+            radius: Rayon de la recherche
+
+        Returns:
+            ndarray: Indices des objets, dans l'ordre croissant
+        """
+        if self.count == 0:
+            return np.zeros(0, dtype=int)
+        if not self._grid_valid:
+            self._rebuild_grid()
+
+        candidates = self.grid.query(x, y, radius)
+        if not candidates:
+            return np.zeros(0, dtype=int)
+
+        indices = np.array(sorted(candidates))
+        offset = self.pos[indices] - (x, y)
+        return indices[(offset * offset).sum(axis=1) < radius * radius]
+
+    def _rebuild_grid(self):
+        """Range tous les objets dans la grille."""
+        n = self.count
+        self.grid.clear()
+        self.grid.insert_many(range(n), self.pos[:n, 0].tolist(), self.pos[:n, 1].tolist())
+        self._grid_valid = True
+
+    def attract(self, x, y, radius, speed, dt):
+        """
+        Aimant : rapproche d'un point les objets à moins de radius.
+
+        Args:
+            x, y: Position de l'aimant (le ramasseur)
+            radius: Portée de l'aimant
+            speed: Vitesse des objets attirés en pixels par seconde
+            dt: Delta time en secondes
+
+        Returns:
+            int: Nombre d'objets attirés
+        """
+        indices = self.query(x, y, radius)
+        step = speed * dt
+        for index in indices.tolist():
+            old_x, old_y = self.pos[index].tolist()
+            dx = x - old_x
+            dy = y - old_y
+            distance = math.sqrt(dx * dx + dy * dy)
+            if distance <= step:
+                new_x, new_y = x, y
+            else:
+                new_x = old_x + dx / distance * step
+                new_y = old_y + dy / distance * step
+            self.pos[index] = (new_x, new_y)
+            self.grid.move(index, old_x, old_y, new_x, new_y)
+        return len(indices)
+
+    def collect(self, x, y, radius):
+        """
+        Retire tous les objets à moins de radius d'un point.
+
+        Args:
+            x, y: Position du ramasseur
+            radius: Distance de collecte
+
+        Returns:
+            list: Positions (x, y) des objets ramassés
+        """
+        taken = self.query(x, y, radius)
+        if len(taken) == 0:
+            return []
+
+        collected = self.pos[taken].tolist()
+        keep = np.ones(self.count, dtype=bool)
+        keep[taken] = False
+        self._compact(keep)
+        return collected
+
+    def _compact(self, keep):
+        """Regroupe les objets conservés au début des tableaux."""
+        kept = int(np.count_nonzero(keep))
+        n = self.count
+        self.pos[:kept] = self.pos[:n][keep]
+        self.spawn_time[:kept] = self.spawn_time[:n][keep]
+        self.count = kept
+        self.stats.set_active(kept)
+        self._grid_valid = False
+
+    def clear(self):
+        """Supprime tous les objets."""
+        self.count = 0
+        self.stats.set_active(0)
+        self.grid.clear()
+        self._grid_valid = True
+
+    def __len__(self):
+        return self.count
+
+    def draw(self, screen, sprite, time, camera=None):
+        """
+        Dessine les objets avec l'effet de flottement.
+
+        Args:
+            screen: Surface pygame
+            sprite: Image des objets (None pour un cercle doré)
+            time: Horloge de la scène
+            camera: Caméra optionnelle pour le scrolling
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        offset_x = camera.pos.x if camera else 0
+        offset_y = camera.pos.y if camera else 0
+        pos = self.pos[:n]
+        bob = np.sin((time - self.spawn_time[:n]) * self.bob_speed) * self.bob_height
+        xs = (pos[:, 0] - offset_x).tolist()
+        ys = (pos[:, 1] + bob - offset_y).tolist()
+
+        if sprite:
+            half_w = sprite.get_width() // 2
+            half_h = sprite.get_height() // 2
+            screen.blits([(sprite, (int(x - half_w), int(y - half_h))) for x, y in zip(xs, ys)],
+                         doreturn=False)
+        else:
+            for x, y in zip(xs, ys):
+                center = (int(x), int(y))
+                pygame.draw.circle(screen, (255, 220, 100), center, 8)
+                pygame.draw.circle(screen, (200, 160, 50), center, 8, 2)
@@ -0,0 +1,50 @@
+"""Statistiques des conteneurs à emplacements réutilisés (archétypes, graines, particules)."""
+
+
+class PoolStats:
+    """Compteurs d'utilisation d'un pool."""
+
+    def __init__(self):
+        self.hits = 0        # Objets (ou emplacements) réutilisés
+        self.misses = 0      # Allocations nécessaires (pool vide ou plein)
+        self.dropped = 0     # Demandes ignorées (capacité fixe atteinte)
+        self.active = 0      # Objets actuellement utilisés
+        self.high_water = 0  # Maximum d'objets utilisés en même temps
+
+    def record_acquire(self, hit, count=1):
+        """Enregistre la prise de count objets."""
+        if hit:
+            self.hits += count
+        else:
+            self.misses += count
+        self.active += count
+        if self.active > self.high_water:
+            self.high_water = self.active
+
+    def record_release(self, count=1):
+        """Enregistre la libération de count objets."""
+        self.active -= count
+
+    def set_active(self, active):
+        """Fixe le nombre d'objets utilisés (conteneurs compactés)."""
+        self.active = active
+        if active > self.high_water:
+            self.high_water = active
+
+    def hit_rate(self):
+        """Retourne la proportion de prises servies sans allocation (0 à 1)."""
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def as_dict(self):
+        """Retourne les compteurs sous forme de dictionnaire."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'dropped': self.dropped,
+            'active': self.active,
+            'high_water': self.high_water,
+        }
+
@@ -0,0 +1,92 @@
+"""Cache des surfaces de texte déjà rendues."""
+from collections import OrderedDict
+
+from .pool import PoolStats
+
+
+class TextCache:
+    """
+    Cache LRU des surfaces produites par font.render().
+
+    Rendre un texte rastérise chaque glyphe : pour un libellé qui ne change
+    pas d'une frame à l'autre, c'est du travail refait pour rien. Le cache
+    garde les surfaces par (police, texte, antialiasing, couleur, fond) et
+    oublie les moins récemment utilisées quand la mémoire occupée dépasse
+    max_bytes.
+
+    Une police est reconnue à son identité : il faut garder ses objets Font
+    (créés une fois) plutôt que d'en construire à chaque frame. Les
+    surfaces retournées sont partagées et ne doivent pas être modifiées.
+
+    stats compte les rendus servis par le cache (hits) et les rendus
+    effectués (misses) ; active est le nombre de surfaces gardées.
+    """
+
+    def __init__(self, max_bytes=4 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: Mémoire maximale occupée par les surfaces gardées
+        """
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.stats = PoolStats()
+        self._surfaces = OrderedDict()  # Clé -> (surface, taille en octets)
+
+    def render(self, font, text, antialias, color, background=None):
+        """
+        Équivalent de font.render(), servi par le cache quand c'est possible.
+
+        Args:
+            font: Police pygame
+            text: Texte à rendre
+            antialias: Lissage des glyphes
+            color: Couleur du texte
+            background: Couleur de fond (None pour un fond transparent)
+
+        Returns:
+            Surface pygame (partagée, à ne pas modifier)
+        """
+        key = (font, text, antialias, tuple(color),
+               None if background is None else tuple(background))
+        entry = self._surfaces.get(key)
+        if entry is not None:
+            self._surfaces.move_to_end(key)
+            self.stats.hits += 1
+            return entry[0]
+
+        self.stats.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        if size <= self.max_bytes:
+            self._surfaces[key] = (surface, size)
+            self.bytes += size
+            self._evict()
+        return surface
+
+    def _evict(self):
+        """Oublie les surfaces les moins récemment utilisées au-delà de max_bytes."""
+        while self.bytes > self.max_bytes:
+            _, (_, size) = self._surfaces.popitem(last=False)
+            self.bytes -= size
+        self.stats.set_active(len(self._surfaces))
+
+    def hit_rate(self):
+        """Retourne la proportion de rendus servis par le cache (0 à 1)."""
+        return self.stats.hit_rate()
+
+    def clear(self):
+        """Oublie toutes les surfaces (les compteurs sont conservés)."""
+        self._surfaces.clear()
+        self.bytes = 0
+        self.stats.set_active(0)
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+# Cache partagé par les composants d'interface et les scènes
+text_cache = TextCache()
@@ -1,5 +1,6 @@
 """Composants d'interface utilisateur."""
 import pygame
+from .text_cache import text_cache
 
 
 class Text:
@@ -31,7 +32,7 @@ class Text:
         if not self.visible:
             return
 
-        surface = self.font.render(str(self.text), True, self.color)
+        surface = text_cache.render(self.font, str(self.text), True, self.color)
         if self.center:
             rect = surface.get_rect(center=(self.x, self.y))
             screen.blit(surface, rect)
@@ -104,7 +105,7 @@ class Button:
         pygame.draw.rect(screen, current_color, self.rect, border_radius=self.border_radius)
 
         # Dessine le texte
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = text_cache.render(self.font, self.text, True, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -131,7 +131,7 @@ class Game:
 
     def _draw_fps(self):
         """Affiche le compteur de FPS."""
-        font = pygame.font.Font(None, 24)
+        font = self.assets.font(None, 24)
         fps = int(self.clock.get_fps())
         fps_text = font.render(f"FPS: {fps}", True, (0, 255, 0))
         self.screen.blit(fps_text, (10, 10))
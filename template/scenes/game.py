@@ -45,8 +45,8 @@ class GameScene(Scene):
         """Initialise le jeu."""
         # Crée le joueur
         self.player = Player(
-            self.game.config.window_width // 2,
-            self.game.config.window_height // 2
+            self.settings.window_width // 2,
+            self.settings.window_height // 2
         )
 
         # Système de particules
@@ -55,7 +55,7 @@ class GameScene(Scene):
         # UI
         font_medium = self.game.assets.get_font('medium')
         if not font_medium:
-            font_medium = pygame.font.Font(None, 36)
+            font_medium = self.game.assets.font(None, 36)
 
         self.score_text = Text(
             "Score: 0",
@@ -125,11 +125,11 @@ class GameScene(Scene):
         self.health_bar.draw(screen)
 
         # Instructions
-        font_small = pygame.font.Font(None, 20)
+        font_small = self.game.assets.font(None, 20)
         instructions = Text(
             "ZQSD: bouger | E: particules | ESC: menu",
-            self.game.config.window_width // 2,
-            self.game.config.window_height - 20,
+            self.settings.window_width // 2,
+            self.settings.window_height - 20,
             font_small,
             (100, 100, 100),
             center=True
@@ -141,8 +141,8 @@ class GameScene(Scene):
         grid_size = 50
         color = (30, 30, 50)
 
-        for x in range(0, self.game.config.window_width, grid_size):
-            pygame.draw.line(screen, color, (x, 0), (x, self.game.config.window_height))
+        for x in range(0, self.settings.window_width, grid_size):
+            pygame.draw.line(screen, color, (x, 0), (x, self.settings.window_height))
 
-        for y in range(0, self.game.config.window_height, grid_size):
-            pygame.draw.line(screen, color, (0, y), (self.game.config.window_width, y))
+        for y in range(0, self.settings.window_height, grid_size):
+            pygame.draw.line(screen, color, (0, y), (self.settings.window_width, y))
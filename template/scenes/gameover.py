@@ -1,5 +1,4 @@
 """Scène de game over."""
-import pygame
 from scenes.scene_manager import Scene
 from entities.ui import Button, Text
 
@@ -21,14 +20,14 @@ class GameOverScene(Scene):
         font_medium = self.game.assets.get_font('medium')
 
         if not font_large:
-            font_large = pygame.font.Font(None, 72)
+            font_large = self.game.assets.font(None, 72)
         if not font_medium:
-            font_medium = pygame.font.Font(None, 48)
+            font_medium = self.game.assets.font(None, 48)
 
         # Titre
         self.title = Text(
             "GAME OVER",
-            self.game.config.window_width // 2,
+            self.settings.window_width // 2,
             150,
             font_large,
             (255, 100, 100),
@@ -38,7 +37,7 @@ class GameOverScene(Scene):
         # Score
         self.score_text = Text(
             f"Score Final: {self.final_score}",
-            self.game.config.window_width // 2,
+            self.settings.window_width // 2,
             250,
             font_medium,
             (255, 255, 255),
@@ -48,7 +47,7 @@ class GameOverScene(Scene):
         # Boutons
         button_width = 300
         button_height = 60
-        button_x = (self.game.config.window_width - button_width) // 2
+        button_x = (self.settings.window_width - button_width) // 2
         start_y = 350
 
         self.retry_button = Button(
@@ -1,5 +1,4 @@
 """Scène du menu principal."""
-import pygame
 from scenes.scene_manager import Scene
 from entities.ui import Button, Text
 
@@ -14,14 +13,14 @@ class MenuScene(Scene):
         font_medium = self.game.assets.get_font('medium')
 
         if not font_large:
-            font_large = pygame.font.Font(None, 72)
+            font_large = self.game.assets.font(None, 72)
         if not font_medium:
-            font_medium = pygame.font.Font(None, 48)
+            font_medium = self.game.assets.font(None, 48)
 
         # Titre
         self.title = Text(
             "GAME JAM TEMPLATE",
-            self.game.config.window_width // 2,
+            self.settings.window_width // 2,
             150,
             font_large,
             (255, 255, 255),
@@ -31,7 +30,7 @@ class MenuScene(Scene):
         # Boutons
         button_width = 300
         button_height = 60
-        button_x = (self.game.config.window_width - button_width) // 2
+        button_x = (self.settings.window_width - button_width) // 2
         start_y = 280
 
         self.play_button = Button(
@@ -75,11 +74,11 @@ class MenuScene(Scene):
         self.quit_button.draw(screen)
 
         # Instructions
-        font_small = pygame.font.Font(None, 24)
+        font_small = self.game.assets.font(None, 24)
         instructions = Text(
             "Utilisez ZQSD pour bouger, ESPACE pour sauter",
-            self.game.config.window_width // 2,
-            self.game.config.window_height - 50,
+            self.settings.window_width // 2,
+            self.settings.window_height - 50,
             font_small,
             (150, 150, 150),
             center=True
@@ -11,6 +11,29 @@ class Scene:
         """
         self.game = game
 
+        # Réglages figés (lecture sans dictionnaire) ; tant que la scène est
+        # active, ils sont rafraîchis à chaque changement de la configuration
+        self.settings = game.config.snapshot()
+
+    def attach_config(self):
+        """Rafraîchit les réglages et suit la configuration (entrée dans la scène)."""
+        self.settings = self.game.config.snapshot()
+        self.game.config.subscribe(self.on_config_changed)
+
+    def detach_config(self):
+        """Cesse de suivre la configuration (sortie de la scène)."""
+        self.game.config.unsubscribe(self.on_config_changed)
+
+    def on_config_changed(self, section, key, value):
+        """
+        Appelé quand une valeur de la configuration change.
+
+        Args:
+            section, key: Valeur modifiée
+            value: Nouvelle valeur
+        """
+        self.settings = self.game.config.snapshot()
+
     def on_enter(self):
         """Appelé quand on entre dans la scène."""
         pass
@@ -46,6 +69,21 @@ class Scene:
         """
         pass
 
+    def draw_dirty(self, screen, dirty):
+        """
+        Dessine la scène en mode dirty rects.
+
+        Par défaut la scène est entièrement redessinée (affichage complet) ;
+        une scène peut ne redessiner que ce qui change et signaler ces zones
+        à dirty.
+
+        Args:
+            screen: Surface pygame
+            dirty: DirtyRects de la frame
+        """
+        self.draw(screen)
+        dirty.invalidate()
+
 
 class SceneManager:
     """Gestionnaire de scènes."""
@@ -81,11 +119,15 @@ class SceneManager:
         """Effectue le changement de scène."""
         if self.next_scene:
             if self.current_scene:
-                self.scenes[self.current_scene].on_exit()
+                scene = self.scenes[self.current_scene]
+                scene.on_exit()
+                scene.detach_config()
 
             self.current_scene = self.next_scene
             self.next_scene = None
-            self.scenes[self.current_scene].on_enter()
+            scene = self.scenes[self.current_scene]
+            scene.attach_config()
+            scene.on_enter()
 
     def handle_events(self, events):
         """Gère les événements de la scène courante."""
@@ -103,3 +145,10 @@ class SceneManager:
         """Dessine la scène courante."""
         if self.current_scene:
             self.scenes[self.current_scene].draw(screen)
+
+    def draw_dirty(self, screen, dirty):
+        """Dessine la scène courante en mode dirty rects (voir Scene.draw_dirty)."""
+        if self.current_scene:
+            self.scenes[self.current_scene].draw_dirty(screen, dirty)
+        else:
+            dirty.invalidate()
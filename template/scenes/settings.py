@@ -68,16 +68,16 @@ class SettingsScene(Scene):
         font_small = self.game.assets.get_font('small')
 
         if not font_large:
-            font_large = pygame.font.Font(None, 72)
+            font_large = self.game.assets.font(None, 72)
         if not font_medium:
-            font_medium = pygame.font.Font(None, 36)
+            font_medium = self.game.assets.font(None, 36)
         if not font_small:
-            font_small = pygame.font.Font(None, 24)
+            font_small = self.game.assets.font(None, 24)
 
         # Titre
         self.title = Text(
             "PARAMETRES",
-            self.game.config.window_width // 2,
+            self.settings.window_width // 2,
             50,
             font_large,
             (255, 255, 255),
@@ -87,14 +87,14 @@ class SettingsScene(Scene):
         # Section Audio
         self.audio_title = Text(
             "Audio",
-            self.game.config.window_width // 2,
+            self.settings.window_width // 2,
             110,
             font_medium,
             (200, 200, 255),
             center=True
         )
 
-        slider_x = self.game.config.window_width // 2 - 100
+        slider_x = self.settings.window_width // 2 - 100
         slider_width = 200
         slider_height = 20
 
@@ -128,7 +128,7 @@ class SettingsScene(Scene):
         # Section Keybindings
         self.keybind_title = Text(
             "Controles",
-            self.game.config.window_width // 2,
+            self.settings.window_width // 2,
             250,
             font_medium,
             (200, 200, 255),
@@ -151,8 +151,8 @@ class SettingsScene(Scene):
         spacing = 50
         button_width = 200
         button_height = 45
-        label_x = self.game.config.window_width // 2 - 250
-        button_x = self.game.config.window_width // 2 + 50
+        label_x = self.settings.window_width // 2 - 250
+        button_x = self.settings.window_width // 2 + 50
 
         self.action_labels = []
         self.key_buttons = {}
@@ -209,8 +209,8 @@ class SettingsScene(Scene):
 
         # Bouton retour
         self.back_button = Button(
-            (self.game.config.window_width - 250) // 2,
-            self.game.config.window_height - 100,
+            (self.settings.window_width - 250) // 2,
+            self.settings.window_height - 100,
             250, 50,
             "RETOUR", font_medium
         )
@@ -218,8 +218,8 @@ class SettingsScene(Scene):
         # Message d'attente de touche
         self.waiting_text = Text(
             "Appuyez sur une touche...",
-            self.game.config.window_width // 2,
-            self.game.config.window_height - 180,
+            self.settings.window_width // 2,
+            self.settings.window_height - 180,
             font_small,
             (255, 200, 100),
             center=True
@@ -296,7 +296,7 @@ class SettingsScene(Scene):
         self.sfx_slider.draw(screen)
 
         # Affiche les pourcentages
-        font_small = pygame.font.Font(None, 24)
+        font_small = self.game.assets.font(None, 24)
         music_percent = Text(
             f"{int(self.music_slider.value * 100)}%",
             self.music_slider.rect.x + self.music_slider.rect.width + 20,
@@ -338,11 +338,11 @@ class SettingsScene(Scene):
             self.waiting_text.draw(screen)
 
             # Instructions
-            font_small = pygame.font.Font(None, 20)
+            font_small = self.game.assets.font(None, 20)
             esc_text = Text(
                 "ESC pour annuler",
-                self.game.config.window_width // 2,
-                self.game.config.window_height - 160,
+                self.settings.window_width // 2,
+                self.settings.window_height - 160,
                 font_small,
                 (150, 150, 150),
                 center=True
@@ -375,13 +375,10 @@ class SettingsScene(Scene):
         if not hasattr(self.game.config.data, 'get'):
             return
 
-        # Crée la section keybindings si elle n'existe pas
-        if 'keybindings' not in self.game.config.data:
-            self.game.config.data['keybindings'] = {}
-
-        # Sauvegarde chaque binding
+        # Sauvegarde chaque binding (set crée la section si besoin et
+        # prévient les scènes abonnées)
         for action, key in self.game.input.bindings.items():
-            self.game.config.data['keybindings'][action] = key
+            self.game.config.set('keybindings', action, key)
 
         # Sauvegarde le fichier
         self.game.config.save()
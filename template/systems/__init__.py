@@ -1,7 +1,10 @@
 """Systèmes de gestion pour le jeu."""
-from .input_handler import InputHandler
+from .input_handler import InputHandler, ScriptedInput
 from .audio_manager import AudioManager
 from .asset_manager import AssetManager
 from .collision import CollisionSystem
+from .spatial_hash import SpatialHash
+from .flow_field import FlowField
+from .dirty_rects import DirtyRects
 
-__all__ = ['InputHandler', 'AudioManager', 'AssetManager', 'CollisionSystem']
+__all__ = ['InputHandler', 'ScriptedInput', 'AudioManager', 'AssetManager', 'CollisionSystem', 'SpatialHash', 'FlowField', 'DirtyRects']
@@ -9,6 +9,7 @@ class AssetManager:
     def __init__(self):
         self.images = {}
         self.fonts = {}
+        self._font_cache = {}  # (chemin, taille) -> Font
 
     def load_image(self, name, filepath, scale=None, convert_alpha=True):
         """
@@ -107,15 +108,38 @@ class AssetManager:
             filepath: Chemin vers le fichier .ttf (None = police système)
             size: Taille de la police
         """
-        try:
-            if filepath and os.path.exists(filepath):
-                font = pygame.font.Font(filepath, size)
-            else:
+        self.fonts[name] = self.font(filepath, size)
+
+    def font(self, filepath=None, size=24):
+        """
+        Récupère une police par chemin et taille, créée au premier appel.
+
+        Construire une pygame.font.Font relit et analyse le fichier de
+        police : les scènes appellent font() dans draw() au lieu d'en créer
+        une à chaque frame. Les mêmes arguments renvoient toujours le même
+        objet, ce qui permet au cache de texte (qui reconnaît une police à
+        son identité) de réutiliser ses rendus.
+
+        Args:
+            filepath: Chemin vers le fichier .ttf (None = police système)
+            size: Taille de la police
+
+        Returns:
+            Font pygame
+        """
+        key = (filepath, size)
+        font = self._font_cache.get(key)
+        if font is None:
+            try:
+                if filepath and os.path.exists(filepath):
+                    font = pygame.font.Font(filepath, size)
+                else:
+                    font = pygame.font.Font(None, size)
+            except Exception as e:
+                print(f"Erreur lors du chargement de la police: {e}")
                 font = pygame.font.Font(None, size)
-            self.fonts[name] = font
-        except Exception as e:
-            print(f"Erreur lors du chargement de la police: {e}")
-            self.fonts[name] = pygame.font.Font(None, size)
+            self._font_cache[key] = font
+        return font
 
     def get_font(self, name):
         """
@@ -141,3 +165,4 @@ class AssetManager:
         """Libère tous les assets."""
         self.images.clear()
         self.fonts.clear()
+        self._font_cache.clear()
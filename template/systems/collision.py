@@ -1,6 +1,12 @@
 """Système de détection de collisions."""
 import pygame
 import math
+import numpy as np
+from .spatial_hash import SpatialHash
+
+# En dessous de ce nombre de points, separate_points() compare toutes les
+# paires : la grille coûte alors plus qu'elle n'évite de comparaisons
+SEPARATION_GRID_MIN = 48
 
 
 class CollisionSystem:
@@ -71,6 +77,73 @@ class CollisionSystem:
         distance = math.sqrt(dx * dx + dy * dy)
         return distance < radius
 
+    @staticmethod
+    def segment_circle(start, end, circle_pos, radius):
+        """
+        Collision continue segment-cercle.
+
+        Teste tout le trajet d'un objet pendant un tick (de start à end) et
+        pas seulement sa position finale : un projectile rapide ne peut pas
+        traverser un cercle entre deux ticks, même à faible fréquence de
+        simulation.
+
+        Args:
+            start: Tuple (x, y) de la position au tick précédent
+            end: Tuple (x, y) de la position actuelle
+            circle_pos: Tuple (x, y) du centre du cercle
+            radius: Rayon du cercle
+
+        Returns:
+            Tuple (x, y) du point du segment le plus proche du centre si
+            collision, sinon None
+        """
+        seg_x = end[0] - start[0]
+        seg_y = end[1] - start[1]
+        length_sq = seg_x * seg_x + seg_y * seg_y
+
+        # Projection du centre sur le segment, bornée à [0, 1]
+        if length_sq > 0:
+            t = ((circle_pos[0] - start[0]) * seg_x + (circle_pos[1] - start[1]) * seg_y) / length_sq
+            t = min(max(t, 0.0), 1.0)
+        else:
+            t = 0.0
+
+        closest_x = start[0] + seg_x * t
+        closest_y = start[1] + seg_y * t
+        dx = closest_x - circle_pos[0]
+        dy = closest_y - circle_pos[1]
+        if dx * dx + dy * dy < radius * radius:
+            return (closest_x, closest_y)
+        return None
+
+    @staticmethod
+    def segments_circles(starts, ends, centers, radius):
+        """
+        Version vectorisée de segment_circle : teste n paires en une opération.
+
+        Args:
+            starts: Tableau (n, 2) des débuts de segment
+            ends: Tableau (n, 2) des fins de segment
+            centers: Tableau (n, 2) des centres des cercles (un par segment)
+            radius: Rayon commun des cercles
+
+        Returns:
+            Tuple (hits, points) : masque des paires en collision et
+            tableau (n, 2) du point de chaque segment le plus proche du centre
+        """
+        seg = ends - starts
+        length_sq = (seg * seg).sum(axis=1)
+        dot = ((centers - starts) * seg).sum(axis=1)
+
+        # Projection du centre sur le segment, bornée à [0, 1]
+        t = np.divide(dot, length_sq, out=np.zeros_like(dot), where=length_sq > 0)
+        np.clip(t, 0.0, 1.0, out=t)
+
+        points = starts + seg * t[:, None]
+        offset = points - centers
+        hits = (offset * offset).sum(axis=1) < radius * radius
+        return hits, points
+
     @staticmethod
     def check_collision_list(entity, entities, use_circle=False):
         """
@@ -153,3 +226,120 @@ class CollisionSystem:
             entity1.velocity.y += impulse * ny
             entity2.velocity.x -= impulse * nx
             entity2.velocity.y -= impulse * ny
+
+    @staticmethod
+    def separate(entities, min_distance, strength=0.5, grid=None):
+        """
+        Repousse les entités trop proches les unes des autres.
+
+        Les voisins sont trouvés via une grille de cellules de la taille de
+        min_distance : chaque entité n'est comparée qu'aux entités des
+        cellules adjacentes, avec des distances au carré (la racine n'est
+        calculée que pour les paires qui se chevauchent). Une entité
+        repoussée dans une autre cellule y est déplacée aussitôt, pour que
+        les requêtes suivantes la trouvent à sa nouvelle position.
+
+        Args:
+            entities: Liste d'entités (doivent avoir .pos)
+            min_distance: Distance minimale entre deux entités
+            strength: Fraction du chevauchement appliquée à chaque entité
+            grid: SpatialHash réutilisable (optionnel, évite une allocation)
+        """
+        if len(entities) < 2:
+            return
+
+        if grid is None:
+            grid = SpatialHash(cell_size=min_distance)
+        grid.clear()
+        # Position de chaque entité dans la grille
+        grid_xs = [entity.pos.x for entity in entities]
+        grid_ys = [entity.pos.y for entity in entities]
+        grid.insert_many(range(len(entities)), grid_xs, grid_ys)
+
+        min_distance_sq = min_distance * min_distance
+        for i, entity1 in enumerate(entities):
+            pos1 = entity1.pos
+            neighbours = grid.query(pos1.x, pos1.y, min_distance)
+            neighbours.sort()
+            for j in neighbours:
+                if j <= i:
+                    continue
+                pos2 = entities[j].pos
+                dx = pos2.x - pos1.x
+                dy = pos2.y - pos1.y
+                distance_sq = dx * dx + dy * dy
+
+                if 0 < distance_sq < min_distance_sq:
+                    distance = math.sqrt(distance_sq)
+                    push = (min_distance - distance) * strength / distance
+                    pos1.x -= dx * push
+                    pos1.y -= dy * push
+                    pos2.x += dx * push
+                    pos2.y += dy * push
+                    grid.move(i, grid_xs[i], grid_ys[i], pos1.x, pos1.y)
+                    grid.move(j, grid_xs[j], grid_ys[j], pos2.x, pos2.y)
+                    grid_xs[i], grid_ys[i] = pos1.x, pos1.y
+                    grid_xs[j], grid_ys[j] = pos2.x, pos2.y
+
+    @staticmethod
+    def separate_points(positions, min_distance, strength=0.5, grid=None):
+        """
+        Même traitement que separate(), sur un tableau de positions.
+
+        Avec moins de SEPARATION_GRID_MIN points, toutes les paires sont
+        comparées sans passer par la grille.
+
+        Args:
+            positions: Tableau (n, 2) modifié sur place
+            min_distance: Distance minimale entre deux points
+            strength: Fraction du chevauchement appliquée à chaque point
+            grid: SpatialHash réutilisable (optionnel, évite une allocation)
+        """
+        n = len(positions)
+        if n < 2:
+            return
+
+        # Les boucles travaillent sur des listes Python (bien plus rapides
+        # que l'accès élément par élément à un tableau NumPy)
+        xs = positions[:, 0].tolist()
+        ys = positions[:, 1].tolist()
+
+        use_grid = n >= SEPARATION_GRID_MIN
+        if use_grid:
+            if grid is None:
+                grid = SpatialHash(cell_size=min_distance)
+            grid.clear()
+            grid.insert_many(range(n), xs, ys)
+            # Position de chaque point dans la grille
+            grid_xs = list(xs)
+            grid_ys = list(ys)
+
+        min_distance_sq = min_distance * min_distance
+        for i in range(n):
+            if use_grid:
+                neighbours = grid.query(xs[i], ys[i], min_distance)
+                neighbours.sort()
+            else:
+                neighbours = range(i + 1, n)
+            for j in neighbours:
+                if j <= i:
+                    continue
+                dx = xs[j] - xs[i]
+                dy = ys[j] - ys[i]
+                distance_sq = dx * dx + dy * dy
+
+                if 0 < distance_sq < min_distance_sq:
+                    distance = math.sqrt(distance_sq)
+                    push = (min_distance - distance) * strength / distance
+                    xs[i] -= dx * push
+                    ys[i] -= dy * push
+                    xs[j] += dx * push
+                    ys[j] += dy * push
+                    if use_grid:
+                        grid.move(i, grid_xs[i], grid_ys[i], xs[i], ys[i])
+                        grid.move(j, grid_xs[j], grid_ys[j], xs[j], ys[j])
+                        grid_xs[i], grid_ys[i] = xs[i], ys[i]
+                        grid_xs[j], grid_ys[j] = xs[j], ys[j]
+
+        positions[:, 0] = xs
+        positions[:, 1] = ys
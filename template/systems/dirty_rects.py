@@ -0,0 +1,78 @@
+"""Rendu par rectangles modifiés (dirty rects)."""
+import pygame
+
+
+class DirtyRects:
+    """
+    Ne recopie à l'écran que les zones qui changent d'une frame à l'autre.
+
+    À chaque frame, la scène efface les zones dessinées à la frame
+    précédente en y recopiant son fond (restore), dessine ses éléments et
+    signale leurs rectangles (add). present() envoie à l'écran les zones
+    effacées et les zones dessinées, avec pygame.display.update(rects).
+
+    Quand les zones modifiées couvrent trop de l'écran, ou quand la scène
+    a tout redessiné (invalidate), la frame est affichée entière avec
+    pygame.display.flip() et la frame suivante restaure tout le fond.
+    """
+
+    def __init__(self, size, max_coverage=0.4):
+        """
+        Args:
+            size: Taille de l'écran (largeur, hauteur)
+            max_coverage: Part de l'écran au-delà de laquelle la frame est
+                affichée entière
+        """
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self.max_area = size[0] * size[1] * max_coverage
+        self.previous = []  # Zones dessinées à la frame précédente
+        self.current = []   # Zones dessinées à cette frame
+        self.full_redraw = False   # Cette frame a été entièrement redessinée
+        self.restore_all = True    # La frame précédente l'a été (ou aucune)
+
+        # Statistiques : frames partielles / entières
+        self.partial_frames = 0
+        self.full_frames = 0
+
+    def add(self, rect):
+        """Signale une zone dessinée pendant cette frame."""
+        self.current.append(rect)
+
+    def add_many(self, rects):
+        """Signale plusieurs zones dessinées pendant cette frame."""
+        self.current.extend(rects)
+
+    def invalidate(self):
+        """Signale que toute la frame a été redessinée."""
+        self.full_redraw = True
+
+    def restore(self, screen, background):
+        """
+        Efface les éléments de la frame précédente.
+
+        Args:
+            screen: Surface de l'écran
+            background: Fond de la scène (même taille que l'écran)
+        """
+        if self.restore_all:
+            screen.blit(background, (0, 0))
+        elif self.previous:
+            screen.blits([(background, rect, rect) for rect in self.previous], doreturn=False)
+
+    def present(self):
+        """Affiche la frame : zones modifiées ou écran entier."""
+        screen_rect = self.screen_rect
+        rects = [screen_rect.clip(rect) for rect in self.previous + self.current]
+        area = sum(rect.width * rect.height for rect in rects)
+
+        if self.full_redraw or area > self.max_area:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(rects)
+            self.partial_frames += 1
+
+        self.restore_all = self.full_redraw
+        self.full_redraw = False
+        self.previous = self.current
+        self.current = []
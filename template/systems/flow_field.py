@@ -0,0 +1,250 @@
+"""Champ de flux pour guider de nombreux ennemis vers une cible."""
+import heapq
+import math
+import numpy as np
+
+
+# Voisins (dx, dy, coût) : 4 directions droites puis 4 diagonales
+NEIGHBOURS = (
+    (1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+    (1, 1, math.sqrt(2)), (1, -1, math.sqrt(2)),
+    (-1, 1, math.sqrt(2)), (-1, -1, math.sqrt(2)),
+)
+
+
+class FlowField:
+    """
+    Grille de directions vers une cible, partagée par tous les poursuivants.
+
+    La distance de chaque cellule à la cellule de la cible est calculée une
+    seule fois (Dijkstra sur la grille, en contournant les cellules
+    bloquées), puis chaque cellule retient la direction vers son voisin le
+    plus proche de la cible. Un ennemi n'a plus qu'à lire la direction de
+    sa cellule : le coût par ennemi est constant, quel que soit le nombre
+    d'obstacles. Le champ n'est recalculé que lorsque la cible change de
+    cellule ; les voisins de chaque cellule sont précalculés et ne sont
+    reconstruits que lorsque les obstacles changent.
+
+    Chaque recalcul coûte un Dijkstra sur toute la grille : le champ ne
+    devient rentable qu'avec de nombreux poursuivants. Pour quelques
+    ennemis, viser la cible directement reste moins cher.
+    """
+
+    def __init__(self, width, height, cell_size=40):
+        """
+        Args:
+            width, height: Taille de la zone couverte en pixels
+            cell_size: Taille d'une cellule en pixels
+        """
+        self.cell_size = cell_size
+        self.cols = max(1, math.ceil(width / cell_size))
+        self.rows = max(1, math.ceil(height / cell_size))
+
+        size = self.cols * self.rows
+        self.blocked = [False] * size
+        self.distances = [math.inf] * size
+
+        # Direction unitaire de chaque cellule (valide si _has_direction)
+        self._direction_array = np.zeros((size, 2))
+        self._has_direction = np.zeros(size, dtype=bool)
+
+        # Voisins franchissables (reconstruits quand les obstacles changent)
+        self._paths = None     # Par cellule : [(voisin, coût)]
+
+        # Tous les voisins de chaque cellule, dans l'ordre de NEIGHBOURS,
+        # complétés par une cellule fictive d'indice size (distance infinie)
+        self._around_index = np.full((size, len(NEIGHBOURS)), size)
+        self._around_direction = np.zeros((size, len(NEIGHBOURS), 2))
+        for row in range(self.rows):
+            for col in range(self.cols):
+                cell = row * self.cols + col
+                slot = 0
+                for dx, dy, cost in NEIGHBOURS:
+                    n_col = col + dx
+                    n_row = row + dy
+                    if 0 <= n_col < self.cols and 0 <= n_row < self.rows:
+                        self._around_index[cell, slot] = n_row * self.cols + n_col
+                        self._around_direction[cell, slot] = (dx / cost, dy / cost)
+                        slot += 1
+
+        self.target_cell = None
+        self.recomputes = 0  # Nombre de recalculs (pour le profiling)
+
+    def cell_at(self, x, y):
+        """Retourne (col, row) de la cellule contenant un point (bornée à la grille)."""
+        col = min(max(int(x // self.cell_size), 0), self.cols - 1)
+        row = min(max(int(y // self.cell_size), 0), self.rows - 1)
+        return col, row
+
+    def block_circle(self, x, y, radius):
+        """
+        Marque comme bloquées les cellules touchées par un cercle.
+
+        Args:
+            x, y: Centre de l'obstacle
+            radius: Rayon de l'obstacle
+        """
+        size = self.cell_size
+        min_col, min_row = self.cell_at(x - radius, y - radius)
+        max_col, max_row = self.cell_at(x + radius, y + radius)
+
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                # Point de la cellule le plus proche du centre
+                closest_x = min(max(x, col * size), (col + 1) * size)
+                closest_y = min(max(y, row * size), (row + 1) * size)
+                dx = closest_x - x
+                dy = closest_y - y
+                if dx * dx + dy * dy < radius * radius:
+                    self.blocked[row * self.cols + col] = True
+
+        self._invalidate()
+
+    def clear_obstacles(self):
+        """Débloque toutes les cellules."""
+        self.blocked = [False] * (self.cols * self.rows)
+        self._invalidate()
+
+    def _invalidate(self):
+        """Force la reconstruction des voisins et le recalcul du champ."""
+        self._paths = None
+        self.target_cell = None
+
+    def _build_neighbours(self):
+        """Précalcule les voisins franchissables de chaque cellule."""
+        cols = self.cols
+        rows = self.rows
+        blocked = self.blocked
+        paths = []
+
+        for row in range(rows):
+            for col in range(cols):
+                cell_paths = []
+                for dx, dy, cost in NEIGHBOURS:
+                    n_col = col + dx
+                    n_row = row + dy
+                    if not (0 <= n_col < cols and 0 <= n_row < rows):
+                        continue
+                    index = n_row * cols + n_col
+
+                    if blocked[index]:
+                        continue
+                    # Pas de diagonale qui coupe le coin d'un obstacle
+                    if dx and dy and (blocked[row * cols + n_col] or blocked[n_row * cols + col]):
+                        continue
+                    cell_paths.append((index, cost))
+
+                paths.append(cell_paths)
+
+        self._paths = paths
+
+    def update(self, target_x, target_y):
+        """
+        Recalcule le champ si la cible a changé de cellule ou si les
+        obstacles ont changé depuis le dernier calcul.
+
+        Args:
+            target_x, target_y: Position de la cible
+
+        Returns:
+            bool: True si le champ a été recalculé
+        """
+        cell = self.cell_at(target_x, target_y)
+        if cell == self.target_cell:
+            return False
+
+        self.target_cell = cell
+        if self._paths is None:
+            self._build_neighbours()
+        self._compute_distances(cell)
+        self._compute_directions()
+        self.recomputes += 1
+        return True
+
+    def _compute_distances(self, target_cell):
+        """Dijkstra depuis la cellule cible (les cellules bloquées ne sont pas traversées)."""
+        paths = self._paths
+        distances = [math.inf] * (self.cols * self.rows)
+
+        start = target_cell[1] * self.cols + target_cell[0]
+        distances[start] = 0.0
+        heap = [(0.0, start)]
+
+        while heap:
+            distance, index = heapq.heappop(heap)
+            if distance > distances[index]:
+                continue
+
+            for neighbour, cost in paths[index]:
+                new_distance = distance + cost
+                if new_distance < distances[neighbour]:
+                    distances[neighbour] = new_distance
+                    heapq.heappush(heap, (new_distance, neighbour))
+
+        self.distances = distances
+
+    def _compute_directions(self):
+        """Chaque cellule pointe vers son voisin le plus proche de la cible."""
+        distances = np.append(self.distances, math.inf)
+        around = distances[self._around_index]
+
+        # Premier voisin le plus proche, retenu s'il est plus proche que la
+        # cellule elle-même ; les cellules bloquées (distance infinie)
+        # prennent ainsi n'importe quel voisin atteignable pour en sortir
+        best = around.argmin(axis=1)
+        cells = np.arange(len(best))
+        has_direction = around[cells, best] < distances[:-1]
+
+        self._direction_array = np.where(
+            has_direction[:, None], self._around_direction[cells, best], 0.0)
+        self._has_direction = has_direction
+
+    def sample(self, x, y):
+        """
+        Direction à suivre depuis un point.
+
+        Args:
+            x, y: Position du poursuivant
+
+        Returns:
+            Tuple (dx, dy) unitaire, ou None si le poursuivant est à côté de
+            la cible (il peut alors viser directement) ou si elle est
+            inatteignable
+        """
+        if self.target_cell is None:
+            return None
+
+        col, row = self.cell_at(x, y)
+        target_col, target_row = self.target_cell
+        if abs(col - target_col) <= 1 and abs(row - target_row) <= 1:
+            return None
+        index = row * self.cols + col
+        if not self._has_direction[index]:
+            return None
+        return tuple(self._direction_array[index].tolist())
+
+    def sample_many(self, positions):
+        """
+        Version vectorisée de sample() pour de nombreux poursuivants.
+
+        Args:
+            positions: Tableau (n, 2) des positions
+
+        Returns:
+            Tuple (directions, found) : tableau (n, 2) des directions et
+            masque des poursuivants pour lesquels sample() aurait retourné
+            une direction (la direction des autres n'a pas de sens)
+        """
+        n = len(positions)
+        if self.target_cell is None or n == 0:
+            return np.zeros((n, 2)), np.zeros(n, dtype=bool)
+
+        cells = (positions // self.cell_size).astype(int)
+        cols = np.minimum(np.maximum(cells[:, 0], 0), self.cols - 1)
+        rows = np.minimum(np.maximum(cells[:, 1], 0), self.rows - 1)
+        indices = rows * self.cols + cols
+
+        target_col, target_row = self.target_cell
+        near = (np.abs(cols - target_col) <= 1) & (np.abs(rows - target_row) <= 1)
+        found = self._has_direction[indices] & ~near
+        return self._direction_array[indices], found
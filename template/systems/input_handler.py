@@ -27,18 +27,21 @@ class InputHandler:
             'pause': pygame.K_ESCAPE
         }
 
-    def update(self, events):
+    def update(self, events, reset=True):
         """
         Met à jour l'état des entrées.
 
         Args:
             events: Liste des événements pygame
+            reset: Si False, conserve les états "just pressed/released"
+                précédents (quand aucune mise à jour ne les a encore lus)
         """
         # Reset des états "just pressed/released"
-        self.keys_just_pressed.clear()
-        self.keys_just_released.clear()
-        self.mouse_buttons_just_pressed = {k: False for k in self.mouse_buttons_just_pressed}
-        self.mouse_buttons_just_released = {k: False for k in self.mouse_buttons_just_released}
+        if reset:
+            self.keys_just_pressed.clear()
+            self.keys_just_released.clear()
+            self.mouse_buttons_just_pressed = {k: False for k in self.mouse_buttons_just_pressed}
+            self.mouse_buttons_just_released = {k: False for k in self.mouse_buttons_just_released}
 
         # Traite les événements
         for event in events:
@@ -105,3 +108,33 @@ class InputHandler:
         if self.is_action_pressed(positive_action):
             value += 1
         return value
+
+
+class ScriptedInput(InputHandler):
+    """
+    Source d'entrées synthétique (mode headless, bots, tests).
+
+    Remplace la souris réelle par une fonction appelée à chaque mise à jour
+    avec le numéro de tick, qui retourne la position (x, y) à viser.
+    """
+
+    def __init__(self, script):
+        """
+        Args:
+            script: Fonction script(tick) -> (x, y)
+        """
+        super().__init__()
+        self.script = script
+        self.tick = 0
+
+    def update(self, events, reset=True):
+        """
+        Met à jour l'état des entrées depuis le script.
+
+        Args:
+            events: Liste des événements pygame (souvent vide en headless)
+            reset: Voir InputHandler.update
+        """
+        super().update(events, reset)
+        self.mouse_pos = self.script(self.tick)
+        self.tick += 1
@@ -0,0 +1,111 @@
+"""Grille de hachage spatial pour accélérer les requêtes de proximité."""
+
+
+class SpatialHash:
+    """
+    Grille uniforme reconstruite à chaque frame.
+
+    Les objets sont insérés par leur position (un seul point par objet),
+    les requêtes parcourent uniquement les cellules couvertes par le rayon
+    demandé. Le coût d'une requête dépend donc du nombre d'objets proches
+    et non du nombre total d'objets.
+    """
+
+    def __init__(self, cell_size=64):
+        """
+        Args:
+            cell_size: Taille d'une cellule en pixels (idéalement >= au
+                rayon des requêtes les plus fréquentes)
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        """Vide la grille (à appeler avant de la reconstruire)."""
+        self.cells.clear()
+
+    def insert(self, item, x, y):
+        """
+        Ajoute un objet dans la grille.
+
+        Args:
+            item: Objet à stocker
+            x, y: Position de l'objet
+        """
+        key = (int(x // self.cell_size), int(y // self.cell_size))
+        cell = self.cells.get(key)
+        if cell is None:
+            self.cells[key] = [item]
+        else:
+            cell.append(item)
+
+    def insert_many(self, items, xs, ys):
+        """
+        Ajoute plusieurs objets dans la grille.
+
+        Args:
+            items: Objets à stocker (ou indices dans un tableau)
+            xs, ys: Positions correspondantes
+        """
+        size = self.cell_size
+        cells = self.cells
+        for item, x, y in zip(items, xs, ys):
+            key = (int(x // size), int(y // size))
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [item]
+            else:
+                cell.append(item)
+
+    def move(self, item, old_x, old_y, x, y):
+        """
+        Déplace un objet déjà inséré (sans reconstruire la grille).
+
+        Args:
+            item: Objet stocké
+            old_x, old_y: Position utilisée lors de l'insertion
+            x, y: Nouvelle position
+        """
+        size = self.cell_size
+        old_key = (int(old_x // size), int(old_y // size))
+        key = (int(x // size), int(y // size))
+        if key == old_key:
+            return
+
+        cell = self.cells[old_key]
+        cell.remove(item)
+        if not cell:
+            del self.cells[old_key]
+        self.insert(item, x, y)
+
+    def query(self, x, y, radius):
+        """
+        Retourne les objets des cellules couvertes par un cercle.
+
+        Le résultat est un sur-ensemble : il faut encore tester la distance
+        exacte sur chaque candidat.
+
+        Args:
+            x, y: Centre de la requête
+            radius: Rayon de la requête
+
+        Returns:
+            list: Objets candidats
+        """
+        size = self.cell_size
+        min_cx = int((x - radius) // size)
+        max_cx = int((x + radius) // size)
+        min_cy = int((y - radius) // size)
+        max_cy = int((y + radius) // size)
+
+        cells = self.cells
+        result = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    result.extend(cell)
+        return result
+
+    def __len__(self):
+        return sum(len(cell) for cell in self.cells.values())
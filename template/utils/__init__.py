@@ -1,6 +1,10 @@
 """Utilitaires pour la game jam."""
 from .vector import Vector2D
-from .timer import Timer, Cooldown
+from .timer import Timer, Cooldown, Scheduler, TimerHandle
 from .config import Config
+from .rng import RandomStreams
 
-__all__ = ['Vector2D', 'Timer', 'Cooldown', 'Config']
+# SharedDoubleBuffer (utils.shared_buffer) n'est pas importé ici :
+# multiprocessing.shared_memory n'existe pas dans la version web (pygbag)
+
+__all__ = ['Vector2D', 'Timer', 'Cooldown', 'Scheduler', 'TimerHandle', 'Config', 'RandomStreams']
@@ -1,6 +1,7 @@
 """Configuration du jeu."""
 import json
 import os
+from collections import namedtuple
 
 
 class Config:
@@ -21,12 +22,18 @@ class Config:
         'debug': {
             'show_fps': False,
             'show_hitboxes': False
+        },
+        'simulation': {
+            'tick_rate': 60,
+            'max_catchup_steps': 5
         }
     }
 
     def __init__(self, config_file='config.json'):
         self.config_file = config_file
         self.data = self.DEFAULTS.copy()
+        self._snapshot = None   # Instantané figé (reconstruit après un changement)
+        self._listeners = []    # Fonctions appelées à chaque changement de valeur
         self.load()
 
     def load(self):
@@ -36,6 +43,7 @@ class Config:
                 with open(self.config_file, 'r') as f:
                     loaded_data = json.load(f)
                     self._merge_config(loaded_data)
+                    self._snapshot = None
             except Exception as e:
                 print(f"Erreur lors du chargement de la config: {e}")
                 print("Utilisation de la config par défaut")
@@ -63,10 +71,60 @@ class Config:
         return default
 
     def set(self, section, key, value):
-        """Définit une valeur de configuration."""
+        """
+        Définit une valeur de configuration.
+
+        Les abonnés (voir subscribe) sont prévenus si la valeur change.
+        """
         if section not in self.data:
             self.data[section] = {}
+        if key in self.data[section] and self.data[section][key] == value:
+            return
         self.data[section][key] = value
+        self._snapshot = None
+
+        for callback in list(self._listeners):
+            callback(section, key, value)
+
+    def subscribe(self, callback):
+        """
+        Abonne une fonction aux changements de valeur.
+
+        Args:
+            callback: Fonction callback(section, key, value)
+        """
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        """Désabonne une fonction passée à subscribe()."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def snapshot(self):
+        """
+        Instantané figé et aplati de la configuration.
+
+        Chaque valeur devient un attribut nommé section_clé
+        (window_width, simulation_tick_rate, game_xp_magnet_range...) : la
+        lecture ne fait aucune recherche dans les dictionnaires, ce qui
+        convient aux boucles chaudes. L'instantané ne suit pas les
+        changements : il faut en redemander un (les scènes le font à chaque
+        notification, voir subscribe). Tant que rien ne change, le même
+        instantané est retourné.
+
+        Returns:
+            namedtuple: Valeurs de la configuration
+        """
+        if self._snapshot is None:
+            values = {
+                f"{section}_{key}": value
+                for section, entries in self.data.items()
+                if isinstance(entries, dict)
+                for key, value in entries.items()
+            }
+            settings = namedtuple('Settings', values, rename=True)
+            self._snapshot = settings(*values.values())
+        return self._snapshot
 
     @property
     def window_width(self):
@@ -84,6 +142,14 @@ class Config:
     def fps(self):
         return self.data['window']['fps']
 
+    @property
+    def tick_rate(self):
+        return self.data['simulation']['tick_rate']
+
+    @property
+    def max_catchup_steps(self):
+        return self.data['simulation']['max_catchup_steps']
+
     @property
     def music_volume(self):
         return self.data['audio']['music_volume']
@@ -0,0 +1,69 @@
+"""Flux aléatoires reproductibles, un par sous-système."""
+import random
+
+
+class RandomStreams:
+    """
+    Générateurs aléatoires indépendants dérivés d'une seule graine.
+
+    Chaque sous-système (apparition des ennemis, combat, butin, effets
+    visuels...) tire ses nombres dans son propre random.Random. Les flux
+    ne se consomment pas entre eux : ajouter des particules ne change pas
+    les tirs des ennemis. Avec la même graine et les mêmes entrées, une
+    partie se rejoue à l'identique.
+
+    Exemple:
+        rng = RandomStreams(42)
+        angle = rng.stream('combat').uniform(0, 360)
+    """
+
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed: Graine de la partie (None pour une graine aléatoire)
+        """
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """
+        Change la graine et recrée tous les flux.
+
+        Args:
+            seed: Nouvelle graine (None pour une graine aléatoire)
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self._streams = {}
+
+    def stream(self, name):
+        """
+        Retourne le flux d'un sous-système (créé au premier appel).
+
+        La graine du flux ne dépend que de la graine globale et du nom,
+        pas de l'ordre dans lequel les flux sont demandés.
+
+        Args:
+            name: Nom du sous-système ('spawning', 'combat', 'loot', ...)
+
+        Returns:
+            random.Random
+        """
+        generator = self._streams.get(name)
+        if generator is None:
+            # Une graine str est hachée (SHA-512) : stable entre les exécutions
+            generator = random.Random(f"{self.seed}/{name}")
+            self._streams[name] = generator
+        return generator
+
+    def derive_seed(self, name):
+        """
+        Tire une nouvelle graine dans un flux (pour créer des sous-flux).
+
+        Args:
+            name: Nom du flux utilisé
+
+        Returns:
+            int: Graine sur 64 bits
+        """
+        return self.stream(name).getrandbits(64)
@@ -0,0 +1,173 @@
+"""Double tampon de tableaux NumPy en mémoire partagée entre deux processus."""
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class SharedDoubleBuffer:
+    """
+    Publie des tableaux NumPy d'un processus à un autre, sans verrou.
+
+    Le bloc de mémoire partagée contient deux exemplaires (tampons) de
+    chaque champ. L'écrivain remplit le tampon arrière puis le publie en
+    basculant l'indice du tampon avant : le lecteur copie toujours un état
+    complet, jamais un état à moitié écrit. Chaque tampon a un compteur de
+    séquence, impair pendant l'écriture ; si le compteur change pendant la
+    copie (l'écrivain a publié deux fois entre-temps), le lecteur
+    recommence.
+
+    Un seul écrivain et un seul lecteur par bloc. Chaque champ a une
+    capacité fixe (nombre de lignes) ; une publication indique le nombre de
+    lignes valides et les lignes au-delà de la capacité sont ignorées
+    (comptées dans dropped, côté écrivain).
+
+    Exemple:
+        layout = {'pos': (float, 2, 1000), 'score': (int, (), 1)}
+        writer = SharedDoubleBuffer(layout)
+        reader = SharedDoubleBuffer(layout, name=writer.name)
+        writer.publish({'pos': positions, 'score': [42]})
+        frame, data = reader.read()
+    """
+
+    def __init__(self, layout, name=None):
+        """
+        Args:
+            layout: Dictionnaire nom -> (dtype, forme d'une ligne, capacité)
+            name: Nom d'un bloc existant à ouvrir (None pour en créer un)
+        """
+        self.layout = {}
+        for field, (dtype, shape, capacity) in layout.items():
+            if isinstance(shape, int):
+                shape = (shape,)
+            self.layout[field] = (np.dtype(dtype), tuple(shape), capacity)
+
+        # En-tête : tampon avant, numéro de la dernière publication, puis
+        # par tampon : séquence, numéro de publication, lignes par champ
+        fields = len(self.layout)
+        self._slot_size = 2 + fields
+        header_size = (2 + 2 * self._slot_size) * 8
+
+        offsets = []
+        size = header_size
+        for _ in range(2):
+            slot = {}
+            for field, (dtype, shape, capacity) in self.layout.items():
+                slot[field] = size
+                size += _align(dtype.itemsize * capacity * int(np.prod(shape)))
+            offsets.append(slot)
+
+        self.dropped = 0  # Lignes ignorées par publish() (capacité dépassée)
+
+        self.owner = name is None
+        if self.owner:
+            self._memory = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self._memory = shared_memory.SharedMemory(name=name)
+        self.name = self._memory.name
+
+        buffer = self._memory.buf
+        self._header = np.ndarray(2 + 2 * self._slot_size, dtype=np.int64, buffer=buffer)
+        if self.owner:
+            self._header[:] = 0
+        self._slots = [
+            {
+                field: np.ndarray((capacity,) + shape, dtype=dtype, buffer=buffer,
+                                  offset=slot[field])
+                for field, (dtype, shape, capacity) in self.layout.items()
+            }
+            for slot in offsets
+        ]
+
+    @property
+    def frame(self):
+        """Numéro de la dernière publication (0 si rien n'a été publié)."""
+        return int(self._header[1])
+
+    def _slot_header(self, slot):
+        """Vue de l'en-tête d'un tampon : séquence, publication, lignes."""
+        start = 2 + slot * self._slot_size
+        return self._header[start:start + self._slot_size]
+
+    def publish(self, values):
+        """
+        Écrit un état complet dans le tampon arrière puis le rend visible.
+
+        Args:
+            values: Dictionnaire champ -> tableau (ou liste) de lignes ; les
+                champs absents sont publiés vides
+
+        Returns:
+            int: Nombre de lignes ignorées (au-delà de la capacité d'un champ)
+        """
+        unknown = [field for field in values if field not in self.layout]
+        if unknown:
+            raise KeyError(f"champs absents du tampon: {', '.join(unknown)}")
+
+        frame = self.frame + 1
+        slot = frame % 2
+        header = self._slot_header(slot)
+        arrays = self._slots[slot]
+
+        dropped = 0
+        header[0] += 1  # Impair : écriture en cours
+        for index, field in enumerate(self.layout):
+            value = values.get(field)
+            count = 0
+            if value is not None:
+                array = arrays[field]
+                count = min(len(value), len(array))
+                array[:count] = value[:count]
+                dropped += len(value) - count
+            header[2 + index] = count
+        header[1] = frame
+        header[0] += 1  # Pair : tampon complet
+
+        self._header[0] = slot
+        self._header[1] = frame
+
+        self.dropped += dropped
+        return dropped
+
+    def read(self):
+        """
+        Copie le dernier état publié.
+
+        Returns:
+            Tuple (frame, data) : numéro de la publication et dictionnaire
+            champ -> copie des lignes valides ; (0, None) si rien n'a encore
+            été publié
+        """
+        while True:
+            if self.frame == 0:
+                return 0, None
+            slot = int(self._header[0])
+            header = self._slot_header(slot)
+            sequence = int(header[0])
+            if sequence % 2:
+                continue  # L'écrivain est en train de remplir ce tampon
+
+            frame = int(header[1])
+            counts = header[2:].tolist()
+            data = {
+                field: array[:count].copy()
+                for (field, array), count in zip(self._slots[slot].items(), counts)
+            }
+            if int(header[0]) == sequence:
+                return frame, data
+
+    def close(self):
+        """Détache le bloc (et le détruit si ce processus l'a créé)."""
+        if self._memory is None:
+            return
+        # Les vues NumPy doivent disparaître avant de fermer le bloc
+        self._header = None
+        self._slots = None
+        self._memory.close()
+        if self.owner:
+            self._memory.unlink()
+        self._memory = None
+
+
+def _align(size, alignment=8):
+    """Arrondit une taille au multiple de alignment supérieur."""
+    return (size + alignment - 1) // alignment * alignment
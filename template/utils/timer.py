@@ -1,4 +1,5 @@
 """Système de timers et cooldowns."""
+import heapq
 
 
 class Timer:
@@ -81,3 +82,106 @@ class Cooldown:
     def reset(self):
         """Remet le cooldown à zéro (prêt immédiatement)."""
         self.time_remaining = 0
+
+
+class TimerHandle:
+    """Événement programmé dans un Scheduler (permet de l'annuler)."""
+
+    __slots__ = ('time', 'interval', 'callback', 'args', 'cancelled')
+
+    def __init__(self, time, interval, callback, args):
+        self.time = time          # Instant du prochain déclenchement
+        self.interval = interval  # Période de répétition (None = une seule fois)
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """Annule l'événement (il ne se déclenchera plus)."""
+        self.cancelled = True
+
+
+class Scheduler:
+    """
+    Planificateur central d'événements, basé sur un tas binaire.
+
+    Au lieu que chaque entité incrémente son propre timer à chaque frame,
+    les événements sont rangés par instant de déclenchement : update() ne
+    traite que ceux qui arrivent à échéance. Le coût par frame dépend du
+    nombre d'événements déclenchés, pas du nombre d'entités.
+
+    Les événements répétés repartent de l'instant où ils ont été traités
+    (comme un timer remis à zéro), et un événement ne se déclenche qu'une
+    fois par update() même si dt couvre plusieurs périodes. Les événements
+    simultanés se déclenchent dans l'ordre où ils ont été programmés.
+
+    Exemple:
+        scheduler = Scheduler()
+        handle = scheduler.schedule(2.0, enemy_fire, enemy, interval=2.0)
+        ...
+        scheduler.update(dt)   # Appelle enemy_fire(enemy) toutes les 2 s
+        handle.cancel()
+    """
+
+    def __init__(self):
+        self.time = 0.0
+        self._heap = []
+        self._sequence = 0  # Départage les événements programmés au même instant
+
+    def schedule(self, delay, callback, *args, interval=None):
+        """
+        Programme un appel.
+
+        Args:
+            delay: Délai avant le premier appel en secondes
+            callback: Fonction à appeler
+            *args: Arguments passés à callback
+            interval: Période de répétition en secondes (None = une fois)
+
+        Returns:
+            TimerHandle: Permet d'annuler l'événement
+        """
+        handle = TimerHandle(self.time + delay, interval, callback, args)
+        self._push(handle)
+        return handle
+
+    def _push(self, handle):
+        """Range un événement dans le tas."""
+        heapq.heappush(self._heap, (handle.time, self._sequence, handle))
+        self._sequence += 1
+
+    def update(self, dt):
+        """
+        Avance le temps et déclenche les événements arrivés à échéance.
+
+        Args:
+            dt: Delta time en secondes
+
+        Returns:
+            int: Nombre d'événements déclenchés
+        """
+        self.time += dt
+        heap = self._heap
+        fired = 0
+
+        while heap and heap[0][0] <= self.time:
+            handle = heapq.heappop(heap)[2]
+            if handle.cancelled:
+                continue  # Suppression paresseuse des événements annulés
+            if handle.interval is not None:
+                handle.time = self.time + handle.interval
+                self._push(handle)
+            handle.callback(*handle.args)
+            fired += 1
+
+        return fired
+
+    def clear(self):
+        """Annule tous les événements et remet l'horloge à zéro."""
+        for _, _, handle in self._heap:
+            handle.cancelled = True
+        self._heap.clear()
+        self.time = 0.0
+
+    def __len__(self):
+        return len(self._heap)
@@ -5,6 +5,9 @@ import math
 class Vector2D:
     """Vecteur 2D avec opérations mathématiques de base."""
 
+    # Pas de __dict__ par instance : moins de mémoire, accès plus rapide
+    __slots__ = ('x', 'y')
+
     def __init__(self, x=0, y=0):
         self.x = x
         self.y = y